@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
+from src.constants import DEFAULT_PATH_CONFIG_CACHE_DIRECTORY
+from src.lib.config_cache import config_cache
 from src.logging import init_logger
 from src.system_arguments import args_parser
 
 if __name__ == "__main__":
     sys_args = vars(args_parser.parse_args())
+    config_cache.set_cache_directory(DEFAULT_PATH_CONFIG_CACHE_DIRECTORY)
     init_logger(sys_args)
     from src.mumimo import MumimoService
 
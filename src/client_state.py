@@ -1,15 +1,18 @@
 import asyncio
 import logging
+import threading
 from enum import Enum
-from typing import TYPE_CHECKING, Optional, Dict, Union, Any
+from typing import TYPE_CHECKING, Optional, Dict, List, Set, Tuple, Union, Any
 
 from .utils import mumble_utils
 from .constants import LogOutputIdentifiers
+from .settings import settings
 
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from pymumble_py3.channels import Channel
     from pymumble_py3.mumble import Mumble
     from pymumble_py3.users import User
 
@@ -63,6 +66,9 @@ class ClientState:
         def state(self) -> Optional[AudioState]:
             return self._state
 
+        def set_connection_instance(self, mumble_instance: "Mumble") -> None:
+            self._connection = mumble_instance
+
         def mute(self) -> bool:
             if self._state is None:
                 return False
@@ -130,9 +136,214 @@ class ClientState:
     class ServerProperties:
         class ServerState:
             _users: Dict[str, "User"]
+            _channels: Dict[int, str]
+
+            # Indexes of every user and channel on the server, maintained from the pymumble callbacks.
+            _index_lock: threading.RLock
+            _is_indexed: bool
+            _sessions_by_name: Dict[str, int]
+            _names_by_session: Dict[int, str]
+            _users_by_session: Dict[int, "User"]
+            _user_channels: Dict[int, int]
+            _channel_sessions: Dict[int, Set[int]]
+            _channel_objects: Dict[int, "Channel"]
+            _channel_ids_by_name: Dict[str, List[int]]
+            _channel_parents: Dict[int, Optional[int]]
+            _channel_children: Dict[int, Set[int]]
+            _child_ids_by_name: Dict[Tuple[Optional[int], str], int]
+            _channel_list: Optional[List["Channel"]]
+
+            PATH_SEPARATOR: str = "/"
+            ROOT_CHANNEL_ID: int = 0
 
             def __init__(self) -> None:
                 self._users = {}
+                self._channels = {}
+                self._index_lock = threading.RLock()
+                self._is_indexed = False
+                self._reset_user_indexes()
+                self._reset_channel_indexes()
+
+            @property
+            def users(self) -> Dict[str, "User"]:
+                return self._users
+
+            @property
+            def channels(self) -> Dict[int, str]:
+                return self._channels
+
+            @property
+            def is_indexed(self) -> bool:
+                return self._is_indexed
+
+            def set_channels(self, channels: List["Channel"]) -> None:
+                with self._index_lock:
+                    self._reset_channel_indexes()
+                    for _channel in channels:
+                        self.index_channel(_channel)
+
+            def rebuild_indexes(self, users: List["User"], channels: List["Channel"]) -> None:
+                with self._index_lock:
+                    self._reset_user_indexes()
+                    for _user in users:
+                        self.index_user(_user)
+                    self.set_channels(channels)
+                    self._is_indexed = True
+
+            def _reset_user_indexes(self) -> None:
+                self._sessions_by_name = {}
+                self._names_by_session = {}
+                self._users_by_session = {}
+                self._user_channels = {}
+                self._channel_sessions = {}
+
+            def _reset_channel_indexes(self) -> None:
+                self._channels = {}
+                self._channel_objects = {}
+                self._channel_ids_by_name = {}
+                self._channel_parents = {}
+                self._channel_children = {}
+                self._child_ids_by_name = {}
+                self._channel_list = None
+
+            def index_user(self, user: "User") -> None:
+                with self._index_lock:
+                    _session: int = user["session"]
+                    # pymumble updates user objects in place, so a renamed user is found through the previously indexed name.
+                    _previous_name: Optional[str] = self._names_by_session.get(_session)
+                    if _previous_name is not None and self._sessions_by_name.get(_previous_name) == _session:
+                        del self._sessions_by_name[_previous_name]
+                    self._sessions_by_name[user["name"]] = _session
+                    self._names_by_session[_session] = user["name"]
+                    self._users_by_session[_session] = user
+                    self._set_user_channel(_session, user.get("channel_id", 0))
+
+            def unindex_user(self, user: "User") -> None:
+                with self._index_lock:
+                    _session: int = user["session"]
+                    _name: Optional[str] = self._names_by_session.pop(_session, None)
+                    self._users_by_session.pop(_session, None)
+                    if _name is not None and self._sessions_by_name.get(_name) == _session:
+                        del self._sessions_by_name[_name]
+                    self._set_user_channel(_session, None)
+
+            def _set_user_channel(self, session: int, channel_id: Optional[int]) -> None:
+                _previous_channel_id: Optional[int] = self._user_channels.pop(session, None)
+                if _previous_channel_id is not None:
+                    _sessions: Set[int] = self._channel_sessions.get(_previous_channel_id, set())
+                    _sessions.discard(session)
+                    if not _sessions:
+                        self._channel_sessions.pop(_previous_channel_id, None)
+                if channel_id is not None:
+                    self._user_channels[session] = channel_id
+                    self._channel_sessions.setdefault(channel_id, set()).add(session)
+
+            def index_channel(self, channel: "Channel") -> None:
+                with self._index_lock:
+                    _channel_id: int = channel["channel_id"]
+                    if _channel_id in self._channels:
+                        self._unindex_channel_id(_channel_id)
+                    _parent_id: Optional[int] = channel.get("parent")
+                    self._channels[_channel_id] = channel["name"]
+                    self._channel_objects[_channel_id] = channel
+                    self._channel_ids_by_name.setdefault(channel["name"], []).append(_channel_id)
+                    self._channel_ids_by_name[channel["name"]].sort()
+                    self._channel_parents[_channel_id] = _parent_id
+                    self._child_ids_by_name[(_parent_id, channel["name"])] = _channel_id
+                    if _parent_id is not None:
+                        self._channel_children.setdefault(_parent_id, set()).add(_channel_id)
+                    self._channel_list = None
+
+            def unindex_channel(self, channel: "Channel") -> None:
+                with self._index_lock:
+                    self._unindex_channel_id(channel["channel_id"])
+
+            def _unindex_channel_id(self, channel_id: int) -> None:
+                _name: Optional[str] = self._channels.pop(channel_id, None)
+                self._channel_objects.pop(channel_id, None)
+                self._channel_list = None
+                _parent_id: Optional[int] = self._channel_parents.pop(channel_id, None)
+                if _name is not None:
+                    _channel_ids: List[int] = self._channel_ids_by_name.get(_name, [])
+                    if channel_id in _channel_ids:
+                        _channel_ids.remove(channel_id)
+                    if not _channel_ids:
+                        self._channel_ids_by_name.pop(_name, None)
+                    if self._child_ids_by_name.get((_parent_id, _name)) == channel_id:
+                        del self._child_ids_by_name[(_parent_id, _name)]
+                if _parent_id is not None:
+                    self._channel_children.get(_parent_id, set()).discard(channel_id)
+
+            def get_user_by_name(self, name: str) -> Optional["User"]:
+                _session: Optional[int] = self._sessions_by_name.get(name)
+                if _session is None:
+                    return None
+                return self._users_by_session.get(_session)
+
+            def get_user_by_session(self, session: int) -> Optional["User"]:
+                return self._users_by_session.get(session)
+
+            def get_channel(self, channel_id: int) -> Optional["Channel"]:
+                return self._channel_objects.get(channel_id)
+
+            def get_channel_list(self) -> List["Channel"]:
+                # The list is shared between callers until the channel tree changes, so it must not be modified.
+                with self._index_lock:
+                    if self._channel_list is None:
+                        self._channel_list = [self._channel_objects[channel_id] for channel_id in sorted(self._channel_objects)]
+                    return self._channel_list
+
+            def get_channel_id_by_name(self, name: str) -> Optional[int]:
+                # Channel names are only unique among siblings, so the lowest matching id is used like pymumble's own lookup.
+                with self._index_lock:
+                    _channel_ids: List[int] = self._channel_ids_by_name.get(name, [])
+                    return _channel_ids[0] if _channel_ids else None
+
+            def get_channel_id_by_path(self, path: str) -> Optional[int]:
+                # Paths may start at the root channel ('Root/Games/CS') or directly below it ('Games/CS').
+                _names: List[str] = [name.strip() for name in path.strip().strip(self.PATH_SEPARATOR).split(self.PATH_SEPARATOR)]
+                if not _names or not all(_names):
+                    return None
+                with self._index_lock:
+                    _channel_id: Optional[int] = self._child_ids_by_name.get((None, _names[0]))
+                    if _channel_id is not None:
+                        _names = _names[1:]
+                    else:
+                        _channel_id = self.ROOT_CHANNEL_ID
+                    for _name in _names:
+                        _channel_id = self._child_ids_by_name.get((_channel_id, _name))
+                        if _channel_id is None:
+                            return None
+                    return _channel_id
+
+            def get_channel_path(self, channel_id: int) -> Optional[str]:
+                with self._index_lock:
+                    if channel_id not in self._channels:
+                        return None
+                    _names: List[str] = []
+                    _current_id: Optional[int] = channel_id
+                    while _current_id is not None and _current_id in self._channels:
+                        _names.append(self._channels[_current_id])
+                        _current_id = self._channel_parents.get(_current_id)
+                    return self.PATH_SEPARATOR.join(reversed(_names))
+
+            def get_child_channel_ids(self, parent_id: int) -> List[int]:
+                with self._index_lock:
+                    return sorted(self._channel_children.get(parent_id, set()))
+
+            def get_subtree_channel_ids(self, channel_id: int) -> List[int]:
+                with self._index_lock:
+                    if channel_id not in self._channels:
+                        return []
+                    _subtree: List[int] = [channel_id]
+                    for _current_id in _subtree:
+                        _subtree.extend(sorted(self._channel_children.get(_current_id, set())))
+                    return _subtree
+
+            def get_occupied_channel_ids(self, exclude_sessions: Optional[List[int]] = None) -> List[int]:
+                _excluded: Set[int] = set(exclude_sessions or [])
+                with self._index_lock:
+                    return sorted(channel_id for channel_id, sessions in self._channel_sessions.items() if sessions - _excluded)
 
             def add_user(self, user: Union["User", str, int]) -> bool:
                 if isinstance(user, str):
@@ -148,28 +359,19 @@ class ClientState:
 
             def remove_user(self, user: Union["User", str, int]) -> bool:
                 if isinstance(user, str):
-                    marked = None
-                    for _name, _user in self._users.items():
-                        if _name == user:
-                            marked = _name
-                    if marked:
-                        del self._users[marked]
-                        return True
+                    return self._users.pop(user, None) is not None
                 elif isinstance(user, int):
-                    marked = None
-                    for _name, _user in self._users.items():
-                        if _user["session"] == user:
-                            marked = _name
-                    if marked:
-                        del self._users[marked]
-                        return True
+                    _name: Optional[str] = self._names_by_session.get(user)
+                    if _name is None:
+                        # Users tracked before the indexes were built can only be matched by scanning.
+                        _name = next((name for name, _user in self._users.items() if _user["session"] == user), None)
+                    return _name is not None and self._users.pop(_name, None) is not None
                 else:
                     _user: "User" = user
                     if not _user:
                         return False
                     del self._users[_user["name"]]
                     return True
-                return False
 
         _state: ServerState
         _connection: Optional["Mumble"]
@@ -182,14 +384,31 @@ class ClientState:
         def state(self) -> ServerState:
             return self._state
 
+        def set_connection_instance(self, mumble_instance: "Mumble") -> None:
+            self._connection = mumble_instance
+
         def on_server_connect(self, data) -> None:
             print(data)
 
         def on_user_created(self, data: Dict[str, Any]) -> None:
-            asyncio.run(mumble_utils.Management.UserManagement.add_user(data))
-            logger.debug(f"[{LogOutputIdentifiers.MUMBLE_ON_CONNECT}]: '{data['name']}' connected: added user '{data['name']}' to the server state.")
+            self.state.index_user(data)  # type: ignore
+            _user_service = settings.database.get_user_persistence_service()
+            if _user_service is None or not _user_service.is_running:
+                asyncio.run(mumble_utils.Management.UserManagement.add_user(data))
+                logger.debug(
+                    f"[{LogOutputIdentifiers.MUMBLE_ON_CONNECT}]: '{data['name']}' connected: added user '{data['name']}' to the server state."
+                )
+                return
+            _user_service.user_joined(data)
+            logger.debug(
+                f"[{LogOutputIdentifiers.MUMBLE_ON_CONNECT}]: '{data['name']}' connected: queued user '{data['name']}' for the server state."
+            )
 
         def on_user_removed(self, data: Dict[str, Any], message: str) -> None:
+            self.state.unindex_user(data)  # type: ignore
+            _user_service = settings.database.get_user_persistence_service()
+            if _user_service is not None:
+                _user_service.user_left(data)
             if self.state.remove_user(user=data["name"]):
                 logger.debug(
                     f"[{LogOutputIdentifiers.MUMBLE_ON_DISCONNECT}]: '{data['name']}' disconnected: "
@@ -198,6 +417,20 @@ class ClientState:
                 return
             logger.error(f"Unable to remove user '{data['name']}' from the server state: {data}")
 
+        def on_user_updated(self, data: Dict[str, Any], actions: Dict[str, Any]) -> None:
+            if "name" in actions or "channel_id" in actions:
+                self.state.index_user(data)  # type: ignore
+
+        def on_channel_created(self, data: Dict[str, Any]) -> None:
+            self.state.index_channel(data)  # type: ignore
+
+        def on_channel_updated(self, data: Dict[str, Any], actions: Dict[str, Any]) -> None:
+            if "name" in actions or "parent" in actions:
+                self.state.index_channel(data)  # type: ignore
+
+        def on_channel_removed(self, data: Dict[str, Any]) -> None:
+            self.state.unindex_channel(data)  # type: ignore
+
     _audio_properties: AudioProperties
     _server_properties: ServerProperties
 
@@ -205,6 +438,11 @@ class ClientState:
         self._audio_properties = self.AudioProperties(mumble_instance)
         self._server_properties = self.ServerProperties(mumble_instance)
 
+    def set_connection_instance(self, mumble_instance: "Mumble") -> None:
+        # Used after a reconnect so the cached state is kept while pointing at the new pymumble instance.
+        self._audio_properties.set_connection_instance(mumble_instance)
+        self._server_properties.set_connection_instance(mumble_instance)
+
     @property
     def audio_properties(self) -> AudioProperties:
         return self._audio_properties
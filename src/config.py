@@ -1,11 +1,16 @@
-import copy
 import logging
+import os
 import pathlib
-from typing import Any, Dict, Optional, Union
+import stat
+import tempfile
+import types
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import toml
 
 from .exceptions import ConfigReadError, ConfigWriteError
+from .lib.config_cache import config_cache
 
 _logger = logging.getLogger(__name__)
 
@@ -13,6 +18,20 @@ _logger = logging.getLogger(__name__)
 class Config(dict):
     _config_file_path: Optional[pathlib.Path] = None
     _initial_config: Optional["Config"] = None
+    # Dotted field names mapped to the section holding the field and its key, so lookups don't walk or copy the sections.
+    _index: Optional[Dict[str, Tuple[Dict[str, Any], str]]] = None
+    _index_version: int = 0
+
+    PATH_SEPARATOR: str = "."
+
+    @property
+    def version(self) -> int:
+        # Changes made through the config's own methods bump the version, so anything derived from the config can tell it is outdated.
+        return self._index_version
+
+    @property
+    def file_path(self) -> Optional[pathlib.Path]:
+        return self._config_file_path
 
     def __init__(self, file_name: Optional[Union[str, pathlib.Path]] = None) -> None:
         super().__init__()
@@ -35,20 +54,20 @@ class Config(dict):
 
     def _read_from_file(self, file_path: pathlib.Path):
         try:
-            with open(str(file_path), "r", encoding="utf-8") as file_handler:
-                contents: Dict[str, Any] = toml.load(file_handler, _dict=dict)
-                self.clear()
-                self.update(contents)
-                self._config_file_path = file_path
-                if self._initial_config is None:
-                    self._initial_config = Config()
-                    self._initial_config._config_file_path = self._config_file_path
-                    self._initial_config.clear()
-                    self._initial_config.update(self)
+            contents: Dict[str, Any] = config_cache.load(file_path)
         except toml.TomlDecodeError as exc:
             raise ConfigReadError(f"Unable to read config file at: {file_path}.", _logger) from exc
         except IOError as exc:
             raise ConfigReadError(f"Unable to open config file to read at: {file_path}.", _logger) from exc
+        self.clear()
+        self.update(contents)
+        self._config_file_path = file_path
+        if self._initial_config is None:
+            self._initial_config = Config()
+            self._initial_config._config_file_path = self._config_file_path
+            self._initial_config.clear()
+            self._initial_config.update(self)
+        self._build_index()
 
     def save(
         self,
@@ -64,31 +83,75 @@ class Config(dict):
         else:
             raise ConfigWriteError("Unable to save data to a config file because no file was specified.", _logger)
 
+        saved_data = self.dumps(modified_only, modified_field_name)
+        if saved_data is None:
+            raise ConfigWriteError(f"Unable to save data to a config file at: {target_path}", _logger)
+        self.write_file(pathlib.Path(target_path), saved_data)
+        return saved_data
+
+    def dumps(self, modified_only: bool = False, modified_field_name: Optional[str] = None) -> str:
+        if not modified_only:
+            return toml.dumps(self)
+        if not modified_field_name:
+            raise ConfigWriteError("Unable to save modified data to a config file because the field name is invalid.", _logger)
+        field = self.get(modified_field_name, copy=True)
+        if field is None:
+            raise ConfigWriteError("Unable to save modified data to a config file because the field name does not exist.", _logger)
+        if self._initial_config is None:
+            raise ConfigWriteError("Unable to save modified data to a config file because no file has been initialized.", _logger)
+        self._initial_config.set(modified_field_name, field)
+        return toml.dumps(self._initial_config)
+
+    @staticmethod
+    def write_file(target_path: pathlib.Path, data: str) -> None:
+        # The data is written to a temporary file next to the config and renamed over it, so a failed write never leaves a truncated config.
+        _temp_path: Optional[pathlib.Path] = None
         try:
-            saved_data = None
-            with open(str(target_path), "w", encoding="utf-8") as file_handler:
-                if not modified_only:
-                    saved_data = toml.dump(self, file_handler)
-                else:
-                    if not modified_field_name:
-                        raise ConfigWriteError("Unable to save modified data to a config file because the field name is invalid.", _logger)
-                    field = self.get(modified_field_name)
-                    if field is None:
-                        raise ConfigWriteError("Unable to save modified data to a config file because the field name does not exist.", _logger)
-                    if self._initial_config is None:
-                        raise ConfigWriteError("Unable to save modified data to a config file because no file has been initialized.", _logger)
-                    self._initial_config.set(modified_field_name, field)
-                    saved_data = toml.dump(self._initial_config, file_handler)
-            if saved_data is None:
-                raise ConfigWriteError(f"Unable to save data to a config file at: {target_path}", _logger)
+            _temp_fd, _temp_name = tempfile.mkstemp(prefix=f".{target_path.name}.", suffix=".tmp", dir=str(target_path.parent))
+            _temp_path = pathlib.Path(_temp_name)
+            with os.fdopen(_temp_fd, "w", encoding="utf-8") as file_handler:
+                file_handler.write(data)
+                file_handler.flush()
+                os.fsync(file_handler.fileno())
+            if target_path.exists():
+                os.chmod(_temp_path, stat.S_IMODE(target_path.stat().st_mode))
+            os.replace(_temp_path, target_path)
+            _temp_path = None
         except IOError as exc:
             raise ConfigWriteError(f"Unable to save config file at: {target_path} | {exc}", _logger) from exc
-        return saved_data
+        finally:
+            if _temp_path is not None:
+                _temp_path.unlink(missing_ok=True)
+        # The rename is only durable once the directory entry is written, which is not supported on every platform.
+        if hasattr(os, "O_DIRECTORY"):
+            try:
+                _dir_fd = os.open(str(target_path.parent), os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                return
+            try:
+                os.fsync(_dir_fd)
+            except OSError:
+                pass
+            finally:
+                os.close(_dir_fd)
 
     def reset(self, field_name: str) -> bool:
         return self.set(field_name, None, create_keys_if_not_exists=False)
 
-    def get(self, field_name: str, fallback: Optional[Any] = None) -> Any:
+    def copy_with_overrides(self, overrides: Optional[Dict[str, Any]] = None) -> "Config":
+        # The copy shares no sections with this config, so changing or saving the copy never changes this config behind its version.
+        # Overrides are only applied to the copy's data, so saving only modified fields never writes them to the config file.
+        _config: Config = Config()
+        _config.update(deepcopy(dict(self)))
+        _config._config_file_path = self._config_file_path
+        if self._initial_config is not None:
+            _config._initial_config = self._initial_config.copy_with_overrides()
+        for _field_name, _value in (overrides or {}).items():
+            _config.set(_field_name, _value, create_keys_if_not_exists=True)
+        return _config
+
+    def get(self, field_name: str, fallback: Optional[Any] = None, copy: bool = False) -> Any:
+        # Sections are returned as read-only views and lists as tuples, use 'copy' to get a deep copy that can be modified.
         if not field_name:
             return None
         field = self._get_field(field_name)
@@ -96,17 +159,89 @@ class Config(dict):
             if fallback is not None:
                 return fallback
             return None
-        return field
+        if copy:
+            return deepcopy(field)
+        return self._get_view(field)
 
     def _get_field(self, field_name: str):
-        field_sections = field_name.split(".")
-        fields_copy = copy.deepcopy(self)
+        _index = self._index
+        if _index is None:
+            _index = self._build_index()
+        _entry = _index.get(field_name)
+        if _entry is not None:
+            _section, _key = _entry
+            try:
+                return _section[_key]
+            except KeyError:
+                pass
+        # Fields added to a nested section directly are missing from the index, so a miss falls back to walking the sections.
+        _field: Any = self
         try:
-            for key in field_sections:
-                fields_copy = fields_copy[key]
-        except KeyError:
+            for _key in field_name.split(self.PATH_SEPARATOR):
+                _field = _field[_key]
+        except (KeyError, TypeError):
             return None
-        return fields_copy
+        return _field
+
+    def _build_index(self) -> Dict[str, Tuple[Dict[str, Any], str]]:
+        _version: int = self._index_version
+        _index: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        _sections: List[Tuple[str, Dict[str, Any]]] = [("", self)]
+        while _sections:
+            _prefix, _section = _sections.pop()
+            for _key, _value in _section.items():
+                _path: str = f"{_prefix}{_key}"
+                _index[_path] = (_section, _key)
+                if isinstance(_value, dict):
+                    _sections.append((f"{_path}{self.PATH_SEPARATOR}", _value))
+        # An index built while the config was being changed is returned, but not kept.
+        if _version == self._index_version:
+            self._index = _index
+        return _index
+
+    def _invalidate_index(self) -> None:
+        # Replacing a nested section directly is not tracked, so sections must be changed through 'set' or the top level of the config.
+        self._index_version += 1
+        self._index = None
+
+    @staticmethod
+    def _get_view(field: Any) -> Any:
+        if isinstance(field, dict):
+            return types.MappingProxyType(field)
+        if isinstance(field, list):
+            return tuple(field)
+        return field
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._invalidate_index()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._invalidate_index()
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate_index()
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._invalidate_index()
+
+    def pop(self, *args) -> Any:
+        _value = super().pop(*args)
+        self._invalidate_index()
+        return _value
+
+    def popitem(self) -> Tuple[str, Any]:
+        _item = super().popitem()
+        self._invalidate_index()
+        return _item
+
+    def setdefault(self, key: str, default: Optional[Any] = None) -> Any:
+        _value = super().setdefault(key, default)
+        self._invalidate_index()
+        return _value
 
     def set(self, field_name: str, field_value: Optional[Any] = None, create_keys_if_not_exists: bool = False) -> bool:
         if not field_name:
@@ -116,8 +251,11 @@ class Config(dict):
     def _set_field(self, field_name: str, field_value: Optional[Any] = None, create_keys_if_not_exists: bool = False):
         if not create_keys_if_not_exists and self.get(field_name) is None:
             return False
-        field_sections = field_name.split(".")
+        field_sections = field_name.split(self.PATH_SEPARATOR)
+        _section: Dict[str, Any] = self
         for key in field_sections[:-1]:
-            self = self.setdefault(key, {})
-        self[field_sections[-1]] = field_value
+            _section = _section.setdefault(key, {})
+        _section[field_sections[-1]] = field_value
+        # Nested fields are set on plain dicts, which don't invalidate the index themselves.
+        self._invalidate_index()
         return True
@@ -0,0 +1,312 @@
+import dataclasses
+import logging
+from typing import Any, ClassVar, Mapping, Optional, Tuple
+
+from .constants import MumimoCfgFields
+from .exceptions import ConfigValidationError
+
+_logger = logging.getLogger(__name__)
+
+
+def _get_value(config: Mapping[str, Any], field_name: str) -> Any:
+    return config.get(field_name, None)
+
+
+def _get_bool(config: Mapping[str, Any], field_name: str, default: Optional[bool] = None) -> Optional[bool]:
+    _value = _get_value(config, field_name)
+    if _value is None:
+        return default
+    if not isinstance(_value, bool):
+        raise ConfigValidationError(f"Invalid config field '{field_name}': expected true or false, got {_value!r}.", logger=_logger)
+    return _value
+
+
+def _get_str(config: Mapping[str, Any], field_name: str, default: Optional[str] = None) -> Optional[str]:
+    _value = _get_value(config, field_name)
+    if _value is None:
+        return default
+    if not isinstance(_value, str):
+        raise ConfigValidationError(f"Invalid config field '{field_name}': expected a string, got {_value!r}.", logger=_logger)
+    return _value
+
+
+def _get_float(config: Mapping[str, Any], field_name: str) -> Optional[float]:
+    _value = _get_value(config, field_name)
+    if _value is None:
+        return None
+    if isinstance(_value, bool) or not isinstance(_value, (int, float)) or _value < 0:
+        raise ConfigValidationError(f"Invalid config field '{field_name}': expected a positive number, got {_value!r}.", logger=_logger)
+    return float(_value)
+
+
+def _get_int(config: Mapping[str, Any], field_name: str) -> Optional[int]:
+    _value = _get_value(config, field_name)
+    if _value is None:
+        return None
+    if isinstance(_value, bool) or not isinstance(_value, int) or _value < 0:
+        raise ConfigValidationError(f"Invalid config field '{field_name}': expected a positive whole number, got {_value!r}.", logger=_logger)
+    return _value
+
+
+def _get_str_list(config: Mapping[str, Any], field_name: str) -> Tuple[str, ...]:
+    # A single string is accepted where a list of strings is expected, as the config has always allowed it.
+    _value = _get_value(config, field_name)
+    if _value is None:
+        return ()
+    if isinstance(_value, str):
+        _value = [_value]
+    if not isinstance(_value, (list, tuple)) or not all(isinstance(item, str) for item in _value):
+        raise ConfigValidationError(f"Invalid config field '{field_name}': expected a list of strings, got {_value!r}.", logger=_logger)
+    return tuple(item for item in _value if item)
+
+
+@dataclasses.dataclass(frozen=True)
+class ConfigSnapshot:
+    # A typed copy of the mumimo config, validated once when it is built so the hot path reads attributes instead of config fields.
+    # Fields missing from the config are None, and the services using them fall back to their own defaults.
+    @dataclasses.dataclass(frozen=True)
+    class Commands:
+        __slots__ = ("token", "tick_rate", "max_multi_command_length", "max_command_queue_length", "command_history_length")
+        token: str
+        tick_rate: Optional[float]
+        max_multi_command_length: Optional[int]
+        max_command_queue_length: Optional[int]
+        command_history_length: Optional[int]
+
+        DEFAULT_TOKEN: ClassVar[str] = "!"
+
+        @classmethod
+        def from_config(cls, config: Mapping[str, Any]) -> "ConfigSnapshot.Commands":
+            _token: str = _get_str(config, MumimoCfgFields.SETTINGS.COMMANDS.TOKEN, cls.DEFAULT_TOKEN) or cls.DEFAULT_TOKEN
+            # Commands are recognized by their first character only.
+            if len(_token) != 1 or _token.isspace():
+                raise ConfigValidationError(
+                    f"Invalid config field '{MumimoCfgFields.SETTINGS.COMMANDS.TOKEN}': expected a single character, got {_token!r}.", logger=_logger
+                )
+            return cls(
+                token=_token,
+                tick_rate=_get_float(config, MumimoCfgFields.SETTINGS.COMMANDS.TICK_RATE),
+                max_multi_command_length=_get_int(config, MumimoCfgFields.SETTINGS.COMMANDS.MAX_MULTI_COMMAND_LENGTH),
+                max_command_queue_length=_get_int(config, MumimoCfgFields.SETTINGS.COMMANDS.MAX_COMMAND_QUEUE_LENGTH),
+                command_history_length=_get_int(config, MumimoCfgFields.SETTINGS.COMMANDS.COMMAND_HISTORY_LENGTH),
+            )
+
+    @dataclasses.dataclass(frozen=True)
+    class Connection:
+        __slots__ = (
+            "name",
+            "mute",
+            "deafen",
+            "register",
+            "comment",
+            "default_channel",
+            "auto_reconnect",
+            "loop_rate_active",
+            "loop_rate_idle",
+            "loop_rate_idle_delay",
+            "reconnect_base_delay",
+            "reconnect_max_delay",
+            "reconnect_max_attempts",
+            "text_message_max_targets",
+            "message_rate_limit",
+            "message_burst",
+            "message_queue_size",
+            "event_queue_size",
+            "event_overload_policy",
+            "listening_channel_exclusions",
+        )
+        name: Optional[str]
+        mute: Optional[bool]
+        deafen: Optional[bool]
+        register: Optional[bool]
+        comment: Optional[str]
+        default_channel: Optional[str]
+        auto_reconnect: Optional[bool]
+        loop_rate_active: Optional[float]
+        loop_rate_idle: Optional[float]
+        loop_rate_idle_delay: Optional[float]
+        reconnect_base_delay: Optional[float]
+        reconnect_max_delay: Optional[float]
+        reconnect_max_attempts: Optional[int]
+        text_message_max_targets: Optional[int]
+        message_rate_limit: Optional[float]
+        message_burst: Optional[int]
+        message_queue_size: Optional[int]
+        event_queue_size: Optional[int]
+        event_overload_policy: Optional[str]
+        listening_channel_exclusions: Tuple[str, ...]
+
+        @classmethod
+        def from_config(cls, config: Mapping[str, Any]) -> "ConfigSnapshot.Connection":
+            _fields = MumimoCfgFields.SETTINGS.CONNECTION
+            return cls(
+                name=_get_str(config, _fields.NAME),
+                mute=_get_bool(config, _fields.MUTE),
+                deafen=_get_bool(config, _fields.DEAFEN),
+                register=_get_bool(config, _fields.REGISTER),
+                comment=_get_str(config, _fields.COMMENT),
+                default_channel=_get_str(config, _fields.DEFAULT_CHANNEL),
+                auto_reconnect=_get_bool(config, _fields.AUTO_RECONNECT),
+                loop_rate_active=_get_float(config, _fields.LOOP_RATE_ACTIVE),
+                loop_rate_idle=_get_float(config, _fields.LOOP_RATE_IDLE),
+                loop_rate_idle_delay=_get_float(config, _fields.LOOP_RATE_IDLE_DELAY),
+                reconnect_base_delay=_get_float(config, _fields.RECONNECT_BASE_DELAY),
+                reconnect_max_delay=_get_float(config, _fields.RECONNECT_MAX_DELAY),
+                reconnect_max_attempts=_get_int(config, _fields.RECONNECT_MAX_ATTEMPTS),
+                text_message_max_targets=_get_int(config, _fields.TEXT_MESSAGE_MAX_TARGETS),
+                message_rate_limit=_get_float(config, _fields.MESSAGE_RATE_LIMIT),
+                message_burst=_get_int(config, _fields.MESSAGE_BURST),
+                message_queue_size=_get_int(config, _fields.MESSAGE_QUEUE_SIZE),
+                event_queue_size=_get_int(config, _fields.EVENT_QUEUE_SIZE),
+                event_overload_policy=_get_str(config, _fields.EVENT_OVERLOAD_POLICY),
+                listening_channel_exclusions=_get_str_list(config, _fields.LISTENING_CHANNEL_EXCLUSIONS),
+            )
+
+    @dataclasses.dataclass(frozen=True)
+    class Database:
+        __slots__ = (
+            "use_remote_database",
+            "local_database_path",
+            "local_database_dialect",
+            "local_database_driver",
+            "default_permission_groups",
+            "user_batch_window",
+        )
+        use_remote_database: Optional[bool]
+        local_database_path: Optional[str]
+        local_database_dialect: Optional[str]
+        local_database_driver: Optional[str]
+        default_permission_groups: Tuple[str, ...]
+        user_batch_window: Optional[float]
+
+        @classmethod
+        def from_config(cls, config: Mapping[str, Any]) -> "ConfigSnapshot.Database":
+            _fields = MumimoCfgFields.SETTINGS.DATABASE
+            return cls(
+                use_remote_database=_get_bool(config, _fields.USE_REMOTE_DB),
+                local_database_path=_get_str(config, _fields.LOCAL_DB_PATH),
+                local_database_dialect=_get_str(config, _fields.LOCAL_DB_DIALECT),
+                local_database_driver=_get_str(config, _fields.LOCAL_DB_DRIVERNAME),
+                default_permission_groups=_get_str_list(config, _fields.DEFAULT_PERMISSION_GROUPS),
+                user_batch_window=_get_float(config, _fields.USER_BATCH_WINDOW),
+            )
+
+    @dataclasses.dataclass(frozen=True)
+    class GUI:
+        __slots__ = ("enable", "themes_path", "selected_theme", "paged_output", "render_cache_size")
+        enable: Optional[bool]
+        themes_path: Optional[str]
+        selected_theme: Optional[str]
+        paged_output: bool
+        render_cache_size: Optional[int]
+
+        @classmethod
+        def from_config(cls, config: Mapping[str, Any]) -> "ConfigSnapshot.GUI":
+            _fields = MumimoCfgFields.SETTINGS.GUI
+            return cls(
+                enable=_get_bool(config, _fields.ENABLE),
+                themes_path=_get_str(config, _fields.THEMES_PATH),
+                selected_theme=_get_str(config, _fields.SELECTED_THEME),
+                paged_output=bool(_get_bool(config, _fields.PAGED_OUTPUT, False)),
+                render_cache_size=_get_int(config, _fields.RENDER_CACHE_SIZE),
+            )
+
+    @dataclasses.dataclass(frozen=True)
+    class Plugins:
+        __slots__ = ("plugins_path", "plugins_config_path", "custom_plugins_path", "disabled_plugins", "safe_mode_plugins")
+        plugins_path: Optional[str]
+        plugins_config_path: Optional[str]
+        custom_plugins_path: Optional[str]
+        disabled_plugins: Tuple[str, ...]
+        safe_mode_plugins: Tuple[str, ...]
+
+        @classmethod
+        def from_config(cls, config: Mapping[str, Any]) -> "ConfigSnapshot.Plugins":
+            _fields = MumimoCfgFields.SETTINGS.PLUGINS
+            return cls(
+                plugins_path=_get_str(config, _fields.PLUGINS_PATH),
+                plugins_config_path=_get_str(config, _fields.PLUGINS_CONFIG_PATH),
+                custom_plugins_path=_get_str(config, _fields.PLUGINS_CUSTOM_PATH),
+                disabled_plugins=_get_str_list(config, _fields.DISABLED_PLUGINS),
+                safe_mode_plugins=_get_str_list(config, _fields.SAFE_MODE_PLUGINS),
+            )
+
+    @dataclasses.dataclass(frozen=True)
+    class Media:
+        @dataclasses.dataclass(frozen=True)
+        class AudioDucking:
+            __slots__ = ("enable", "volume", "threshold", "delay")
+            enable: Optional[bool]
+            volume: Optional[float]
+            threshold: Optional[float]
+            delay: Optional[float]
+
+        @dataclasses.dataclass(frozen=True)
+        class YoutubeDL:
+            __slots__ = ("proxy_url", "cookie_file")
+            proxy_url: Optional[str]
+            cookie_file: Optional[str]
+
+        __slots__ = ("volume", "stereo_audio", "max_queue_length", "ffmpeg_path", "vlc_path", "media_directory", "audio_ducking", "youtube_dl")
+        volume: Optional[float]
+        stereo_audio: Optional[bool]
+        max_queue_length: Optional[int]
+        ffmpeg_path: Optional[str]
+        vlc_path: Optional[str]
+        media_directory: Optional[str]
+        audio_ducking: "ConfigSnapshot.Media.AudioDucking"
+        youtube_dl: "ConfigSnapshot.Media.YoutubeDL"
+
+        @classmethod
+        def from_config(cls, config: Mapping[str, Any]) -> "ConfigSnapshot.Media":
+            _fields = MumimoCfgFields.SETTINGS.MEDIA
+            return cls(
+                volume=_get_float(config, _fields.VOLUME),
+                stereo_audio=_get_bool(config, _fields.STEREO_AUDIO),
+                max_queue_length=_get_int(config, _fields.MAX_QUEUE_LENGTH),
+                ffmpeg_path=_get_str(config, _fields.FFMPEG_PATH),
+                vlc_path=_get_str(config, _fields.VLC_PATH),
+                media_directory=_get_str(config, _fields.MEDIA_DIRECTORY),
+                audio_ducking=cls.AudioDucking(
+                    enable=_get_bool(config, _fields.AUDIODUCKING.ENABLE),
+                    volume=_get_float(config, _fields.AUDIODUCKING.VOLUME),
+                    threshold=_get_float(config, _fields.AUDIODUCKING.THRESHOLD),
+                    delay=_get_float(config, _fields.AUDIODUCKING.DELAY),
+                ),
+                youtube_dl=cls.YoutubeDL(
+                    proxy_url=_get_str(config, _fields.YOUTUBEDL.PROXY_URL),
+                    cookie_file=_get_str(config, _fields.YOUTUBEDL.COOKIE_FILE),
+                ),
+            )
+
+    __slots__ = ("commands", "connection", "database", "gui", "plugins", "media", "source", "version")
+    commands: Commands
+    connection: Connection
+    database: Database
+    gui: GUI
+    plugins: Plugins
+    media: Media
+    # The config the snapshot was built from, and its version at the time, so a snapshot of an outdated config can be detected.
+    source: Mapping[str, Any]
+    version: int
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "ConfigSnapshot":
+        return cls(
+            commands=cls.Commands.from_config(config),
+            connection=cls.Connection.from_config(config),
+            database=cls.Database.from_config(config),
+            gui=cls.GUI.from_config(config),
+            plugins=cls.Plugins.from_config(config),
+            media=cls.Media.from_config(config),
+            source=config,
+            version=cls.get_config_version(config),
+        )
+
+    def is_snapshot_of(self, config: Mapping[str, Any]) -> bool:
+        return self.source is config and self.version == self.get_config_version(config)
+
+    @staticmethod
+    def get_config_version(config: Mapping[str, Any]) -> int:
+        # Plain mappings have no version, and are treated as never changing.
+        return getattr(config, "version", 0)
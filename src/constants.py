@@ -8,6 +8,12 @@ VERBOSITY_MIN: int = VERBOSE_NONE
 VERBOSITY_MAX: int = VERBOSE_MAX
 
 
+# Database Constants
+# Increment this whenever a table is added so existing databases run 'create_all' again on startup.
+# 'create_all' only creates missing tables and never alters existing ones, so column changes still need a migration.
+DATABASE_SCHEMA_VERSION: int = 1
+
+
 # Logging Output Identifier Constants
 class LogOutputIdentifiers:
     PLUGINS: str = "Plugins"
@@ -22,8 +28,11 @@ class LogOutputIdentifiers:
     DB_PLUGINS: str = f"{DB}.Plugins"
     DB_PLUGINS_COMMANDS: str = f"{DB}.{PLUGINS}.Commands"
     DB_PLUGINS_PERMISSIONS: str = f"{DB}.{PLUGINS}.Permissions"
+    DB_TRANSFER: str = f"{DB}.Transfer"
 
     MUMBLE: str = "Mumble"
+    MUMBLE_SERVERS: str = f"{MUMBLE}.Servers"
+    MUMBLE_SUPERVISOR: str = f"{MUMBLE}.Supervisor"
     MUMBLE_ON_CONNECT: str = f"{MUMBLE}.On_Connect"
     MUMBLE_ON_DISCONNECT: str = f"{MUMBLE}.On_Disconnect"
 
@@ -76,6 +85,11 @@ class SysArgs:
     SYS_DB_HOST: str = "db_host"
     SYS_DB_PORT: str = "db_port"
     SYS_DB_NAME: str = "db_name"
+    SYS_DB_EXPORT: str = "db_export"
+    SYS_DB_IMPORT: str = "db_import"
+    SYS_DB_BATCH_SIZE: str = "db_batch_size"
+    SYS_SUPERVISE: str = "supervise"
+    SYS_WORKER_SERVER: str = "worker_server"
     SYS_PLUGINS_PATH: str = "plugins_path"
     SYS_PLUGINS_CONFIG_PATH: str = "plugins_config_path"
 
@@ -84,6 +98,7 @@ class SysArgs:
 DEFAULT_PATH_CONFIG_FILE: str = "config/config.toml"
 DEFAULT_PATH_LOGGING_CONFIG_FILE: str = "config/logging.toml"
 DEFAULT_PATH_GUI_THEMES_FILE: str = "config/gui_themes.toml"
+DEFAULT_PATH_CONFIG_CACHE_DIRECTORY: str = ".config/cache/"
 
 
 class DefaultPermissionGroups:
@@ -169,6 +184,8 @@ class MumimoCfgSections:
     SETTINGS_MEDIA_YOUTUBEDL: str = f"{SETTINGS_MEDIA}.youtube_dl"
     SETTINGS_PLUGINS: str = f"{SETTINGS}.plugins"
     SETTINGS_GUI: str = f"{SETTINGS}.gui"
+    SETTINGS_SERVERS: str = f"{SETTINGS}.servers"
+    SETTINGS_RELOAD: str = f"{SETTINGS}.reload"
 
     OUTPUT: str = "output"
     OUTPUT_GUI: str = f"{OUTPUT}.gui"
@@ -187,6 +204,19 @@ class MumimoCfgFields:
             DEFAULT_CHANNEL: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.default_channel"
             AUTO_RECONNECT: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.auto_reconnect"
             NAME: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.name"
+            LOOP_RATE_ACTIVE: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.loop_rate_active"
+            LOOP_RATE_IDLE: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.loop_rate_idle"
+            LOOP_RATE_IDLE_DELAY: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.loop_rate_idle_delay"
+            TEXT_MESSAGE_MAX_TARGETS: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.text_message_max_targets"
+            MESSAGE_RATE_LIMIT: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.message_rate_limit"
+            MESSAGE_BURST: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.message_burst"
+            MESSAGE_QUEUE_SIZE: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.message_queue_size"
+            EVENT_QUEUE_SIZE: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.event_queue_size"
+            EVENT_OVERLOAD_POLICY: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.event_overload_policy"
+            LISTENING_CHANNEL_EXCLUSIONS: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.listening_channel_exclusions"
+            RECONNECT_BASE_DELAY: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.reconnect_base_delay"
+            RECONNECT_MAX_DELAY: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.reconnect_max_delay"
+            RECONNECT_MAX_ATTEMPTS: str = f"{MumimoCfgSections.SETTINGS_CONNECTION}.reconnect_max_attempts"
 
         class DATABASE:
             USE_REMOTE_DB: str = f"{MumimoCfgSections.SETTINGS_DATABASE}.use_remote_database"
@@ -195,6 +225,13 @@ class MumimoCfgFields:
             LOCAL_DB_DRIVERNAME: str = f"{MumimoCfgSections.SETTINGS_DATABASE}.local_database_driver"
             DEFAULT_PERMISSION_GROUPS: str = f"{MumimoCfgSections.SETTINGS_DATABASE}.default_permission_groups"
             DEFAULT_ALIASES: str = f"{MumimoCfgSections.SETTINGS_DATABASE}.default_aliases"
+            USER_BATCH_WINDOW: str = f"{MumimoCfgSections.SETTINGS_DATABASE}.user_batch_window"
+
+        class SERVERS:
+            INSTANCES: str = f"{MumimoCfgSections.SETTINGS_SERVERS}.instances"
+            SUPERVISOR_HEALTH_INTERVAL: str = f"{MumimoCfgSections.SETTINGS_SERVERS}.supervisor_health_interval"
+            SUPERVISOR_RESTART_BASE_DELAY: str = f"{MumimoCfgSections.SETTINGS_SERVERS}.supervisor_restart_base_delay"
+            SUPERVISOR_RESTART_MAX_DELAY: str = f"{MumimoCfgSections.SETTINGS_SERVERS}.supervisor_restart_max_delay"
 
         class COMMANDS:
             TOKEN: str = f"{MumimoCfgSections.SETTINGS_COMMANDS}.command_token"
@@ -232,6 +269,12 @@ class MumimoCfgFields:
             ENABLE: str = f"{MumimoCfgSections.SETTINGS_GUI}.enable"
             THEMES_PATH: str = f"{MumimoCfgSections.SETTINGS_GUI}.themes_path"
             SELECTED_THEME: str = f"{MumimoCfgSections.SETTINGS_GUI}.selected_theme"
+            PAGED_OUTPUT: str = f"{MumimoCfgSections.SETTINGS_GUI}.paged_output"
+            RENDER_CACHE_SIZE: str = f"{MumimoCfgSections.SETTINGS_GUI}.render_cache_size"
+
+        class RELOAD:
+            ENABLE: str = f"{MumimoCfgSections.SETTINGS_RELOAD}.enable"
+            INTERVAL: str = f"{MumimoCfgSections.SETTINGS_RELOAD}.interval"
 
     class OUTPUT:
         class GUI:
@@ -52,3 +52,8 @@ class ConfigReadError(ConfigError):
 class ConfigWriteError(ConfigError):
     def __init__(self, msg: str, logger: Optional[logging.Logger] = None) -> None:
         super().__init__(msg, logger=logger)
+
+
+class ConfigValidationError(ConfigError):
+    def __init__(self, msg: str, logger: Optional[logging.Logger] = None) -> None:
+        super().__init__(msg, logger=logger)
@@ -33,6 +33,13 @@ class CommandQueue:
     def max_size(self) -> int:
         return self._max_size
 
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        # Commands already queued beyond a smaller size are kept, and new commands are refused until the queue drains.
+        if not isinstance(value, int) or value < 0:
+            raise ServiceError("Cannot resize command queue: the provided max size must be a non-negative number.", logger=logger)
+        self._max_size = value
+
     @property
     def queue(self) -> List[Command]:
         return self._queue
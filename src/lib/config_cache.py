@@ -0,0 +1,177 @@
+import collections
+import copy
+import hashlib
+import logging
+import marshal
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+from typing import Any, Dict, Optional, OrderedDict, Union
+
+import toml
+
+from .singleton import singleton
+
+logger = logging.getLogger(__name__)
+
+
+@singleton
+class ConfigCache:
+    # Parsed config files keyed by the hash of their contents, so each file is parsed once per process, and once per change across restarts.
+    # Entries are kept marshaled, so every load returns a copy the caller can modify without affecting the cache.
+    _entries: OrderedDict[str, Union[bytes, Dict[str, Any]]]
+    _lock: threading.Lock
+    _cache_directory: Optional[pathlib.Path]
+
+    _hits: int
+    _disk_hits: int
+    _misses: int
+
+    DEFAULT_MAX_ENTRIES: int = 128
+    DEFAULT_MAX_FILES: int = 128
+    # The marshal format can change between python versions, so files written by other versions are never read.
+    FILE_SUFFIX: str = f".{sys.implementation.cache_tag}.bin"
+
+    @property
+    def cache_directory(self) -> Optional[pathlib.Path]:
+        return self._cache_directory
+
+    def __init__(self) -> None:
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_directory = None
+        self.reset_metrics()
+
+    def set_cache_directory(self, cache_directory: Optional[Union[str, pathlib.Path]]) -> None:
+        # Parsed configs are only kept in memory until a cache directory is set.
+        if cache_directory is None:
+            self._cache_directory = None
+            return
+        _cache_directory = pathlib.Path(cache_directory)
+        if not _cache_directory.is_absolute():
+            _cache_directory = pathlib.Path.cwd() / _cache_directory
+        self._cache_directory = _cache_directory
+
+    def load(self, file_path: pathlib.Path) -> Dict[str, Any]:
+        # Read and decode errors are raised to the caller as if the file was parsed directly.
+        with open(str(file_path), "rb") as file_handler:
+            _contents: bytes = file_handler.read()
+        _key: str = hashlib.sha256(_contents).hexdigest()
+
+        _data: Optional[Dict[str, Any]] = self._get(_key)
+        if _data is not None:
+            return _data
+        _data = toml.loads(_contents.decode("utf-8"), _dict=dict)
+        self._put(_key, _data)
+        return _data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+            }
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            _entry: Optional[Union[bytes, Dict[str, Any]]] = self._entries.get(key)
+            if _entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if _entry is not None:
+            return self._unpack(_entry)
+
+        _entry = self._read_file(key)
+        with self._lock:
+            if _entry is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._add_entry(key, _entry)
+        return self._unpack(_entry)
+
+    def _put(self, key: str, data: Dict[str, Any]) -> None:
+        try:
+            _entry: Union[bytes, Dict[str, Any]] = marshal.dumps(data)
+        except ValueError:
+            # Values such as dates can't be marshaled, so those configs are kept as they are and only in memory.
+            _entry = copy.deepcopy(data)
+        with self._lock:
+            self._add_entry(key, _entry)
+        if isinstance(_entry, bytes):
+            self._write_file(key, _entry)
+
+    def _add_entry(self, key: str, entry: Union[bytes, Dict[str, Any]]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.DEFAULT_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _unpack(entry: Union[bytes, Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(entry, bytes):
+            return marshal.loads(entry)
+        return copy.deepcopy(entry)
+
+    def _read_file(self, key: str) -> Optional[bytes]:
+        if self._cache_directory is None:
+            return None
+        _file_path: pathlib.Path = self._cache_directory / f"{key}{self.FILE_SUFFIX}"
+        try:
+            with open(str(_file_path), "rb") as file_handler:
+                _entry: bytes = file_handler.read()
+            # A cache file that can't be loaded is treated as missing, and is replaced once the config is parsed.
+            if not isinstance(marshal.loads(_entry), dict):
+                return None
+            # Recently used files are kept when the cache directory is pruned.
+            os.utime(_file_path)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return _entry
+
+    def _write_file(self, key: str, entry: bytes) -> None:
+        if self._cache_directory is None:
+            return
+        _temp_path: Optional[pathlib.Path] = None
+        try:
+            self._cache_directory.mkdir(parents=True, exist_ok=True)
+            _temp_fd, _temp_name = tempfile.mkstemp(suffix=".tmp", dir=str(self._cache_directory))
+            _temp_path = pathlib.Path(_temp_name)
+            with os.fdopen(_temp_fd, "wb") as file_handler:
+                file_handler.write(entry)
+            os.replace(_temp_path, self._cache_directory / f"{key}{self.FILE_SUFFIX}")
+            _temp_path = None
+            self._prune_files()
+        except OSError as exc:
+            # The cache only speeds up the next start, so it is skipped when the directory can't be written.
+            logger.debug(f"Unable to write parsed config to the cache directory: {self._cache_directory} | {exc}")
+        finally:
+            if _temp_path is not None:
+                _temp_path.unlink(missing_ok=True)
+
+    def _prune_files(self) -> None:
+        if self._cache_directory is None:
+            return
+        _files = list(self._cache_directory.glob(f"*{self.FILE_SUFFIX}"))
+        if len(_files) <= self.DEFAULT_MAX_FILES:
+            return
+        _files.sort(key=lambda file_path: file_path.stat().st_mtime_ns)
+        for _file_path in _files[: len(_files) - self.DEFAULT_MAX_FILES]:
+            _file_path.unlink(missing_ok=True)
+
+
+config_cache = ConfigCache()
@@ -0,0 +1,107 @@
+import logging
+import pathlib
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .server_context import run_in_current_context
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigWatcher:
+    # Polls the modification time and size of watched files, so config changes are picked up without inotify or another service.
+    class WatchedFile:
+        path: pathlib.Path
+        callbacks: List[Callable[[pathlib.Path], None]]
+        stat: Optional[Tuple[int, int]]
+
+        def __init__(self, path: pathlib.Path) -> None:
+            self.path = path
+            self.callbacks = []
+            self.stat = self.get_stat(path)
+
+        @staticmethod
+        def get_stat(path: pathlib.Path) -> Optional[Tuple[int, int]]:
+            try:
+                _stat = path.stat()
+            except OSError:
+                return None
+            return (_stat.st_mtime_ns, _stat.st_size)
+
+    _files: Dict[pathlib.Path, WatchedFile]
+    _lock: threading.Lock
+    _interval: float
+    _thread: Optional[threading.Thread]
+    _stop_event: threading.Event
+
+    DEFAULT_INTERVAL: float = 2.0
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def __init__(self, interval: Optional[float] = DEFAULT_INTERVAL) -> None:
+        if interval is None or interval <= 0:
+            interval = self.DEFAULT_INTERVAL
+        self._interval = float(interval)
+        self._files = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def watch(self, path: pathlib.Path, callback: Callable[[pathlib.Path], None]) -> None:
+        # The file's current state is the baseline, so only changes made after it is watched are reported.
+        _path: pathlib.Path = path.resolve()
+        with self._lock:
+            _file: Optional["ConfigWatcher.WatchedFile"] = self._files.get(_path)
+            if _file is None:
+                _file = self.WatchedFile(_path)
+                self._files[_path] = _file
+            _file.callbacks.append(callback)
+
+    def unwatch(self, path: pathlib.Path) -> bool:
+        with self._lock:
+            return self._files.pop(path.resolve(), None) is not None
+
+    def get_watched_files(self) -> List[pathlib.Path]:
+        with self._lock:
+            return list(self._files)
+
+    def poll(self) -> List[pathlib.Path]:
+        with self._lock:
+            _files: List["ConfigWatcher.WatchedFile"] = list(self._files.values())
+        _changed: List[pathlib.Path] = []
+        for _file in _files:
+            _stat: Optional[Tuple[int, int]] = self.WatchedFile.get_stat(_file.path)
+            # A file that is removed is reported once it is written again, since there is nothing to reload until then.
+            if _stat is None or _stat == _file.stat:
+                continue
+            _file.stat = _stat
+            _changed.append(_file.path)
+            for _callback in list(_file.callbacks):
+                try:
+                    _callback(_file.path)
+                except Exception:
+                    logger.exception(f"Unable to apply changes to the config file: {_file.path}")
+        return _changed
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=run_in_current_context(self._run), name="mumimo-config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            self.poll()
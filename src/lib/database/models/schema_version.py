@@ -0,0 +1,26 @@
+from typing import Any, Dict
+
+from sqlalchemy import DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .. import metadata
+
+
+class SchemaVersionTable(metadata.Base):
+    __tablename__ = "schema_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True, nullable=False)
+    version: Mapped[int] = mapped_column(Integer(), nullable=False)
+
+    created_on: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=func.now(), server_default=func.now(), nullable=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "version": self.version,
+            "created_on": self.created_on,
+        }
+
+    def __repr__(self) -> str:
+        return f"SchemaVersion(id={self.id!r}, version={self.version!r}, created_on={self.created_on!r})"
@@ -0,0 +1,108 @@
+import contextvars
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple
+
+from .constants import TextTypes
+
+if TYPE_CHECKING:
+    from .template import BoxTemplate
+
+
+class OutputCollector:
+    # Gathers the gui output of a command while it runs, so output sent to the same targets with the same styling is sent as one box.
+    class Entry:
+        rows: List[str]
+        template: "BoxTemplate"
+        text_type: Optional[TextTypes]
+        escape: bool
+        paged: Optional[bool]
+        kwargs: Dict[str, Any]
+
+        def __init__(
+            self, template: "BoxTemplate", text_type: Optional[TextTypes], escape: bool, paged: Optional[bool], kwargs: Dict[str, Any]
+        ) -> None:
+            self.rows = []
+            self.template = template
+            self.text_type = text_type
+            self.escape = escape
+            self.paged = paged
+            self.kwargs = kwargs
+
+    _entries: Dict[Tuple[Hashable, ...], Entry]
+    _lock: threading.Lock
+    _collected: int
+
+    @property
+    def collected(self) -> int:
+        return self._collected
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __init__(self) -> None:
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._collected = 0
+
+    def add(self, rows: List[str], template: "BoxTemplate", text_type: Optional[TextTypes], escape: bool, paged: Optional[bool], **kwargs) -> None:
+        # Boxes are merged when they look the same, so the key holds the compiled fragments rather than the settings they came from.
+        _key: Tuple[Hashable, ...] = (
+            self.get_target_key(**kwargs),
+            template.table_open,
+            template.get_row_fragments(text_type),
+            escape,
+            paged,
+            kwargs.get("delay", None),
+        )
+        with self._lock:
+            _entry: Optional["OutputCollector.Entry"] = self._entries.get(_key)
+            if _entry is None:
+                _entry = self.Entry(template, text_type, escape, paged, dict(kwargs))
+                self._entries[_key] = _entry
+            else:
+                # The first requesting user and the most severe log level of the merged output are kept.
+                if _entry.kwargs.get("user_id", None) is None and kwargs.get("user_id", None) is not None:
+                    _entry.kwargs["user_id"] = kwargs["user_id"]
+                _log_severity: int = max(_entry.kwargs.get("log_severity", logging.DEBUG), kwargs.get("log_severity", logging.DEBUG))
+                _entry.kwargs["log_severity"] = _log_severity
+            _entry.rows.extend(rows)
+            self._collected += 1
+
+    def drain(self) -> List[Entry]:
+        # Entries are returned in the order their targets were first written to.
+        with self._lock:
+            _entries: List["OutputCollector.Entry"] = list(self._entries.values())
+            self._entries = {}
+            return _entries
+
+    @staticmethod
+    def get_target_key(**kwargs) -> Tuple[Hashable, ...]:
+        # Mirrors how 'mumble_utils.echo' picks its targets: channels first, then users, then the bot's own channel.
+        _channels = kwargs.get("target_channels", None)
+        if _channels is not None and not isinstance(_channels, list):
+            _channels = [_channels]
+        if _channels:
+            return ("channels", tuple(sorted(channel["channel_id"] for channel in _channels)))
+        _users = kwargs.get("target_users", None)
+        if _users is not None and not isinstance(_users, list):
+            _users = [_users]
+        if _users:
+            return ("users", tuple(sorted(user["session"] for user in _users)))
+        return ("my_channel",)
+
+
+_current_collector: contextvars.ContextVar[Optional[OutputCollector]] = contextvars.ContextVar("mumimo_gui_output_collector", default=None)
+
+
+def get_current_collector() -> Optional[OutputCollector]:
+    return _current_collector.get()
+
+
+def set_current_collector(collector: Optional[OutputCollector]) -> contextvars.Token:
+    return _current_collector.set(collector)
+
+
+def reset_current_collector(token: contextvars.Token) -> None:
+    _current_collector.reset(token)
@@ -1,11 +1,18 @@
+import contextlib
+import html
 import logging
+import threading
+import types
 
-from typing import Optional, Union, List, TYPE_CHECKING
+from typing import Any, Callable, Dict, Generator, Hashable, Mapping, Optional, Union, List, Tuple, TYPE_CHECKING
 from .constants import TextTypes
-from .utility import FontModifiers, AlignmentModifiers
+from .collector import OutputCollector, get_current_collector, reset_current_collector, set_current_collector
+from .pager import GUIPager
+from .render_cache import RenderCache
+from .template import BoxTemplate
 from ....utils import mumble_utils
 from ....settings import settings
-from ....constants import MumimoCfgFields
+from ....config_snapshot import ConfigSnapshot
 from ....exceptions import GUIError
 
 if TYPE_CHECKING:
@@ -16,6 +23,86 @@ logger = logging.getLogger(__name__)
 
 
 class GUIFramework:
+    class RenderSettings:
+        # The selected theme compiled into the html fragments of a box. Instances are never modified: a theme change swaps in a new one.
+        _theme_name: str
+        _version: int
+        _values: Mapping[str, Any]
+        _template: BoxTemplate
+
+        def __init__(self, theme_name: str, settings: "GUIFramework.ContentBox.Settings", version: int) -> None:
+            self._theme_name = theme_name
+            self._version = version
+            self._values = types.MappingProxyType({field: getattr(settings, field) for field in GUIFramework.ContentBox.Settings.FIELDS})
+            self._template = BoxTemplate(settings)
+
+        @property
+        def theme_name(self) -> str:
+            return self._theme_name
+
+        @property
+        def version(self) -> int:
+            return self._version
+
+        @property
+        def values(self) -> Mapping[str, Any]:
+            return self._values
+
+        @property
+        def template(self) -> BoxTemplate:
+            return self._template
+
+        @property
+        def table_open(self) -> str:
+            return self._template.table_open
+
+        @property
+        def table_close(self) -> str:
+            return self._template.table_close
+
+        @property
+        def row_prefix(self) -> str:
+            return self._template.get_row_fragments()[0]
+
+        @property
+        def row_suffix(self) -> str:
+            return self._template.get_row_fragments()[1]
+
+        def render(self, rows: List[str], text_type: Optional[TextTypes] = None, escape: bool = False) -> str:
+            return self._template.render(rows, text_type=text_type, escape=escape)
+
+    class RenderedBox:
+        # A rendered box with everything needed to send it, which is what the render cache keeps.
+        rows: List[str]
+        text: str
+        raw_text: str
+        length: int
+        has_image: bool
+        template: BoxTemplate
+        text_type: Optional[TextTypes]
+        escape: bool
+
+        def __init__(self, rows: List[str], template: BoxTemplate, text_type: Optional[TextTypes], escape: bool) -> None:
+            self.rows = rows
+            self.template = template
+            self.text_type = text_type
+            self.escape = escape
+            self.text = template.render(rows, text_type=text_type, escape=escape)
+            self.raw_text = "".join(rows)
+            self.length = BoxTemplate.get_length(self.text)
+            self.has_image = any("<img" in row for row in rows)
+
+    _theme_version: int = 0
+    _theme_lock: threading.Lock = threading.Lock()
+    _pager_lock: threading.Lock = threading.Lock()
+    _render_cache: Optional[RenderCache] = None
+    _render_cache_lock: threading.Lock = threading.Lock()
+
+    PAGE_FOOTER: str = "Page {page} of {pages}. Send '{token}more' for the next page."
+    LAST_PAGE_FOOTER: str = "Page {page} of {pages}."
+    # Footers are measured with the widest page numbers expected, so every footer fits in the space kept for it.
+    PAGE_FOOTER_MAX_PAGES: int = 9999
+
     class ContentBox:
         is_open: bool
         settings: "Settings"
@@ -41,31 +128,25 @@ class GUIFramework:
             if settings is None:
                 settings = self.settings
             settings.update(**kwargs)
-            self._box_open = f'<table bgcolor="{settings.table_bg_color}" align="{settings.table_align}" cellspacing="1" cellpadding="5">'
+            self._box_open = settings.get_table_open()
             self.is_open = True
             return True
 
         def close(self) -> bool:
             if not self.is_open:
                 return False
-            self._box_close = "</table>"
+            self._box_close = self.settings.get_table_close()
             self.is_open = False
             return True
 
-        def add_row(self, text: str, settings: Optional["Settings"] = None, **kwargs) -> bool:
+        def add_row(self, text: str, settings: Optional["Settings"] = None, escape: bool = False, **kwargs) -> bool:
             if not self.is_open:
                 return False
             if settings is None:
                 settings = self.settings
             settings.update(**kwargs)
-            _row_type = f"{'td' if settings.text_type == TextTypes.BODY else 'th'}"
-            self._box_rows.append(
-                f"<tr {FontModifiers.bgcolor(settings.row_bg_color)}>"
-                f"<{_row_type} {AlignmentModifiers.align(settings.row_align)}>"
-                f"<font {FontModifiers.color(settings.text_color)}>{text}</font>"
-                f"</{_row_type}>"
-                f"</tr>"
-            )
+            _prefix, _suffix = BoxTemplate.compile_row(settings.text_type, settings.row_bg_color, settings.row_align, settings.text_color)
+            self._box_rows.append(f"{_prefix}{html.escape(text) if escape else text}{_suffix}")
             return True
 
         def compile(self) -> str:
@@ -88,29 +169,27 @@ class GUIFramework:
             row_align: str = "left"
             row_bg_color: str = "black"
 
+            FIELDS: Tuple[str, ...] = ("text_type", "text_color", "text_align", "table_align", "table_bg_color", "row_align", "row_bg_color")
+
             def __init__(self, **kwargs) -> None:
                 self._from_config()
                 self.update(**kwargs)
 
-            def _from_config(self) -> None:
-                _themes: Optional["Config"] = settings.configs.get_gui_themes()
-                if not _themes:
-                    raise GUIError("Unable to load gui themes: could not retrieve gui themes from settings.")
-                _config: Optional["Config"] = settings.configs.get_mumimo_config()
-                if not _config:
-                    raise GUIError("Unable to load gui themes: mumimo config could not be retrieved from settings.")
+            @classmethod
+            def from_theme(cls, theme: Mapping[str, Any]) -> "GUIFramework.ContentBox.Settings":
+                # Builds settings from the class defaults and the theme only, without looking up the compiled theme.
+                _settings = cls.__new__(cls)
+                _settings.update(**theme)
+                return _settings
 
-                _selected_theme = _config.get(MumimoCfgFields.SETTINGS.GUI.SELECTED_THEME, None)
-                _theme = _themes.get(_selected_theme, None)
-                if not _selected_theme or not _theme:
-                    _selected_theme = "light"
-                    logger.warning("Unable to find selected gui theme, falling back to default 'light' theme.")
+            def _from_config(self) -> None:
+                self.update(**GUIFramework.get_render_settings().values)
 
-                _theme = _themes.get(_selected_theme, None)
-                if not _theme:
-                    raise GUIError(f"Unable to find gui theme: [{_selected_theme}], falling back to default 'light' theme.", logger=logger)
+            def get_table_open(self) -> str:
+                return BoxTemplate.compile_table_open(self.table_bg_color, self.table_align)
 
-                self.update(**_theme)
+            def get_table_close(self) -> str:
+                return BoxTemplate.TABLE_CLOSE
 
             def update(self, **kwargs) -> "GUIFramework.ContentBox.Settings":
                 _text_type = kwargs.get("text_type", self.text_type)
@@ -129,24 +208,244 @@ class GUIFramework:
                 return self
 
     @staticmethod
-    def gui(
+    def get_render_settings() -> RenderSettings:
+        _render_settings: Optional["GUIFramework.RenderSettings"] = settings.configs.get_gui_render_settings()
+        if _render_settings is None or _render_settings.version != GUIFramework._theme_version:
+            _render_settings = GUIFramework.compile_theme()
+        return _render_settings
+
+    @staticmethod
+    def compile_theme() -> RenderSettings:
+        _themes: Optional["Config"] = settings.configs.get_gui_themes()
+        if not _themes:
+            raise GUIError("Unable to load gui themes: could not retrieve gui themes from settings.")
+        _snapshot: Optional[ConfigSnapshot] = settings.configs.get_config_snapshot()
+        if not _snapshot:
+            raise GUIError("Unable to load gui themes: mumimo config could not be retrieved from settings.")
+
+        _version: int = GUIFramework._theme_version
+        _selected_theme = _snapshot.gui.selected_theme
+        _theme = _themes.get(_selected_theme, None)
+        if not _selected_theme or not _theme:
+            _selected_theme = "light"
+            logger.warning("Unable to find selected gui theme, falling back to default 'light' theme.")
+
+        _theme = _themes.get(_selected_theme, None)
+        if not _theme:
+            raise GUIError(f"Unable to find gui theme: [{_selected_theme}], falling back to default 'light' theme.", logger=logger)
+
+        _render_settings = GUIFramework.RenderSettings(_selected_theme, GUIFramework.ContentBox.Settings.from_theme(_theme), _version)
+        # Replacing the reference is atomic, so boxes being rendered keep using the theme they started with.
+        settings.configs.set_gui_render_settings(_render_settings)
+        logger.debug(f"Compiled gui theme: {_selected_theme}")
+        return _render_settings
+
+    @staticmethod
+    def refresh_theme() -> RenderSettings:
+        # Themes are shared by all hosted servers, so the version makes every server recompile its selected theme on next use.
+        with GUIFramework._theme_lock:
+            GUIFramework._theme_version += 1
+        GUIFramework.invalidate_render_cache()
+        return GUIFramework.compile_theme()
+
+    @staticmethod
+    def get_template(settings: Optional[ContentBox.Settings] = None, **kwargs) -> Tuple[BoxTemplate, Optional[TextTypes]]:
+        # Boxes in the selected theme are rendered straight from the compiled theme, which has fragments for every text type.
+        _text_type: Optional[Union[TextTypes, str]] = kwargs.get("text_type", None)
+        if settings is None and not any(field in kwargs for field in GUIFramework.ContentBox.Settings.FIELDS if field != "text_type"):
+            if _text_type is not None and not isinstance(_text_type, TextTypes):
+                _text_type = TextTypes(_text_type)
+            return GUIFramework.get_render_settings().template, _text_type  # type: ignore
+
+        if settings is None:
+            settings = GUIFramework.ContentBox.Settings()
+        return BoxTemplate(settings.update(**kwargs)), None
+
+    @staticmethod
+    def render(
         text: Union[List[str], str],
         settings: Optional[ContentBox.Settings] = None,
+        escape: bool = False,
         **kwargs,
-    ) -> None:
+    ) -> str:
         raw_text = text
         if isinstance(text, str):
             raw_text = [text]
+        _template, _text_type = GUIFramework.get_template(settings, **kwargs)
+        return _template.render(raw_text, text_type=_text_type, escape=escape)
 
-        _content = GUIFramework.ContentBox(settings=settings)
-        _content.open(**kwargs)
-        for idx, row in enumerate(raw_text):
-            _content.add_row(row, **kwargs)
-        _content.close()
+    @staticmethod
+    def gui(
+        text: Union[List[str], str],
+        settings: Optional[ContentBox.Settings] = None,
+        escape: bool = False,
+        paged: Optional[bool] = None,
+        **kwargs,
+    ) -> None:
+        raw_text: List[str] = [text] if isinstance(text, str) else list(text)
+        _template, _text_type = GUIFramework.get_template(settings, **kwargs)
+        _collector: Optional[OutputCollector] = get_current_collector()
+        if _collector is not None:
+            _collector.add(raw_text, _template, _text_type, escape, paged, **kwargs)
+            return
+        GUIFramework._send(GUIFramework.RenderedBox(raw_text, _template, _text_type, escape), paged, **kwargs)
 
-        _compiled_text: str = _content.compile()
-        raw_text = "".join(text)
-        kwargs["raw_text"] = raw_text
+    @staticmethod
+    def gui_cached(
+        template_id: str,
+        arguments: Tuple[Hashable, ...],
+        build: Callable[[], Union[List[str], str]],
+        escape: bool = False,
+        paged: Optional[bool] = None,
+        **kwargs,
+    ) -> None:
+        # For output that only changes with the theme, the config or the plugins. The rows are built and rendered on the first request,
+        # and 'arguments' must hold everything else the rows depend on.
+        _render_settings: GUIFramework.RenderSettings = GUIFramework.get_render_settings()
+        _style: Tuple[Tuple[str, str], ...] = tuple(
+            (field, str(kwargs[field])) for field in GUIFramework.ContentBox.Settings.FIELDS if field in kwargs
+        )
+        _key: Tuple[Hashable, ...] = (template_id, _render_settings.theme_name, _render_settings.version, tuple(arguments), _style, escape)
+
+        def _render() -> GUIFramework.RenderedBox:
+            _text: Union[List[str], str] = build()
+            _template, _text_type = GUIFramework.get_template(None, **kwargs)
+            return GUIFramework.RenderedBox([_text] if isinstance(_text, str) else list(_text), _template, _text_type, escape)
+
+        _box: GUIFramework.RenderedBox = GUIFramework.get_render_cache().get_or_render(_key, _render)
+        _collector: Optional[OutputCollector] = get_current_collector()
+        if _collector is not None:
+            _collector.add(_box.rows, _box.template, _box.text_type, escape, paged, **kwargs)
+            return
+        GUIFramework._send(_box, paged, **kwargs)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def collect() -> Generator[OutputCollector, None, None]:
+        # Output sent while collecting is held back and sent when the block exits, with output to the same targets merged into one box.
+        _collector: Optional[OutputCollector] = get_current_collector()
+        if _collector is not None:
+            # Nested blocks add to the outer collector, which sends everything once.
+            yield _collector
+            return
+        _collector = OutputCollector()
+        _token = set_current_collector(_collector)
+        try:
+            yield _collector
+        finally:
+            reset_current_collector(_token)
+            _entries: List[OutputCollector.Entry] = _collector.drain()
+            if _collector.collected:
+                logger.debug(f"Merged {_collector.collected} gui outputs into {len(_entries)} messages.")
+            for _entry in _entries:
+                GUIFramework._send(
+                    GUIFramework.RenderedBox(_entry.rows, _entry.template, _entry.text_type, _entry.escape), _entry.paged, **_entry.kwargs
+                )
+
+    @staticmethod
+    def get_render_cache() -> RenderCache:
+        # Themes, plugins and commands are shared by all hosted servers, and the selected theme is part of every key, so one cache is shared.
+        with GUIFramework._render_cache_lock:
+            if GUIFramework._render_cache is None:
+                _snapshot: Optional[ConfigSnapshot] = settings.configs.get_config_snapshot()
+                _max_size: Optional[int] = _snapshot.gui.render_cache_size if _snapshot is not None else None
+                GUIFramework._render_cache = RenderCache(_max_size)
+            return GUIFramework._render_cache
+
+    @staticmethod
+    def reset_render_cache() -> None:
+        # The cache is created again on next use, with the size from the current config.
+        with GUIFramework._render_cache_lock:
+            GUIFramework._render_cache = None
+
+    @staticmethod
+    def invalidate_render_cache(template_id: Optional[str] = None) -> None:
+        _removed: int = GUIFramework.get_render_cache().invalidate(template_id)
+        logger.debug(f"Invalidated {_removed} cached gui renders{f' of {template_id}' if template_id else ''}.")
 
-        logger.debug("Compiled GUI: " + _compiled_text)
-        mumble_utils.echo(_compiled_text, **kwargs)
+    @staticmethod
+    def _send(box: RenderedBox, paged: Optional[bool], **kwargs) -> None:
+        # Murmur rejects messages over its length limits, so long output is split into as few boxes as fit.
+        _max_length: int = mumble_utils.get_max_message_length(image=box.has_image)
+        if not _max_length or box.length <= _max_length:
+            GUIFramework._echo(box.text, box.raw_text, **kwargs)
+            return
+
+        if paged is None:
+            paged = GUIFramework.is_paged_output()
+        _pager_id: Optional[int] = GUIFramework._get_pager_id(**kwargs) if paged else None
+        _reserved_length: int = 0
+        if _pager_id is not None:
+            _widest_footer: str = GUIFramework._get_page_footer(GUIFramework.PAGE_FOOTER_MAX_PAGES - 1, GUIFramework.PAGE_FOOTER_MAX_PAGES)
+            _reserved_length = BoxTemplate.get_length(f"{box.template.get_row_separator(box.text_type)}{_widest_footer}")
+
+        _pages: List[List[str]] = box.template.paginate(
+            box.rows, _max_length, text_type=box.text_type, escape=box.escape, reserved_length=_reserved_length
+        )
+        _compiled_pages: List[Tuple[str, str]] = []
+        for _idx, _page in enumerate(_pages):
+            _rows: List[str] = _page
+            if _pager_id is not None:
+                _rows = _page + [GUIFramework._get_page_footer(_idx + 1, len(_pages))]
+            _compiled_pages.append((box.template.render(_rows, text_type=box.text_type), "".join(_page)))
+        logger.debug(f"Split gui output of {len(box.rows)} rows into {len(_pages)} messages of at most {_max_length} bytes.")
+
+        if _pager_id is not None:
+            # Only the first page is sent now, and the user asks for the next ones with the 'more' command.
+            GUIFramework.get_pager().set_pages(_pager_id, _compiled_pages[1:], kwargs)
+            _compiled_pages = _compiled_pages[:1]
+        for _compiled_text, _raw_text in _compiled_pages:
+            GUIFramework._echo(_compiled_text, _raw_text, **kwargs)
+
+    @staticmethod
+    def show_next_page(user_id: int) -> bool:
+        _next_page: Optional[Tuple[str, str, Dict[str, Any]]] = GUIFramework.get_pager().next_page(user_id)
+        if _next_page is None:
+            return False
+        _compiled_text, _raw_text, _kwargs = _next_page
+        GUIFramework._echo(_compiled_text, _raw_text, **_kwargs)
+        return True
+
+    @staticmethod
+    def get_pager() -> GUIPager:
+        with GUIFramework._pager_lock:
+            _pager: Optional[GUIPager] = settings.state.get_gui_pager()
+            if _pager is None:
+                _pager = GUIPager()
+                settings.state.set_gui_pager(_pager)
+            return _pager
+
+    @staticmethod
+    def is_paged_output() -> bool:
+        _snapshot: Optional[ConfigSnapshot] = settings.configs.get_config_snapshot()
+        if _snapshot is None:
+            return False
+        return _snapshot.gui.paged_output
+
+    @staticmethod
+    def _get_pager_id(**kwargs) -> Optional[int]:
+        # Pages are kept for the user the output was requested by, or for the only user it was sent to.
+        _user_id: Optional[int] = kwargs.get("user_id", None)
+        if _user_id:
+            return _user_id
+        _target_users = kwargs.get("target_users", None)
+        if isinstance(_target_users, list) and len(_target_users) == 1:
+            _target_users = _target_users[0]
+        if isinstance(_target_users, dict):
+            return _target_users.get("session", None)
+        return None
+
+    @staticmethod
+    def _get_page_footer(page: int, pages: int) -> str:
+        if page >= pages:
+            return GUIFramework.LAST_PAGE_FOOTER.format(page=page, pages=pages)
+        _snapshot: Optional[ConfigSnapshot] = settings.configs.get_config_snapshot()
+        _token: str = _snapshot.commands.token if _snapshot is not None else ConfigSnapshot.Commands.DEFAULT_TOKEN
+        return GUIFramework.PAGE_FOOTER.format(page=page, pages=pages, token=_token)
+
+    @staticmethod
+    def _echo(compiled_text: str, raw_text: str, **kwargs) -> None:
+        kwargs["raw_text"] = raw_text
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Compiled GUI: {compiled_text}")
+        mumble_utils.echo(compiled_text, **kwargs)
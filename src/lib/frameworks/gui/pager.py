@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class GUIPager:
+    # Holds the remaining pages of gui output sent one page at a time, until the user asks for them with the 'more' command.
+    class PendingPages:
+        pages: List[Tuple[str, str]]
+        index: int
+        echo_kwargs: Dict[str, Any]
+        expires_at: float
+
+        def __init__(self, pages: List[Tuple[str, str]], echo_kwargs: Dict[str, Any], expiry: float) -> None:
+            self.pages = pages
+            self.index = 0
+            self.echo_kwargs = echo_kwargs
+            self.expires_at = time.monotonic() + expiry
+
+    _pending: Dict[int, PendingPages]
+    _lock: threading.Lock
+    _expiry: float
+
+    DEFAULT_EXPIRY: float = 600.0
+
+    def __init__(self, expiry: Optional[float] = DEFAULT_EXPIRY) -> None:
+        if expiry is None or expiry <= 0:
+            expiry = self.DEFAULT_EXPIRY
+        self._expiry = float(expiry)
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def set_pages(self, user_id: int, pages: List[Tuple[str, str]], echo_kwargs: Dict[str, Any]) -> None:
+        # Pages are (compiled text, raw text) pairs. New paged output replaces the pages the user has not read yet.
+        with self._lock:
+            if not pages:
+                self._pending.pop(user_id, None)
+                return
+            self._pending[user_id] = self.PendingPages(list(pages), dict(echo_kwargs), self._expiry)
+
+    def next_page(self, user_id: int) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        with self._lock:
+            _pending: Optional["GUIPager.PendingPages"] = self._pending.get(user_id)
+            if _pending is None:
+                return None
+            if _pending.expires_at < time.monotonic():
+                del self._pending[user_id]
+                return None
+            _text, _raw_text = _pending.pages[_pending.index]
+            _pending.index += 1
+            if _pending.index >= len(_pending.pages):
+                del self._pending[user_id]
+            return _text, _raw_text, dict(_pending.echo_kwargs)
+
+    def get_remaining(self, user_id: int) -> int:
+        with self._lock:
+            _pending: Optional["GUIPager.PendingPages"] = self._pending.get(user_id)
+            if _pending is None or _pending.expires_at < time.monotonic():
+                return 0
+            return len(_pending.pages) - _pending.index
+
+    def clear(self, user_id: Optional[int] = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._pending = {}
+                return
+            self._pending.pop(user_id, None)
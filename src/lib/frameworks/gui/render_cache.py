@@ -0,0 +1,96 @@
+import collections
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, OrderedDict, Tuple
+
+
+class RenderCache:
+    # A least recently used cache of rendered gui output that only changes with the theme, the config or the plugins.
+    _entries: OrderedDict[Tuple[Hashable, ...], Any]
+    _lock: threading.Lock
+    _max_size: int
+
+    _hits: int
+    _misses: int
+    _evictions: int
+    _invalidations: int
+
+    DEFAULT_MAX_SIZE: int = 256
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __init__(self, max_size: Optional[int] = DEFAULT_MAX_SIZE) -> None:
+        if max_size is None or max_size < 0:
+            max_size = self.DEFAULT_MAX_SIZE
+        self._max_size = int(max_size)
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_metrics()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        with self._lock:
+            _value: Optional[Any] = self._entries.get(key)
+            if _value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return _value
+
+    def put(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        # A cache with a size of 0 is disabled, and keeps nothing.
+        if self._max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_render(self, key: Tuple[Hashable, ...], render: Callable[[], Any]) -> Any:
+        _value: Optional[Any] = self.get(key)
+        if _value is None:
+            # Rendering happens outside the lock, so two threads missing the same key may both render it, which is harmless.
+            _value = render()
+            self.put(key, _value)
+        return _value
+
+    def invalidate(self, template_id: Optional[str] = None) -> int:
+        # Keys start with the template id, so the output of a single template can be dropped without clearing the others.
+        with self._lock:
+            if template_id is None:
+                _removed: int = len(self._entries)
+                self._entries.clear()
+            else:
+                _keys = [key for key in self._entries if key[0] == template_id]
+                for _key in _keys:
+                    del self._entries[_key]
+                _removed = len(_keys)
+            self._invalidations += 1
+            return _removed
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            _lookups: int = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / _lookups if _lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._invalidations = 0
@@ -0,0 +1,113 @@
+import html
+import types
+from typing import TYPE_CHECKING, Iterable, List, Mapping, Optional, Tuple
+
+from .constants import TextTypes
+from .utility import AlignmentModifiers, FontModifiers
+
+if TYPE_CHECKING:
+    from .gui import GUIFramework
+
+
+class BoxTemplate:
+    # A gui box compiled into its static html fragments, so rendering rows only joins the row content between cached fragments.
+    _table_open: str
+    _table_close: str
+    _text_type: TextTypes
+    _row_fragments: Mapping[TextTypes, Tuple[str, str]]
+    _row_separators: Mapping[TextTypes, str]
+
+    TABLE_CLOSE: str = "</table>"
+
+    @property
+    def table_open(self) -> str:
+        return self._table_open
+
+    @property
+    def table_close(self) -> str:
+        return self._table_close
+
+    @property
+    def text_type(self) -> TextTypes:
+        return self._text_type
+
+    def __init__(self, settings: "GUIFramework.ContentBox.Settings") -> None:
+        self._table_open = self.compile_table_open(settings.table_bg_color, settings.table_align)
+        self._table_close = self.TABLE_CLOSE
+        self._text_type = settings.text_type
+        _row_fragments = {
+            text_type: self.compile_row(text_type, settings.row_bg_color, settings.row_align, settings.text_color) for text_type in TextTypes
+        }
+        self._row_fragments = types.MappingProxyType(_row_fragments)
+        # The suffix of a row and the prefix of the next one are joined once here instead of for every row.
+        self._row_separators = types.MappingProxyType({text_type: f"{suffix}{prefix}" for text_type, (prefix, suffix) in _row_fragments.items()})
+
+    def get_row_fragments(self, text_type: Optional[TextTypes] = None) -> Tuple[str, str]:
+        return self._row_fragments[text_type or self._text_type]
+
+    def get_row_separator(self, text_type: Optional[TextTypes] = None) -> str:
+        return self._row_separators[text_type or self._text_type]
+
+    def render(self, rows: Iterable[str], text_type: Optional[TextTypes] = None, escape: bool = False) -> str:
+        _text_type: TextTypes = text_type or self._text_type
+        _rows: List[str] = [html.escape(row) for row in rows] if escape else list(rows)
+        if not _rows:
+            return f"{self._table_open}{self._table_close}"
+        _prefix, _suffix = self._row_fragments[_text_type]
+        return f"{self._table_open}{_prefix}{self._row_separators[_text_type].join(_rows)}{_suffix}{self._table_close}"
+
+    def render_rows(self, rows: Iterable[Tuple[TextTypes, str]], escape: bool = False) -> str:
+        # For boxes that mix text types, such as a title row followed by body rows.
+        _parts: List[str] = [self._table_open]
+        for _text_type, _row in rows:
+            _prefix, _suffix = self._row_fragments[_text_type]
+            _parts.append(_prefix)
+            _parts.append(html.escape(_row) if escape else _row)
+            _parts.append(_suffix)
+        _parts.append(self._table_close)
+        return "".join(_parts)
+
+    def paginate(
+        self, rows: Iterable[str], max_length: int, text_type: Optional[TextTypes] = None, escape: bool = False, reserved_length: int = 0
+    ) -> List[List[str]]:
+        # Splits rows into as few boxes as fit in max_length bytes, keeping a running total instead of rendering and measuring each box.
+        # The returned rows are already escaped, and 'reserved_length' keeps room for rows added to every page afterwards.
+        _rows: List[str] = [html.escape(row) for row in rows] if escape else list(rows)
+        if max_length <= 0:
+            return [_rows]
+        _text_type: TextTypes = text_type or self._text_type
+        _prefix, _suffix = self._row_fragments[_text_type]
+        _box_length: int = self.get_length(f"{self._table_open}{_prefix}{_suffix}{self._table_close}") + reserved_length
+        _separator_length: int = self.get_length(self._row_separators[_text_type])
+
+        _pages: List[List[str]] = []
+        _page: List[str] = []
+        _page_length: int = _box_length
+        for _row in _rows:
+            _row_length: int = self.get_length(_row)
+            if _page and _page_length + _separator_length + _row_length > max_length:
+                _pages.append(_page)
+                _page, _page_length = [], _box_length
+            # A row that is too long for any box still gets a box of its own, and is left for the server to reject.
+            _page_length += _row_length + (_separator_length if _page else 0)
+            _page.append(_row)
+        if _page or not _pages:
+            _pages.append(_page)
+        return _pages
+
+    @staticmethod
+    def get_length(text: str) -> int:
+        # Murmur counts UTF-16 code units, which never exceeds the UTF-8 byte length, so budgets in bytes are always accepted.
+        return len(text.encode("utf-8"))
+
+    @staticmethod
+    def compile_table_open(bg_color: str, align: str) -> str:
+        return f'<table bgcolor="{bg_color}" align="{align}" cellspacing="1" cellpadding="5">'
+
+    @staticmethod
+    def compile_row(text_type: TextTypes, bg_color: str, align: str, text_color: str) -> Tuple[str, str]:
+        _row_type = f"{'td' if text_type == TextTypes.BODY else 'th'}"
+        _prefix: str = (
+            f"<tr {FontModifiers.bgcolor(bg_color)}><{_row_type} {AlignmentModifiers.align(align)}><font {FontModifiers.color(text_color)}>"
+        )
+        return _prefix, f"</font></{_row_type}></tr>"
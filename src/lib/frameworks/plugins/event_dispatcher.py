@@ -0,0 +1,210 @@
+import fnmatch
+import functools
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from pymumble_py3.constants import (
+    PYMUMBLE_CLBK_CHANNELCREATED,
+    PYMUMBLE_CLBK_SOUNDRECEIVED,
+    PYMUMBLE_CLBK_TEXTMESSAGERECEIVED,
+    PYMUMBLE_CLBK_USERCREATED,
+    PYMUMBLE_CLBK_USERREMOVED,
+    PYMUMBLE_CLBK_USERUPDATED,
+)
+
+from ....constants import LogOutputIdentifiers
+from ....exceptions import PluginError
+from ....lib.server_context import bind_current_server, get_current_server
+from ....settings import settings
+from ....utils import mumble_utils
+from .plugin import PluginBase, PluginConstants, PluginEvent
+
+if TYPE_CHECKING:
+    from ....services.event_bus_service import EventBusService
+
+
+logger = logging.getLogger(__name__)
+
+
+class PluginEventDispatcher:
+    class Subscription:
+        plugin: PluginBase
+        callback: Callable[[PluginBase, PluginEvent], Any]
+        channels: List[str]
+        users: List[str]
+        predicate: Optional[Callable[[PluginEvent], bool]]
+
+        def __init__(
+            self,
+            plugin: PluginBase,
+            callback: Callable[[PluginBase, PluginEvent], Any],
+            channels: Optional[List[str]] = None,
+            users: Optional[List[str]] = None,
+            predicate: Optional[Callable[[PluginEvent], bool]] = None,
+        ) -> None:
+            self.plugin = plugin
+            self.callback = callback
+            self.channels = list(channels or [])
+            self.users = list(users or [])
+            self.predicate = predicate
+
+        def matches(self, event: PluginEvent) -> bool:
+            if not self.plugin.is_running:
+                return False
+            if self.users:
+                if event.user is None or not any(fnmatch.fnmatchcase(event.user["name"], pattern) for pattern in self.users):
+                    return False
+            if self.channels:
+                _names: List[str] = [name for name in (event.channel["name"] if event.channel else None, event.channel_path) if name]
+                if not any(fnmatch.fnmatchcase(name, pattern) for name in _names for pattern in self.channels):
+                    return False
+            if self.predicate is not None and not self.predicate(event):
+                return False
+            return True
+
+    _subscriptions: Dict[PluginConstants.Event, List[Subscription]]
+    _lock: threading.Lock
+
+    CALLBACK_EVENTS: Dict[str, PluginConstants.Event] = {
+        PYMUMBLE_CLBK_USERCREATED: PluginConstants.Event.USER_JOINED,
+        PYMUMBLE_CLBK_USERREMOVED: PluginConstants.Event.USER_LEFT,
+        PYMUMBLE_CLBK_USERUPDATED: PluginConstants.Event.USER_MOVED,
+        PYMUMBLE_CLBK_CHANNELCREATED: PluginConstants.Event.CHANNEL_CREATED,
+        PYMUMBLE_CLBK_TEXTMESSAGERECEIVED: PluginConstants.Event.TEXT_RECEIVED,
+        PYMUMBLE_CLBK_SOUNDRECEIVED: PluginConstants.Event.AUDIO_RECEIVED,
+    }
+    LANE_PREFIX: str = "plugin"
+
+    def __init__(self) -> None:
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def register_plugin(self, plugin: PluginBase) -> int:
+        _register = getattr(type(plugin), "event", None)
+        _registered_events: Dict[str, Any] = getattr(_register, "all", {})
+        _count: int = 0
+        with self._lock:
+            for _callback_name, (_callback, _events, _filters) in _registered_events.items():
+                for _event in _events:
+                    if not isinstance(_event, PluginConstants.Event):
+                        raise PluginError(f"Plugin '{plugin.plugin_name}' error: '{_callback_name}' subscribes to an unknown event '{_event}'.")
+                    _subscription = self.Subscription(plugin, _callback, **_filters)
+                    # Subscription lists are replaced rather than modified, so events being dispatched keep their own snapshot.
+                    self._subscriptions[_event] = self._subscriptions.get(_event, []) + [_subscription]
+                    _count += 1
+                    logger.debug(
+                        f"[{LogOutputIdentifiers.PLUGINS}]: Plugin '{plugin.plugin_name}' subscribed '{_callback_name}' to '{_event.value}'."
+                    )
+        return _count
+
+    def unregister_plugin(self, plugin_name: str) -> None:
+        with self._lock:
+            self._subscriptions = {
+                event: [subscription for subscription in subscriptions if subscription.plugin.plugin_name != plugin_name]
+                for event, subscriptions in self._subscriptions.items()
+            }
+
+    def get_subscriptions(self, event: PluginConstants.Event) -> List[Subscription]:
+        with self._lock:
+            return self._subscriptions.get(event, [])
+
+    def get_callback_types(self) -> List[str]:
+        # Only callbacks with at least one subscription are routed to the dispatcher, so other events are never built or copied.
+        with self._lock:
+            return [callback_type for callback_type, event in self.CALLBACK_EVENTS.items() if self._subscriptions.get(event)]
+
+    def get_plugin_names(self) -> List[str]:
+        with self._lock:
+            return sorted({subscription.plugin.plugin_name for subscriptions in self._subscriptions.values() for subscription in subscriptions})
+
+    def attach(self, event_bus: "EventBusService") -> None:
+        # Every plugin gets its own lane, so a slow plugin only delays its own events.
+        for _plugin_name in self.get_plugin_names():
+            _lane_name: str = self.get_lane_name(_plugin_name)
+            event_bus.set_lane_options(_lane_name, overload_policy=event_bus.OVERLOAD_DROP_OLDEST)
+            event_bus.set_subscriber(_lane_name, bind_current_server(self._deliver))
+        for _callback_type in self.get_callback_types():
+            event_bus.add_subscriber(_callback_type, bind_current_server(functools.partial(self.handle, _callback_type)))
+
+    def handle(self, callback_type: str, *args: Any) -> int:
+        _event_type: Optional[PluginConstants.Event] = self.CALLBACK_EVENTS.get(callback_type)
+        if _event_type is None:
+            return 0
+        _subscriptions: List["PluginEventDispatcher.Subscription"] = self.get_subscriptions(_event_type)
+        if not _subscriptions:
+            return 0
+        _event: Optional[PluginEvent] = self._build_event(_event_type, args)
+        if _event is None:
+            return 0
+
+        _event_bus: Optional["EventBusService"] = settings.connection.get_event_bus_service()
+        _delivered: int = 0
+        for _subscription in _subscriptions:
+            try:
+                if not _subscription.matches(_event):
+                    continue
+            except Exception as exc:
+                logger.warning(f"[{LogOutputIdentifiers.PLUGINS}]: Plugin '{_subscription.plugin.plugin_name}' event filter failed: {exc}")
+                continue
+            # Plugins registered after the event bus was set up have no lane subscriber yet, and are delivered to directly.
+            if _event_bus is None or not _event_bus.publish(self.get_lane_name(_subscription.plugin.plugin_name), _subscription, _event):
+                self._deliver(_subscription, _event)
+            _delivered += 1
+        return _delivered
+
+    @classmethod
+    def get_lane_name(cls, plugin_name: str) -> str:
+        return f"{cls.LANE_PREFIX}.{plugin_name}"
+
+    @staticmethod
+    def _deliver(subscription: Subscription, event: PluginEvent) -> None:
+        try:
+            subscription.callback(subscription.plugin, event)
+        except Exception as exc:
+            _plugin_name: str = subscription.plugin.plugin_name
+            logger.error(f"[{LogOutputIdentifiers.PLUGINS}]: Plugin '{_plugin_name}' failed to handle a '{event.event_type.value}' event: {exc}")
+
+    def _build_event(self, event_type: PluginConstants.Event, args: Any) -> Optional[PluginEvent]:
+        _user: Optional[Dict[str, Any]] = None
+        _channel_id: Optional[int] = None
+        _message: Optional[str] = None
+        _sound: Optional[Any] = None
+        if event_type == PluginConstants.Event.USER_MOVED:
+            # User updates are only moves when the channel changed.
+            if len(args) < 2 or "channel_id" not in args[1]:
+                return None
+            _user, _channel_id = args[0], args[1]["channel_id"]
+        elif event_type in (PluginConstants.Event.USER_JOINED, PluginConstants.Event.USER_LEFT):
+            _user = args[0]
+            _channel_id = _user.get("channel_id", 0)
+        elif event_type == PluginConstants.Event.CHANNEL_CREATED:
+            _channel_id = args[0]["channel_id"]
+        elif event_type == PluginConstants.Event.TEXT_RECEIVED:
+            _text = args[0]
+            _user = mumble_utils.get_user_by_id(_text.actor)
+            _channel_id = _text.channel_id[0] if _text.channel_id else None
+            _message = _text.message
+        elif event_type == PluginConstants.Event.AUDIO_RECEIVED:
+            _user, _sound = args[0], args[1]
+            _channel_id = _user.get("channel_id", 0)
+
+        _channel: Optional[Dict[str, Any]] = None
+        _channel_path: Optional[str] = None
+        if _channel_id is not None:
+            _client_state = settings.state.get_client_state()
+            if _client_state is not None:
+                _channel = _client_state.server_properties.state.get_channel(_channel_id)
+                _channel_path = _client_state.server_properties.state.get_channel_path(_channel_id)
+            if _channel is None and event_type == PluginConstants.Event.CHANNEL_CREATED:
+                _channel = args[0]
+        _server = get_current_server()
+        return PluginEvent(
+            event_type,
+            user=_user,
+            channel=_channel,
+            message=_message,
+            sound=_sound,
+            server=_server.name if _server else None,
+            channel_path=_channel_path,
+        )
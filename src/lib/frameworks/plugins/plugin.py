@@ -31,6 +31,14 @@ class PluginConstants:
         PARAMETER_DISABLED = 3
         PARAMETER_INVALID = 4
 
+    class Event(Enum):
+        USER_JOINED = "user_joined"
+        USER_LEFT = "user_left"
+        USER_MOVED = "user_moved"
+        CHANNEL_CREATED = "channel_created"
+        TEXT_RECEIVED = "text_received"
+        AUDIO_RECEIVED = "audio_received"
+
 
 class ParameterCompileResult:
     def __init__(
@@ -48,6 +56,26 @@ class ParameterCompileResult:
         self.reason = reason
 
 
+class PluginEvent:
+    def __init__(
+        self,
+        event_type: PluginConstants.Event,
+        user: Optional[Dict[str, Any]] = None,
+        channel: Optional[Dict[str, Any]] = None,
+        message: Optional[str] = None,
+        sound: Optional[Any] = None,
+        server: Optional[str] = None,
+        channel_path: Optional[str] = None,
+    ) -> None:
+        self.event_type = event_type
+        self.user = user
+        self.channel = channel
+        self.channel_path = channel_path
+        self.message = message
+        self.sound = sound
+        self.server = server
+
+
 class PluginBase(ABC):
     _plugin_name: str = __name__
     _plugin_metadata: Config
@@ -77,6 +105,29 @@ class PluginBase(ABC):
         register.all = registered_cmds
         return register
 
+    @classmethod
+    def makeEventRegister(cls):
+        # Event subscriptions are declared like commands, and collected by the plugin event dispatcher when the plugin is registered.
+        registered_events = {}
+
+        def register(
+            *events: PluginConstants.Event,
+            channels: Optional[List[str]] = None,
+            users: Optional[List[str]] = None,
+            predicate: Optional[Callable[["PluginEvent"], bool]] = None,
+        ):
+            if not events:
+                raise PluginError("Unable to register plugin event subscription: at least one event must be provided.")
+
+            def register_with_filters(func):
+                registered_events[func.__name__] = (func, list(events), {"channels": channels or [], "users": users or [], "predicate": predicate})
+                return func
+
+            return register_with_filters
+
+        register.all = registered_events
+        return register
+
     @property
     def is_running(self):
         return self._is_running
@@ -201,6 +252,12 @@ class PluginBase(ABC):
         self._plugin_metadata = Config(pathlib.Path.cwd() / f".config/plugins/{self._plugin_name}/metadata.toml")
         self._plugin_metadata.read()
 
+    def reload_metadata(self, metadata: Config, callbacks: List[Dict[str, Any]]) -> None:
+        # Commands disabled by the new metadata are refused by '_compile_parameters', so only the parameters of enabled commands are rebuilt.
+        self._plugin_metadata = metadata
+        self.initialize_parameters(callbacks)
+        GUIFramework.invalidate_render_cache()
+
     def initialize_parameters(self, callbacks: List[Dict[str, Any]]):
         if not callbacks:
             raise PluginError(f"Unable to initialize parameters for plugin '{self.plugin_name}'. No command callbacks provided.")
@@ -245,6 +302,8 @@ class PluginBase(ABC):
         if not self._is_running:
             self._is_running = True
             self._thread_stop_event.clear()
+            # Cached gui output such as plugin statuses and command usage messages depends on the running plugins.
+            GUIFramework.invalidate_render_cache()
             _msg = f"Plugin started: {self.plugin_name}"
             logger.debug(f"[{LogOutputIdentifiers.PLUGINS}]: {_msg}")
             return (True, _msg)
@@ -256,6 +315,7 @@ class PluginBase(ABC):
         if self._is_running:
             self._thread_stop_event.set()
             self._is_running = False
+            GUIFramework.invalidate_render_cache()
             _msg = f"Plugin stopped: {self.plugin_name}"
             logger.debug(f"[{LogOutputIdentifiers.PLUGINS}]: {_msg}")
             return (True, _msg)
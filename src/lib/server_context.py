@@ -0,0 +1,111 @@
+import contextlib
+import contextvars
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Optional
+
+if TYPE_CHECKING:
+    from ..client_state import ClientState
+    from ..config import Config
+    from ..config_snapshot import ConfigSnapshot
+    from ..lib.command_history import CommandHistory
+    from ..lib.frameworks.gui.gui import GUIFramework
+    from ..lib.frameworks.gui.pager import GUIPager
+    from ..murmur_connection import MurmurConnectionBase
+    from ..services.cmd_processing_service import CommandProcessingService
+    from ..services.event_bus_service import EventBusService
+    from ..services.loop_rate_service import LoopRateService
+    from ..services.outbound_message_service import OutboundMessageService
+    from ..services.text_message_service import TextMessageService
+    from ..services.user_persistence_service import UserPersistenceService
+
+
+class ServerContext:
+    # Holds everything that must stay separate between servers hosted in the same process.
+    # Plugins, command callbacks, the database service and the gui themes are shared by all servers.
+    name: str
+    connection_params: Dict[str, Any]
+    config_overrides: Dict[str, Any]
+    murmur_connection: Optional["MurmurConnectionBase"]
+    client_state: Optional["ClientState"]
+    cmd_processing_service: Optional["CommandProcessingService"]
+    command_history: Optional["CommandHistory"]
+    loop_rate_service: Optional["LoopRateService"]
+    text_message_service: Optional["TextMessageService"]
+    outbound_message_service: Optional["OutboundMessageService"]
+    event_bus_service: Optional["EventBusService"]
+    user_persistence_service: Optional["UserPersistenceService"]
+    config: Optional["Config"]
+    config_snapshot: Optional["ConfigSnapshot"]
+    gui_render_settings: Optional["GUIFramework.RenderSettings"]
+    gui_pager: Optional["GUIPager"]
+    memory_usage: Optional[int]
+
+    def __init__(self, name: str, connection_params: Optional[Dict[str, Any]] = None, config_overrides: Optional[Dict[str, Any]] = None) -> None:
+        self.name = name
+        self.connection_params = connection_params or {}
+        self.config_overrides = config_overrides or {}
+        self.murmur_connection = None
+        self.client_state = None
+        self.cmd_processing_service = None
+        self.command_history = None
+        self.loop_rate_service = None
+        self.text_message_service = None
+        self.outbound_message_service = None
+        self.event_bus_service = None
+        self.user_persistence_service = None
+        self.config = None
+        self.config_snapshot = None
+        self.gui_render_settings = None
+        self.gui_pager = None
+        self.memory_usage = None
+
+    def apply_config_overrides(self, base_config: "Config") -> "Config":
+        from ..config_snapshot import ConfigSnapshot
+
+        _config: "Config" = base_config.copy_with_overrides(self.config_overrides)
+        # Overrides are validated when the server is loaded, rather than when a command first reads them.
+        self.config_snapshot = ConfigSnapshot.from_config(_config)
+        self.config = _config
+        return _config
+
+    def stop(self) -> None:
+        with use_server(self):
+            if self.user_persistence_service is not None:
+                self.user_persistence_service.stop()
+            if self.murmur_connection is not None:
+                self.murmur_connection.stop()
+
+
+_current_server: contextvars.ContextVar[Optional[ServerContext]] = contextvars.ContextVar("mumimo_current_server", default=None)
+
+
+def get_current_server() -> Optional[ServerContext]:
+    return _current_server.get()
+
+
+@contextlib.contextmanager
+def use_server(context: Optional[ServerContext]) -> Generator[Optional[ServerContext], None, None]:
+    _token = _current_server.set(context)
+    try:
+        yield context
+    finally:
+        _current_server.reset(_token)
+
+
+def bind_current_server(func: Callable) -> Callable:
+    # pymumble invokes callbacks from its own threads, which do not inherit context variables.
+    _context: Optional[ServerContext] = get_current_server()
+    if _context is None:
+        return func
+
+    @functools.wraps(func)
+    def _bound(*args, **kwargs) -> Any:
+        with use_server(_context):
+            return func(*args, **kwargs)
+
+    return _bound
+
+
+def run_in_current_context(func: Callable) -> Callable:
+    # Used as a thread target so threads started by a hosted server keep that server selected.
+    return functools.partial(contextvars.copy_context().run, func)
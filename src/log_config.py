@@ -4,11 +4,17 @@ from typing import Any, Optional
 
 import toml
 
+from .lib.config_cache import config_cache
+
 
 class LogConfig(dict):
     _config_file_path: Optional[pathlib.Path] = None
     _initial_config: Optional["LogConfig"] = None
 
+    @property
+    def file_path(self) -> Optional[pathlib.Path]:
+        return self._config_file_path
+
     def __init__(self, file_name: Optional[str] = None) -> None:
         super().__init__()
         if file_name is not None:
@@ -28,18 +34,17 @@ class LogConfig(dict):
 
     def _read_from_file(self, file_path: pathlib.Path):
         try:
-            with open(str(file_path.resolve()), "r", encoding="utf-8") as file_handler:
-                contents = toml.load(file_handler, _dict=dict)
-                self.update(contents)
-                self._config_file_path = file_path
-                if self._initial_config is None:
-                    self._initial_config = LogConfig()
-                    self._initial_config._config_file_path = self._config_file_path
-                    self._initial_config.update(self)
+            contents = config_cache.load(file_path.resolve())
         except toml.TomlDecodeError as exc:
             raise IOError(f"Unable to read config file at: {file_path}.") from exc
         except IOError as exc:
             raise IOError(f"Unable to open config file to read at: {file_path}.") from exc
+        self.update(contents)
+        self._config_file_path = file_path
+        if self._initial_config is None:
+            self._initial_config = LogConfig()
+            self._initial_config._config_file_path = self._config_file_path
+            self._initial_config.update(self)
 
     def save(
         self,
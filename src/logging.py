@@ -100,6 +100,34 @@ def init_logger(sys_args: Optional[Dict[str, str]] = None) -> bool:
     return _IS_INITIALIZED
 
 
+def reload_handlers() -> bool:
+    # Replaces the handlers added by 'init_logger' with handlers built from the current log config, keeping the verbosity it was started with.
+    global _log_file_handler, _log_console_handler
+    if not _IS_INITIALIZED:
+        return False
+    _log_config = settings.configs.get_log_config()
+    if _log_config is None:
+        return False
+    if _log_file_handler is not None:
+        _logger.root.removeHandler(_log_file_handler)
+        _log_file_handler.close()
+        _log_file_handler = None
+    if bool(_log_config.get(LogCfgFields.OUTPUT.FILE.ENABLE)):
+        _log_parent_directory: pathlib.Path = pathlib.Path.cwd() / _log_config.get(LogCfgFields.OUTPUT.FILE.PATH)
+        pathlib.Path.mkdir(_log_parent_directory, exist_ok=True)
+        pathlib.Path.mkdir(_log_parent_directory / f"mumimo_{version()}/", exist_ok=True)
+        _log_file_handler = get_file_handler()
+        if _log_file_handler is not None:
+            _logger.root.addHandler(_log_file_handler)
+    if _log_console_handler is not None:
+        _console_handler = get_console_handler()
+        if _console_handler is not None:
+            _logger.root.removeHandler(_log_console_handler)
+            _logger.root.addHandler(_console_handler)
+            _log_console_handler = _console_handler
+    return True
+
+
 def get_console_handler() -> Optional[logging.StreamHandler]:
     _log_config = settings.configs.get_log_config()
     if _log_config is None:
@@ -1,10 +1,18 @@
 import asyncio
 import logging
+import signal
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from .constants import MumimoCfgFields, SysArgs
 from .exceptions import ServiceError
+from .lib.server_context import ServerContext
 from .murmur_connection import MurmurConnection
+from .services.config_reload_service import ConfigReloadService
+from .services.config_save_service import ConfigSaveService
+from .services.database_transfer_service import DatabaseTransferService
 from .services.init_services.mumimo_init_service import MumimoInitService
+from .services.server_host_service import ServerHostService
+from .services.supervisor_service import PRIMARY_SERVER_NAME, SupervisorService, WorkerStatusReporter
 from .settings import settings
 from .utils import connection_utils, mumble_utils
 
@@ -16,15 +24,33 @@ logger = logging.getLogger(__name__)
 
 class MumimoService:
     _murmur_connection_instance: Optional[MurmurConnection]
+    _shutdown_future: Optional["asyncio.Future[None]"] = None
+    _sys_args: Dict[str, Any] = {}
+    _status_queue: Optional[Any] = None
+    _status_reporter: Optional[WorkerStatusReporter] = None
+    _supervisor_service: Optional[SupervisorService] = None
+    _worker_context: Optional[ServerContext] = None
+    _config_reload_service: Optional[ConfigReloadService] = None
 
-    def __init__(self, sys_args: Dict[str, str]) -> None:
+    def __init__(self, sys_args: Dict[str, str], status_queue: Optional[Any] = None) -> None:
+        self._sys_args = sys_args
+        self._status_queue = status_queue
         asyncio.run(self._setup(sys_args))
+        # The supervisor runs outside of the event loop so that worker processes are not forked from a running loop.
+        if self._supervisor_service is not None:
+            self._supervisor_service.run()
 
     async def _setup(self, sys_args: Dict[str, str]) -> None:
         if not connection_utils.is_supported_platform():
             logger.warning("Mumimo is only supported for Linux and MacOS systems. You may run into unexpected issues on Windows and other systems.")
         logger.info("Initializing Mumimo client...")
         _mumimo_init_service: MumimoInitService = MumimoInitService(sys_args)
+        if sys_args.get(SysArgs.SYS_DB_EXPORT) or sys_args.get(SysArgs.SYS_DB_IMPORT):
+            await self.transfer_database(_mumimo_init_service, sys_args)
+            return
+        if sys_args.get(SysArgs.SYS_SUPERVISE):
+            self._supervisor_service = await self.initialize_supervisor(_mumimo_init_service)
+            return
         await _mumimo_init_service.initialize()
         _connection_params = await _mumimo_init_service.get_connection_parameters()
         if not _connection_params:
@@ -32,8 +58,58 @@ class MumimoService:
                 "Unable to retrieve client connection parameters: attempted to retrieve connection parameters before initializing client settings.",
                 logger=logger,
             )
+        _worker_server: Optional[str] = sys_args.get(SysArgs.SYS_WORKER_SERVER)
+        if _worker_server and _worker_server != PRIMARY_SERVER_NAME:
+            _connection_params = self._select_worker_server(_worker_server, _connection_params)
         await self.initialize_connection(_connection_params)
 
+    async def initialize_supervisor(self, init_service: MumimoInitService) -> SupervisorService:
+        _db_service = await init_service.initialize_for_supervisor()
+        try:
+            _connection_params = await init_service.get_connection_parameters()
+            _server_names = [PRIMARY_SERVER_NAME] + [context.name for context in ServerHostService(_connection_params).load_servers()]
+        finally:
+            await _db_service.close(clean=True)
+        _cfg = settings.configs.get_mumimo_config()
+        if _cfg is None:
+            raise ServiceError("Unable to initialize the supervisor: the mumimo config could not be retrieved.", logger=logger)
+        logger.info(f"Supervising {len(_server_names)} worker processes: {', '.join(_server_names)}")
+        return SupervisorService(
+            self._sys_args,
+            _server_names,
+            health_interval=_cfg.get(MumimoCfgFields.SETTINGS.SERVERS.SUPERVISOR_HEALTH_INTERVAL),
+            restart_base_delay=_cfg.get(MumimoCfgFields.SETTINGS.SERVERS.SUPERVISOR_RESTART_BASE_DELAY),
+            restart_max_delay=_cfg.get(MumimoCfgFields.SETTINGS.SERVERS.SUPERVISOR_RESTART_MAX_DELAY),
+        )
+
+    def _select_worker_server(self, server_name: str, connection_params: Dict[str, Any]) -> Dict[str, Any]:
+        for _context in ServerHostService(connection_params).load_servers():
+            if _context.name != server_name:
+                continue
+            _cfg = settings.configs.get_mumimo_config()
+            if _cfg is not None:
+                settings.configs.set_mumimo_config(_context.apply_config_overrides(_cfg))
+            self._worker_context = _context
+            return _context.connection_params
+        raise ServiceError(f"Unable to start worker: the server '{server_name}' is not configured.", logger=logger)
+
+    async def transfer_database(self, init_service: MumimoInitService, sys_args: Dict[str, Any]) -> None:
+        _db_service = await init_service.initialize_for_transfer()
+        try:
+            _transfer_service = DatabaseTransferService(_db_service.engine, sys_args.get(SysArgs.SYS_DB_BATCH_SIZE))
+            _export_path = sys_args.get(SysArgs.SYS_DB_EXPORT)
+            if _export_path:
+                logger.info(f"Exporting database tables to '{_export_path}'...")
+                await _transfer_service.export_tables(_export_path)
+                logger.info("Database export complete.")
+            _import_path = sys_args.get(SysArgs.SYS_DB_IMPORT)
+            if _import_path:
+                logger.info(f"Importing database tables from '{_import_path}'...")
+                await _transfer_service.import_tables(_import_path)
+                logger.info("Database import complete.")
+        finally:
+            await _db_service.close(clean=True)
+
     async def initialize_connection(self, connection_params: Dict[str, Any]) -> None:
         logger.info("Establishing Murmur connectivity...")
         self._murmur_connection_instance = MurmurConnection()
@@ -49,15 +125,84 @@ class MumimoService:
                 logger.info("Established Murmur connectivity.")
                 logger.info("Mumimo client initialized.")
                 await self._murmur_connection_instance._async_post_connection_actions()
+                _worker_server: Optional[str] = self._sys_args.get(SysArgs.SYS_WORKER_SERVER)
+                if _worker_server:
+                    self._start_status_reporter(_worker_server)
+                else:
+                    await self.initialize_hosted_servers(connection_params)
+                self._start_config_save_service()
+                self._start_config_reload_service()
                 await self._wait_for_interrupt()
             else:
                 logger.error("Failed to establish Murmur connectivity.")
         else:
             logger.error("Failed to initialize Mumimo connection instance singleton.")
 
+    async def initialize_hosted_servers(self, connection_params: Dict[str, Any]) -> None:
+        _host_service = ServerHostService(connection_params)
+        _contexts = _host_service.load_servers()
+        if _contexts:
+            await _host_service.start_servers(_contexts)
+
+    @staticmethod
+    def _start_config_save_service() -> None:
+        _config_save_service = ConfigSaveService()
+        _config_save_service.start()
+        settings.configs.set_config_save_service(_config_save_service)
+
+    def _start_config_reload_service(self) -> None:
+        _cfg = settings.configs.get_mumimo_config()
+        if _cfg is None or _cfg.get(MumimoCfgFields.SETTINGS.RELOAD.ENABLE) is False:
+            return
+        self._config_reload_service = ConfigReloadService(
+            _cfg.get(MumimoCfgFields.SETTINGS.RELOAD.INTERVAL),
+            worker_server=self._worker_context,
+            sys_args=self._sys_args,
+        )
+        self._config_reload_service.start()
+
+    def _start_status_reporter(self, server_name: str) -> None:
+        if self._status_queue is None:
+            return
+        self._status_reporter = WorkerStatusReporter(server_name, self._status_queue, WorkerStatusReporter.DEFAULT_INTERVAL)
+        self._status_reporter.start()
+
+    def request_shutdown(self) -> None:
+        # Safe to call from any thread, including pymumble callbacks.
+        if self._shutdown_future is None:
+            return
+        self._shutdown_future.get_loop().call_soon_threadsafe(self._resolve_shutdown)
+
+    def _resolve_shutdown(self) -> None:
+        if self._shutdown_future is not None and not self._shutdown_future.done():
+            self._shutdown_future.set_result(None)
+
+    def _add_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
+        for _signal in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(_signal, self._resolve_shutdown)
+            except (NotImplementedError, RuntimeError):
+                # Signal handlers are unavailable on Windows and outside the main thread; keyboard interrupts cancel the wait instead.
+                logger.debug(f"Unable to register a shutdown handler for signal: {_signal.name}")
+
+    def _remove_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
+        for _signal in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(_signal)
+            except (NotImplementedError, RuntimeError):
+                pass
+
     async def _wait_for_interrupt(self) -> None:
+        _loop = asyncio.get_running_loop()
+        self._shutdown_future = _loop.create_future()
+        self._add_signal_handlers(_loop)
         try:
-            while True:
-                await asyncio.sleep(0.1)
+            await self._shutdown_future
         except asyncio.exceptions.CancelledError:
-            await mumble_utils.Management.exit_server()
+            pass
+        finally:
+            self._remove_signal_handlers(_loop)
+            self._shutdown_future = None
+        if self._config_reload_service is not None:
+            self._config_reload_service.stop()
+        await mumble_utils.Management.exit_server()
@@ -1,36 +1,101 @@
+import asyncio
+import fnmatch
 import logging
+import random
 import threading
 import time
-from typing import Dict, Optional, Union, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Union, List
 
 
 import pymumble_py3 as pymumble
 from pymumble_py3.users import User
-from pymumble_py3.constants import PYMUMBLE_CLBK_TEXTMESSAGERECEIVED, PYMUMBLE_CLBK_CONNECTED, PYMUMBLE_CLBK_USERCREATED, PYMUMBLE_CLBK_USERREMOVED
+from pymumble_py3.constants import (
+    PYMUMBLE_CLBK_TEXTMESSAGERECEIVED,
+    PYMUMBLE_CLBK_CONNECTED,
+    PYMUMBLE_CLBK_DISCONNECTED,
+    PYMUMBLE_CLBK_USERCREATED,
+    PYMUMBLE_CLBK_USERUPDATED,
+    PYMUMBLE_CLBK_USERREMOVED,
+    PYMUMBLE_CLBK_CHANNELCREATED,
+    PYMUMBLE_CLBK_CHANNELUPDATED,
+    PYMUMBLE_CLBK_CHANNELREMOVED,
+    PYMUMBLE_CLBK_SOUNDRECEIVED,
+    PYMUMBLE_CONN_STATE_CONNECTED,
+)
 from pymumble_py3.errors import ConnectionRejectedError
 
 from .client_state import ClientState
 from .services.cmd_processing_service import CommandProcessingService
-from .constants import VERBOSE_MAX, SysArgs, MumimoCfgFields
+from .services.event_bus_service import EventBusService
+from .services.loop_rate_service import LoopRateService
+from .services.outbound_message_service import OutboundMessageService
+from .services.text_message_service import TextMessageService
+from .services.user_persistence_service import UserPersistenceService
+from .constants import VERBOSE_MAX, SysArgs
 from .exceptions import ConnectivityError, ServiceError
+from .lib.server_context import bind_current_server, run_in_current_context
 from .lib.singleton import singleton
 from .settings import settings
 from .utils.args_validators import SystemArgumentsValidator
 from .utils import mumble_utils
 from .version import version
 
+if TYPE_CHECKING:
+    from .lib.frameworks.plugins.event_dispatcher import PluginEventDispatcher
+
 logger = logging.getLogger(__name__)
 
 
-@singleton
-class MurmurConnection:
+class MurmurConnectionBase:
     _thread: Optional[threading.Thread] = None
-    _thread_stop_event: threading.Event = threading.Event()
+    _thread_stop_event: threading.Event
 
     _connection_instance: Optional[pymumble.Mumble] = None
     _connection_params: Optional[Dict[str, Union[str, bool]]] = None
     _is_connected: bool = False
 
+    _reconnect_thread: Optional[threading.Thread] = None
+    _reconnect_lock: threading.Lock
+    _reconnect_count: int = 0
+    _last_reconnect_attempts: int = 0
+    _last_reconnect_duration: Optional[float] = None
+    _total_reconnect_duration: float = 0.0
+
+    _listening_lock: threading.Lock
+    _listening_channels: Set[int]
+    _listening_session: Optional[int] = None
+
+    DEFAULT_RECONNECT_BASE_DELAY: float = 1.0
+    DEFAULT_RECONNECT_MAX_DELAY: float = 60.0
+    DEFAULT_RECONNECT_MAX_ATTEMPTS: int = 0
+    # Reconnects retry forever by default, so the backoff stops doubling long before the delay could overflow a float.
+    MAX_RECONNECT_BACKOFF_EXPONENT: int = 30
+    # A reconnect attempt in flight may be waiting on the server, so stopping only waits this long for it.
+    RECONNECT_JOIN_TIMEOUT: float = 5.0
+
+    EVENT_BUS_CALLBACKS: Tuple[str, ...] = (
+        PYMUMBLE_CLBK_TEXTMESSAGERECEIVED,
+        PYMUMBLE_CLBK_USERCREATED,
+        PYMUMBLE_CLBK_USERUPDATED,
+        PYMUMBLE_CLBK_USERREMOVED,
+        PYMUMBLE_CLBK_CHANNELCREATED,
+        PYMUMBLE_CLBK_CHANNELUPDATED,
+        PYMUMBLE_CLBK_CHANNELREMOVED,
+    )
+    # User and channel events update the same indexes, so they share a lane to be handled in the order the server sent them.
+    EVENT_BUS_STATE_LANE: str = "state"
+    # Commands ran concurrently when pymumble started a thread per text message, so a slow command should not hold up the others.
+    EVENT_BUS_TEXT_WORKERS: int = 4
+
+    def __init__(self) -> None:
+        # The singleton subclass runs '__init__' on every instantiation, so the per-instance state is only created once.
+        if "_thread_stop_event" in self.__dict__:
+            return
+        self._thread_stop_event = threading.Event()
+        self._reconnect_lock = threading.Lock()
+        self._listening_lock = threading.Lock()
+        self._listening_channels = set()
+
     @property
     def connection_instance(self) -> Optional[pymumble.Mumble]:
         return self._connection_instance
@@ -39,6 +104,20 @@ class MurmurConnection:
     def is_connected(self) -> bool:
         return self._is_connected
 
+    @property
+    def listening_channels(self) -> Set[int]:
+        with self._listening_lock:
+            return set(self._listening_channels)
+
+    @property
+    def reconnect_metrics(self) -> Dict[str, Any]:
+        return {
+            "reconnect_count": self._reconnect_count,
+            "last_attempts": self._last_reconnect_attempts,
+            "last_duration": self._last_reconnect_duration,
+            "total_duration": self._total_reconnect_duration,
+        }
+
     def setup(self, connection_params: Dict[str, Union[str, bool]]):
         if not connection_params:
             logger.warning("Connection parameters have not been provided during Murmur initialization.")
@@ -63,14 +142,16 @@ class MurmurConnection:
             certfile=self._connection_params.get(SysArgs.SYS_CERT),
             keyfile=self._connection_params.get(SysArgs.SYS_KEY),
             tokens=self._connection_params.get(SysArgs.SYS_TOKENS),
-            reconnect=bool(self._connection_params.get(SysArgs.SYS_RECONNECT, False)),
+            # Reconnects are supervised by this class with backoff, so pymumble must not retry on its own.
+            reconnect=False,
             debug=bool(int(self._connection_params.get(SysArgs.SYS_VERBOSE, False)) >= VERBOSE_MAX),
             stereo=True,
             client_type=1,
         )
         self._connection_instance.set_codec_profile("audio")
         self._connection_instance.set_receive_sound(True)
-        self._connection_instance.set_loop_rate(0.05)
+        self._get_loop_rate_service().attach(self._connection_instance)
+        self._get_text_message_service().attach(self._connection_instance)
 
         logger.debug("Murmur connection instance defined.")
         return self
@@ -91,34 +172,61 @@ class MurmurConnection:
 
     def start(self) -> bool:
         if self._is_connected and self._connection_instance:
-            if self._thread is None:
-                self._thread = threading.Thread(name="murmur-conn", target=self._loop, args=(self._thread_stop_event,))
-            else:
+            if self._thread is not None:
                 self._thread_stop_event.set()
                 self._thread.join()
-                self._thread = threading.Thread(name="murmur-conn", target=self._loop, args=(self._thread_stop_event,))
+            # The stop event is reused across restarts, so it must be cleared before the new thread waits on it.
+            self._thread_stop_event.clear()
+            self._thread = threading.Thread(name="murmur-conn", target=self._loop, args=(self._thread_stop_event,))
             logger.debug(f"Connectivity thread: [{self._thread.name}] initialized.")
             self._thread.start()
             logger.debug(f"Connectivity thread: [{self._thread.name} | {self._thread.ident}] started.")
+            # The server's message length limit is only known once connected, and may change after a reconnect.
+            _outbound_message_service: OutboundMessageService = self._get_outbound_message_service()
+            _outbound_message_service.set_max_merge_length(self._connection_instance.get_max_message_length())
+            _outbound_message_service.start()
             return True
         return False
 
     def stop(self) -> bool:
         if self._connection_instance is not None:
+            # Setting the stop event first also tells the disconnect callback not to schedule a reconnect.
+            self._thread_stop_event.set()
+            self._stop_reconnect()
+            _outbound_message_service: Optional[OutboundMessageService] = settings.connection.get_outbound_message_service()
+            if _outbound_message_service is not None:
+                _outbound_message_service.stop()
             if self._thread is not None:
                 logger.debug(f"Connectivity thread: [{self._thread.name} | {self._thread.ident}] closing...")
-                self._thread_stop_event.set()
                 self._thread.join()
                 logger.debug(f"Connectivity thread: [{self._thread.name}] closed.")
+            self._close_connection_instance()
+            self._thread = None
+            # Stopped after the connection is gone, so queued events are still handled but can no longer send anything.
+            _event_bus: Optional[EventBusService] = settings.connection.get_event_bus_service()
+            if _event_bus is not None:
+                _event_bus.stop()
+            return True
+        return False
+
+    def _stop_reconnect(self) -> None:
+        # The stop event wakes a reconnect waiting out its backoff, so only an attempt in flight can hold this up.
+        _reconnect_thread: Optional[threading.Thread] = self._reconnect_thread
+        if _reconnect_thread is None or _reconnect_thread is threading.current_thread():
+            return
+        _reconnect_thread.join(self.RECONNECT_JOIN_TIMEOUT)
+        if _reconnect_thread.is_alive():
+            logger.warning("Reconnect thread did not finish in time: its connection is closed once the attempt completes.")
+        self._reconnect_thread = None
+
+    def _close_connection_instance(self) -> None:
+        if self._connection_instance is not None:
             try:
                 self._connection_instance.stop()
             except AttributeError:
                 logger.debug("Connection instance closed prematurely.")
-            self._is_connected = False
-            self._connection_instance = None
-            self._thread = None
-            return True
-        return False
+        self._is_connected = False
+        self._connection_instance = None
 
     def _connect_instance(self) -> None:
         if self._connection_instance is None:
@@ -126,9 +234,11 @@ class MurmurConnection:
         try:
             self._connection_instance.start()
             self._connection_instance.is_ready()
-            self._is_connected = True
         except ConnectionRejectedError as err:
             raise ConnectivityError(str(err), logger) from err
+        if self._connection_instance.connected != PYMUMBLE_CONN_STATE_CONNECTED:
+            raise ConnectivityError("Unable to connect: the murmur server could not be reached or rejected the connection.", logger=logger)
+        self._is_connected = True
 
     def _post_connection_actions(self) -> None:
         if self._connection_instance is None:
@@ -139,35 +249,103 @@ class MurmurConnection:
         if _client_state is None:
             _client_state = ClientState(self._connection_instance)
             settings.state.set_client_state(_client_state)
+        self._register_callbacks(_client_state)
+        self._configure_client(_client_state)
+
+    def _register_callbacks(self, client_state: ClientState) -> None:
+        if self._connection_instance is None:
+            raise ServiceError("Unable to register murmur callbacks: there is no active murmur connection.", logger=logger)
+        client_state.set_connection_instance(self._connection_instance)
+        # Start the user persistence service so join events are written to the database in batches.
+        _user_service: Optional[UserPersistenceService] = settings.database.get_user_persistence_service()
+        if _user_service is None:
+            _snapshot = settings.configs.get_config_snapshot()
+            _batch_window = _snapshot.database.user_batch_window if _snapshot is not None else None
+            _user_service = UserPersistenceService(batch_window=_batch_window)
+            settings.database.set_user_persistence_service(_user_service)
+        _user_service.start()
+        # User, channel and text message events are dispatched from the event bus, so slow handlers never stall the pymumble thread.
+        _event_bus: EventBusService = self._get_event_bus_service()
+        _event_bus.clear_subscribers()
+        for _callback_type in self.EVENT_BUS_CALLBACKS:
+            self._connection_instance.callbacks.set_callback(_callback_type, _event_bus.publisher(_callback_type))
+        _event_bus.start()
         # Set on_server_connect callback in client state.
-        self._connection_instance.callbacks.set_callback(PYMUMBLE_CLBK_CONNECTED, _client_state.server_properties.on_server_connect)
-        logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_CONNECTED}-{_client_state.server_properties.on_server_connect.__name__}")
+        self._connection_instance.callbacks.set_callback(
+            PYMUMBLE_CLBK_CONNECTED, bind_current_server(client_state.server_properties.on_server_connect)
+        )
+        logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_CONNECTED}-{client_state.server_properties.on_server_connect.__name__}")
         # Set on_user_created callback in client state.
-        self._connection_instance.callbacks.set_callback(PYMUMBLE_CLBK_USERCREATED, _client_state.server_properties.on_user_created)
-        logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_USERCREATED}-{_client_state.server_properties.on_user_created.__name__}")
+        _event_bus.set_subscriber(PYMUMBLE_CLBK_USERCREATED, bind_current_server(client_state.server_properties.on_user_created))
+        logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_USERCREATED}-{client_state.server_properties.on_user_created.__name__}")
         # Set on_user_removed callback in client state.
-        self._connection_instance.callbacks.set_callback(PYMUMBLE_CLBK_USERREMOVED, _client_state.server_properties.on_user_removed)
-        logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_USERREMOVED}-{_client_state.server_properties.on_user_removed.__name__}")
+        _event_bus.set_subscriber(PYMUMBLE_CLBK_USERREMOVED, bind_current_server(client_state.server_properties.on_user_removed))
+        logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_USERREMOVED}-{client_state.server_properties.on_user_removed.__name__}")
+        # Keep the user and channel indexes in client state up to date.
+        _index_callbacks: Dict[str, Any] = {
+            PYMUMBLE_CLBK_USERUPDATED: client_state.server_properties.on_user_updated,
+            PYMUMBLE_CLBK_CHANNELCREATED: client_state.server_properties.on_channel_created,
+            PYMUMBLE_CLBK_CHANNELUPDATED: client_state.server_properties.on_channel_updated,
+            PYMUMBLE_CLBK_CHANNELREMOVED: client_state.server_properties.on_channel_removed,
+        }
+        for _callback_type, _callback in _index_callbacks.items():
+            _event_bus.set_subscriber(_callback_type, bind_current_server(_callback))
+            logger.debug(f"Added murmur callback: {_callback_type}-{_callback.__name__}")
+        # Listening channels are updated after the indexes, so channel paths already reflect the change.
+        _listening_callbacks: Dict[str, Any] = {
+            PYMUMBLE_CLBK_CHANNELCREATED: self._on_listening_channel_created,
+            PYMUMBLE_CLBK_CHANNELUPDATED: self._on_listening_channel_updated,
+            PYMUMBLE_CLBK_CHANNELREMOVED: self._on_listening_channel_removed,
+        }
+        for _callback_type, _callback in _listening_callbacks.items():
+            _event_bus.add_subscriber(_callback_type, bind_current_server(_callback))
+            logger.debug(f"Added murmur callback: {_callback_type}-{_callback.__name__}")
+
+        # Re-hook the adaptive loop rate whenever pymumble rebuilds its connection state.
+        _loop_rate_service: LoopRateService = self._get_loop_rate_service()
+        _loop_rate_service.attach(self._connection_instance)
+        self._connection_instance.callbacks.add_callback(PYMUMBLE_CLBK_CONNECTED, bind_current_server(_loop_rate_service.on_connected))
+        logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_CONNECTED}-{_loop_rate_service.on_connected.__name__}")
 
         # Save the command processing service to the settings and set command processing mumble callbacks.
         _cmd_service: Optional[CommandProcessingService] = settings.commands.services.get_cmd_processing_service()
         if _cmd_service is None:
             _cmd_service = CommandProcessingService(self._connection_instance)
             settings.commands.services.set_cmd_processing_service(_cmd_service)
-        self._connection_instance.callbacks.set_callback(PYMUMBLE_CLBK_TEXTMESSAGERECEIVED, _cmd_service.process_cmd)
+        else:
+            _cmd_service.set_connection_instance(self._connection_instance)
+        _event_bus.set_subscriber(PYMUMBLE_CLBK_TEXTMESSAGERECEIVED, bind_current_server(_cmd_service.process_cmd))
         logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_TEXTMESSAGERECEIVED}-{_cmd_service.process_cmd.__name__}")
 
-        # Listen to all channels:
+        # Plugins receive the server events they subscribe to after the client state has handled them.
+        _event_dispatcher: Optional["PluginEventDispatcher"] = settings.plugins.get_event_dispatcher()
+        if _event_dispatcher is not None:
+            for _callback_type in _event_dispatcher.get_callback_types():
+                if _callback_type not in self.EVENT_BUS_CALLBACKS:
+                    self._connection_instance.callbacks.set_callback(_callback_type, _event_bus.publisher(_callback_type))
+            _event_dispatcher.attach(_event_bus)
+            logger.debug(f"Added plugin event subscriptions: [{', '.join(_event_dispatcher.get_callback_types())}]")
+
+        # Set the disconnect callback to supervise reconnects.
+        self._connection_instance.callbacks.set_callback(PYMUMBLE_CLBK_DISCONNECTED, bind_current_server(self._on_disconnected))
+        logger.debug(f"Added murmur callback: {PYMUMBLE_CLBK_DISCONNECTED}-{self._on_disconnected.__name__}")
+
+    def _configure_client(self, client_state: ClientState) -> None:
+        if self._connection_instance is None:
+            raise ServiceError("Unable to configure the client: there is no active murmur connection.", logger=logger)
+        # Callbacks are registered after pymumble has synced the server, so the indexes start from a full snapshot.
+        client_state.server_properties.state.rebuild_indexes(
+            list(self._connection_instance.users.values()), list(self._connection_instance.channels.values())
+        )
+
         _user: Optional["User"] = self._connection_instance.users.myself
         if _user:
-            _channels = []
-            for _, channel in enumerate(self._connection_instance.channels.items()):
-                _channels.append(channel[1]["channel_id"])
-            _user.add_listening_channels(_channels)
+            # Listen to all channels that are not excluded in the config:
+            self._sync_listening_channels(client_state)
             # Set bot client comment
             _user.comment(f"Mumimo - v{version()}")
             # Mute the bot on server join
-            _client_state.audio_properties.mute()
+            client_state.audio_properties.mute()
 
             # _user.myself.register() - don't implement yet
 
@@ -181,24 +359,289 @@ class MurmurConnection:
         _inst = self._connection_instance
         if not _inst:
             raise ServiceError("Failed async post connection actions: mumble instance not found.", logger=logger)
-        _cfg = settings.configs.get_mumimo_config()
-        if not _cfg:
+        _snapshot = settings.configs.get_config_snapshot()
+        if not _snapshot:
             raise ServiceError("Failed async post connection actions: mumimo config not found.", logger=logger)
-        _bot_name = _cfg.get(MumimoCfgFields.SETTINGS.CONNECTION.NAME, None)
+        _bot_name = _snapshot.connection.name
         if not _bot_name:
             raise ServiceError("Failed async post connection actions: mumimo bot name not found in config.", logger=logger)
 
         _all_users: List["User"] = [user for id, user in _inst.users.items() if user["name"] != _bot_name]
-        for _user in _all_users:
-            await mumble_utils.Management.UserManagement.add_user(_user)
+        await mumble_utils.Management.UserManagement.add_users(_all_users)
 
         logger.debug("Asynchronous post connection actions complete.")
 
-    def _loop(self, stop_event: threading.Event) -> None:
-        while True:
+    def _sync_listening_channels(self, client_state: ClientState) -> None:
+        _user: Optional["User"] = self._connection_instance.users.myself if self._connection_instance is not None else None
+        if _user is None:
+            return
+        _exclusions: List[str] = self._get_listening_exclusions()
+        _server_state = client_state.server_properties.state
+        _wanted: Set[int] = {
+            channel_id for channel_id in _server_state.channels if not self._is_listening_excluded(channel_id, client_state, _exclusions)
+        }
+        with self._listening_lock:
+            if _user["session"] != self._listening_session:
+                # Listening channels belong to the server session, so a new session starts without any and gets the whole set in one message.
+                self._listening_session = _user["session"]
+                self._listening_channels = set()
+            _added: List[int] = sorted(_wanted - self._listening_channels)
+            _removed: List[int] = sorted(self._listening_channels - _wanted)
+            self._listening_channels = _wanted
+        if _added:
+            _user.add_listening_channels(_added)
+        if _removed:
+            _user.remove_listening_channels(_removed)
+        logger.debug(
+            f"Listening to {len(_wanted)} channel(s): {len(_added)} added, {len(_removed)} removed, "
+            f"{len(_server_state.channels) - len(_wanted)} excluded."
+        )
+
+    def _on_listening_channel_created(self, channel: Dict[str, Any]) -> None:
+        self._update_listening_channels([channel["channel_id"]])
+
+    def _on_listening_channel_updated(self, channel: Dict[str, Any], actions: Dict[str, Any]) -> None:
+        if "name" not in actions and "parent" not in actions:
+            return
+        # A renamed or moved channel changes the path of every channel below it, so the whole subtree is checked again.
+        _client_state: Optional[ClientState] = settings.state.get_client_state()
+        if _client_state is None:
+            return
+        self._update_listening_channels(_client_state.server_properties.state.get_subtree_channel_ids(channel["channel_id"]))
+
+    def _on_listening_channel_removed(self, channel: Dict[str, Any]) -> None:
+        # The server stops the listener of a removed channel on its own, so only the tracked set needs updating.
+        with self._listening_lock:
+            self._listening_channels.discard(channel["channel_id"])
+
+    def _update_listening_channels(self, channel_ids: List[int]) -> None:
+        _client_state: Optional[ClientState] = settings.state.get_client_state()
+        _user: Optional["User"] = self._connection_instance.users.myself if self._connection_instance is not None else None
+        if _client_state is None or _user is None or not self._is_connected:
+            return
+        _exclusions: List[str] = self._get_listening_exclusions()
+        _added: List[int] = []
+        _removed: List[int] = []
+        with self._listening_lock:
+            if _user["session"] != self._listening_session:
+                return
+            for _channel_id in channel_ids:
+                _excluded: bool = self._is_listening_excluded(_channel_id, _client_state, _exclusions)
+                if not _excluded and _channel_id not in self._listening_channels:
+                    self._listening_channels.add(_channel_id)
+                    _added.append(_channel_id)
+                elif _excluded and _channel_id in self._listening_channels:
+                    self._listening_channels.discard(_channel_id)
+                    _removed.append(_channel_id)
+        # Sent outside the lock: outside the pymumble thread, commands wait until the pymumble thread has sent them.
+        if _added:
+            _user.add_listening_channels(_added)
+        if _removed:
+            _user.remove_listening_channels(_removed)
+
+    @staticmethod
+    def _is_listening_excluded(channel_id: int, client_state: ClientState, exclusions: List[str]) -> bool:
+        if not exclusions:
+            return False
+        _server_state = client_state.server_properties.state
+        _name: Optional[str] = _server_state.channels.get(channel_id)
+        _path: Optional[str] = _server_state.get_channel_path(channel_id)
+        for _pattern in exclusions:
+            if _name is not None and fnmatch.fnmatchcase(_name, _pattern):
+                return True
+            if _path is not None and fnmatch.fnmatchcase(_path, _pattern):
+                return True
+        return False
+
+    def _get_listening_exclusions(self) -> List[str]:
+        _snapshot = settings.configs.get_config_snapshot()
+        if _snapshot is None:
+            return []
+        return list(_snapshot.connection.listening_channel_exclusions)
+
+    def _on_disconnected(self, *args) -> None:
+        # Called from the pymumble thread: never block here, the reconnect runs in its own thread.
+        if self._thread_stop_event.is_set() or not self._is_connected:
+            return
+        self._is_connected = False
+        if self._connection_params is None or not bool(self._connection_params.get(SysArgs.SYS_RECONNECT, False)):
+            logger.warning("Disconnected from the Murmur server: auto-reconnect is disabled.")
+            return
+        with self._reconnect_lock:
+            if self._reconnect_thread is not None and self._reconnect_thread.is_alive():
+                return
+            logger.warning("Disconnected from the Murmur server: attempting to reconnect...")
+            self._reconnect_thread = threading.Thread(
+                name="murmur-reconnect", target=run_in_current_context(self._reconnect), args=(self._thread_stop_event,), daemon=True
+            )
+            self._reconnect_thread.start()
+
+    def _reconnect(self, stop_event: threading.Event) -> bool:
+        _base_delay, _max_delay, _max_attempts = self._get_reconnect_settings()
+        _start: float = time.monotonic()
+        _attempt: int = 0
+        while not stop_event.is_set():
+            if _max_attempts > 0 and _attempt >= _max_attempts:
+                logger.error(f"Unable to reconnect to the Murmur server after {_attempt} attempt(s).")
+                return False
+            _delay: float = self._get_backoff_delay(_attempt, _base_delay, _max_delay)
+            logger.info(f"Reconnecting to the Murmur server in {_delay:.2f}s (attempt {_attempt + 1})...")
+            if stop_event.wait(_delay):
+                return False
+            _attempt += 1
+            try:
+                self.ready()
+                # pymumble stops once the thread that created it exits, so the new connection is bound to the connectivity thread instead.
+                if self._connection_instance is not None:
+                    self._connection_instance.parent_thread = self._get_parent_thread()
+                self._connect_instance()
+            except ConnectivityError:
+                logger.warning(f"Reconnect attempt {_attempt} failed.")
+                continue
             if stop_event.is_set():
-                break
-            time.sleep(0.1)
+                # The connection was stopped while this attempt was in flight, so the new instance is closed instead of resumed.
+                self._close_connection_instance()
+                return False
+            self._resync_state()
+            _duration: float = time.monotonic() - _start
+            self._reconnect_count += 1
+            self._last_reconnect_attempts = _attempt
+            self._last_reconnect_duration = _duration
+            self._total_reconnect_duration += _duration
+            logger.info(f"Reconnected to the Murmur server in {_duration:.2f}s after {_attempt} attempt(s).")
+            return True
+        return False
+
+    def _resync_state(self) -> None:
+        # Apply only the differences between the new server session and the cached client state.
+        if self._connection_instance is None:
+            raise ServiceError("Unable to resynchronize the client state: there is no active murmur connection.", logger=logger)
+        _client_state: Optional[ClientState] = settings.state.get_client_state()
+        if _client_state is None:
+            self._post_connection_actions()
+            return
+        _server_state = _client_state.server_properties.state
+        _cached_channels: Dict[int, str] = dict(_server_state.channels)
+        self._register_callbacks(_client_state)
+        self._configure_client(_client_state)
+
+        _myself_session = self._connection_instance.users.myself_session
+        _server_users: Dict[str, "User"] = {
+            user["name"]: user for user in self._connection_instance.users.values() if user["session"] != _myself_session
+        }
+        _joined_users: List["User"] = [user for name, user in _server_users.items() if name not in _server_state.users]
+        _left_users: List[str] = [name for name in _server_state.users.keys() if name not in _server_users]
+        for _name in _left_users:
+            _server_state.remove_user(_name)
+        for _name, _user in _server_users.items():
+            if _name in _server_state.users:
+                # Users that stayed online only need their user object swapped for the one from the new session.
+                _server_state.add_user(_user)
+        if _joined_users:
+            _user_service: Optional[UserPersistenceService] = settings.database.get_user_persistence_service()
+            if _user_service is not None and _user_service.is_running:
+                for _user in _joined_users:
+                    _user_service.user_joined(_user)
+            else:
+                asyncio.run(mumble_utils.Management.UserManagement.add_users(_joined_users))
+
+        _server_channels: Dict[int, str] = _server_state.channels
+        _added_channels = [channel_id for channel_id in _server_channels if channel_id not in _cached_channels]
+        _removed_channels = [channel_id for channel_id in _cached_channels if channel_id not in _server_channels]
+        _renamed_channels = [
+            channel_id for channel_id, name in _server_channels.items() if channel_id in _cached_channels and _cached_channels[channel_id] != name
+        ]
+        logger.info(
+            f"Resynchronized client state: {len(_joined_users)} user(s) joined, {len(_left_users)} user(s) left, "
+            f"{len(_added_channels)} channel(s) added, {len(_removed_channels)} channel(s) removed, {len(_renamed_channels)} channel(s) renamed."
+        )
+
+    def _get_reconnect_settings(self) -> Tuple[float, float, int]:
+        _base_delay: float = self.DEFAULT_RECONNECT_BASE_DELAY
+        _max_delay: float = self.DEFAULT_RECONNECT_MAX_DELAY
+        _max_attempts: int = self.DEFAULT_RECONNECT_MAX_ATTEMPTS
+        _snapshot = settings.configs.get_config_snapshot()
+        if _snapshot is not None:
+            _connection = _snapshot.connection
+            _base_delay = _connection.reconnect_base_delay if _connection.reconnect_base_delay is not None else _base_delay
+            _max_delay = _connection.reconnect_max_delay if _connection.reconnect_max_delay is not None else _max_delay
+            _max_attempts = _connection.reconnect_max_attempts if _connection.reconnect_max_attempts is not None else _max_attempts
+        return max(_base_delay, 0.0), max(_max_delay, _base_delay), max(_max_attempts, 0)
+
+    def _get_parent_thread(self) -> threading.Thread:
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        return threading.main_thread()
+
+    @classmethod
+    def _get_backoff_delay(cls, attempt: int, base_delay: float, max_delay: float) -> float:
+        _delay: float = min(max_delay, base_delay * (2 ** min(attempt, cls.MAX_RECONNECT_BACKOFF_EXPONENT)))
+        # Half of the delay is randomized so that many clients dropped by the same outage do not reconnect in lockstep.
+        return _delay / 2 + random.uniform(0, _delay / 2)
+
+    def _get_loop_rate_service(self) -> LoopRateService:
+        _loop_rate_service: Optional[LoopRateService] = settings.connection.get_loop_rate_service()
+        if _loop_rate_service is None:
+            _snapshot = settings.configs.get_config_snapshot()
+            _rates: Dict[str, Optional[float]] = {"active_rate": None, "idle_rate": None, "idle_delay": None}
+            if _snapshot is not None:
+                _rates["active_rate"] = _snapshot.connection.loop_rate_active
+                _rates["idle_rate"] = _snapshot.connection.loop_rate_idle
+                _rates["idle_delay"] = _snapshot.connection.loop_rate_idle_delay
+            _loop_rate_service = LoopRateService(**_rates)
+            settings.connection.set_loop_rate_service(_loop_rate_service)
+        return _loop_rate_service
+
+    def _get_text_message_service(self) -> TextMessageService:
+        _text_message_service: Optional[TextMessageService] = settings.connection.get_text_message_service()
+        if _text_message_service is None:
+            _snapshot = settings.configs.get_config_snapshot()
+            _max_targets: Optional[int] = _snapshot.connection.text_message_max_targets if _snapshot is not None else None
+            _text_message_service = TextMessageService(max_targets=_max_targets)
+            settings.connection.set_text_message_service(_text_message_service)
+        return _text_message_service
+
+    def _get_outbound_message_service(self) -> OutboundMessageService:
+        _outbound_message_service: Optional[OutboundMessageService] = settings.connection.get_outbound_message_service()
+        if _outbound_message_service is None:
+            _snapshot = settings.configs.get_config_snapshot()
+            _limits: Dict[str, Optional[float]] = {"rate": None, "burst": None, "max_queue_size": None}
+            if _snapshot is not None:
+                _limits["rate"] = _snapshot.connection.message_rate_limit
+                _limits["burst"] = _snapshot.connection.message_burst
+                _limits["max_queue_size"] = _snapshot.connection.message_queue_size
+            _outbound_message_service = OutboundMessageService(mumble_utils.deliver_text_message, **_limits)  # type: ignore
+            settings.connection.set_outbound_message_service(_outbound_message_service)
+        return _outbound_message_service
+
+    def _get_event_bus_service(self) -> EventBusService:
+        _event_bus: Optional[EventBusService] = settings.connection.get_event_bus_service()
+        if _event_bus is None:
+            _snapshot = settings.configs.get_config_snapshot()
+            _max_queue_size: Optional[int] = None
+            _overload_policy: Optional[str] = None
+            if _snapshot is not None:
+                _max_queue_size = _snapshot.connection.event_queue_size
+                _overload_policy = _snapshot.connection.event_overload_policy
+            _lanes: Dict[str, str] = {
+                callback_type: self.EVENT_BUS_STATE_LANE
+                for callback_type in self.EVENT_BUS_CALLBACKS
+                if callback_type != PYMUMBLE_CLBK_TEXTMESSAGERECEIVED
+            }
+            _event_bus = EventBusService(
+                max_queue_size=_max_queue_size,
+                overload_policy=_overload_policy,
+                lanes=_lanes,
+            )
+            _event_bus.set_lane_options(PYMUMBLE_CLBK_TEXTMESSAGERECEIVED, workers=self.EVENT_BUS_TEXT_WORKERS)
+            # Audio arrives every few milliseconds while someone talks, so stale chunks are dropped instead of holding back the pymumble thread.
+            _event_bus.set_lane_options(PYMUMBLE_CLBK_SOUNDRECEIVED, overload_policy=EventBusService.OVERLOAD_DROP_OLDEST)
+            settings.connection.set_event_bus_service(_event_bus)
+        return _event_bus
+
+    def _loop(self, stop_event: threading.Event) -> None:
+        # Block until a stop is requested instead of polling, so an idle client never wakes this thread.
+        stop_event.wait()
 
     def _validate_sys_args(self, params: Dict[str, Union[str, bool]]) -> None:
         SystemArgumentsValidator.validate_host_param(params.get(SysArgs.SYS_HOST))  # type: ignore
@@ -210,3 +653,9 @@ class MurmurConnection:
         SystemArgumentsValidator.validate_tokens_param(params.get(SysArgs.SYS_TOKENS))  # type: ignore
         SystemArgumentsValidator.validate_auto_reconnect_param(params.get(SysArgs.SYS_RECONNECT))  # type: ignore
         SystemArgumentsValidator.validate_verbose_param(params.get(SysArgs.SYS_VERBOSE))  # type: ignore
+
+
+@singleton
+class MurmurConnection(MurmurConnectionBase):
+    # The connection for the primary server. Additional servers hosted in the same process use 'MurmurConnectionBase' instances.
+    pass
@@ -47,7 +47,7 @@ class Plugin(PluginBase):
         # !echo.channels=channel1,channel2 "hello, specified channels!"  -> Echoes the message to the specified channels.
         # !echo.user=username "hello, specified user!"  -> Echoes the message to the specified user.
         # !echo.users=username1,username2 "hello, specified users!"  -> Echoes the message to the specified users.
-        # !echo.broadcast "hello, everyone!"  -> Echoes the message to all channels in the server.
+        # !echo.broadcast "hello, everyone!"  -> Echoes the message to every channel in the server that has users in it.
         _parameters = self.verify_parameters(self.echo.__name__, data)
         if _parameters is None:
             return
@@ -71,6 +71,17 @@ class Plugin(PluginBase):
                 user_id=data.actor,
             )
 
+    @command()
+    def more(self, data: "Command") -> None:
+        # Example:
+        # !more  -> Shows the next page of a long output that was sent one page at a time.
+        if not GUIFramework.show_next_page(data.actor):
+            GUIFramework.gui(
+                f"'{data.command}' command: there are no more pages to show.",
+                target_users=mumble_utils.get_user_by_id(data.actor),
+                user_id=data.actor,
+            )
+
     @command(
         parameters=ParameterDefinitions.Move.get_definitions(),
         exclusive_parameters=ParameterDefinitions.Move.get_definitions(),
@@ -129,11 +140,10 @@ class Plugin(PluginBase):
         if not _theme_list:
             logger.error(f"[{LogOutputIdentifiers.PLUGINS_COMMANDS}]: '{data.command}' command error: the themes list could not be retrieved.")
             return
-        _msgs: List[str] = ["Available themes: "]
-        for idx, theme in enumerate(_theme_list):
-            _msgs.append(f"{idx+1}) {theme}")
-        GUIFramework.gui(
-            text=_msgs,
+        GUIFramework.gui_cached(
+            "core.themes.list",
+            (),
+            lambda: ["Available themes: "] + [f"{idx+1}) {theme}" for idx, theme in enumerate(_theme_list)],
             target_users=mumble_utils.get_user_by_id(data.actor),
         )
 
@@ -141,14 +151,11 @@ class Plugin(PluginBase):
         _new_theme = data.message.strip()
         _available_themes = theme_utils.list_themes()
         if not _new_theme or _new_theme not in _available_themes:
-            _msgs: List[str] = [
-                "Invalid theme. ",
-                "Here are the available themes to choose from: ",
-            ]
-            for idx, theme in enumerate(theme_utils.list_themes()):
-                _msgs.append(f"{idx+1}) {theme}")
-            GUIFramework.gui(
-                text=_msgs,
+            GUIFramework.gui_cached(
+                "core.themes.switch.invalid",
+                (),
+                lambda: ["Invalid theme. ", "Here are the available themes to choose from: "]
+                + [f"{idx+1}) {theme}" for idx, theme in enumerate(_available_themes)],
                 target_users=mumble_utils.get_user_by_id(data.actor),
             )
             return
@@ -332,13 +339,21 @@ class Plugin(PluginBase):
         )
 
     def _parameter_echo_broadcast(self, data: "Command", parameter: str) -> None:
-        _all_channels: List["Channel"] = mumble_utils.get_all_channels()
-        if not _all_channels:
-            logger.error(f"[{LogOutputIdentifiers.PLUGINS_COMMANDS}]: '{data.command}' command error: the channel tree could not be retrieved.")
+        # Channels without anyone in them have no one to read the message, so they are skipped.
+        _occupied_channels: List["Channel"] = mumble_utils.get_occupied_channels()
+        if not _occupied_channels:
+            if not mumble_utils.get_all_channels():
+                logger.error(f"[{LogOutputIdentifiers.PLUGINS_COMMANDS}]: '{data.command}' command error: the channel tree could not be retrieved.")
+                return
+            GUIFramework.gui(
+                f"'{data._command}' command warning: there are no other users in any channel to broadcast to.",
+                target_users=mumble_utils.get_user_by_id(data.actor),
+                user_id=data.actor,
+            )
             return
         GUIFramework.gui(
             data.message,
-            target_channels=_all_channels,
+            target_channels=_occupied_channels,
             user_id=data.actor,
         )
 
@@ -5,6 +5,7 @@ from src.settings import settings
 from src.exceptions import PluginError
 from src.constants import MumimoCfgFields
 from src.config import Config
+from src.lib.frameworks.gui.gui import GUIFramework
 
 logger = logging.getLogger(__name__)
 
@@ -26,11 +27,9 @@ def switch_themes(theme: str) -> bool:
         raise PluginError("Unable to switch themes: mumimo config could not be retrieved from settings.", logger=logger)
 
     _success_switch: bool = _config.set(MumimoCfgFields.SETTINGS.GUI.SELECTED_THEME, theme)
-    _saved_data: str = _config.save(
-        modified_only=True,
-        modified_field_name=MumimoCfgFields.SETTINGS.GUI.SELECTED_THEME,
-    )
-    return _success_switch and _saved_data is not None
+    _save_config(_config, modified_field_name=MumimoCfgFields.SETTINGS.GUI.SELECTED_THEME)
+    GUIFramework.refresh_theme()
+    return _success_switch
 
 
 def delete_theme(theme: str) -> bool:
@@ -46,7 +45,8 @@ def delete_theme(theme: str) -> bool:
         return False
 
     del _themes[theme]
-    _themes.save()
+    _save_config(_themes)
+    GUIFramework.refresh_theme()
     logger.debug(f"Deleted gui theme: {theme}.")
     return True
 
@@ -67,7 +67,9 @@ def new_theme(theme: str) -> bool:
     _new_theme: Dict[str, Any] = {theme: _template_theme}
     _themes.update(_new_theme)
     # Save new theme to the toml file.
-    _themes.save()
+    _save_config(_themes)
+    # The selected theme is unchanged, but cached output such as the themes list is not.
+    GUIFramework.invalidate_render_cache()
     logger.debug(f"Created new gui theme from template: {theme}.")
 
     return True
@@ -88,7 +90,8 @@ def reset_theme(theme: str) -> bool:
     _selected_theme = _template_theme
     _themes.update({theme: _selected_theme})
 
-    _themes.save()
+    _save_config(_themes)
+    GUIFramework.refresh_theme()
     logger.debug(f"Reset gui theme from template: {theme}.")
 
     return True
@@ -103,7 +106,8 @@ def reset_all_themes() -> bool:
     _themes.clear()
     _themes.update(_template_default_themes)
 
-    _themes.save()
+    _save_config(_themes)
+    GUIFramework.refresh_theme()
     logger.debug("Reset all gui themes from default themes template.")
 
     return True
@@ -116,7 +120,7 @@ def update_theme(theme: str, items: Dict[str, Any]) -> bool:
         return False
 
     theme = theme.strip().replace(" ", "_")
-    _selected_theme = _themes.get(theme, None)
+    _selected_theme = _themes.get(theme, None, copy=True)
     if not _selected_theme:
         logger.error(f"Failed to update gui theme: theme '{theme}' does not exist.")
         return False
@@ -126,12 +130,22 @@ def update_theme(theme: str, items: Dict[str, Any]) -> bool:
             _selected_theme[key] = value
     _themes.update({theme: _selected_theme})
 
-    _themes.save()
+    _save_config(_themes)
+    GUIFramework.refresh_theme()
     logger.debug(f"Updated gui theme '{theme}' with values [{', '.join('{}={}'.format(*x) for x in items.items())}]")
 
     return True
 
 
+def _save_config(config: "Config", modified_field_name: Optional[str] = None) -> None:
+    # Saves are written by the config save service when it is running, so the command doesn't wait on the disk.
+    _config_save_service = settings.configs.get_config_save_service()
+    if _config_save_service is not None:
+        _config_save_service.save(config, modified_field_name=modified_field_name)
+        return
+    config.save(modified_only=modified_field_name is not None, modified_field_name=modified_field_name)
+
+
 def _get_custom_theme_template() -> "Config":
     _config: Optional["Config"] = settings.configs.get_mumimo_config()
     if not _config:
@@ -147,7 +161,7 @@ def _get_custom_theme_template() -> "Config":
         raise PluginError(f"Unable to get template theme: gui custom theme template file is missing. Expected path: {_theme_template_path}")
     _theme_cfg.read()
 
-    _template = _theme_cfg.get("template", None)
+    _template = _theme_cfg.get("template", None, copy=True)
     if _template is None:
         raise PluginError("Unable to get template theme: 'template' section is missing in gui custom theme template file.")
 
@@ -125,7 +125,9 @@ class Plugin(PluginBase):
                 target_users=mumble_utils.get_user_by_id(data.actor),
             )
             return
-        GUIFramework.gui(
-            f"Plugin '{data.message.strip()}' active: {_plugin.is_running}",
+        GUIFramework.gui_cached(
+            "plugin_tools.plugin.active",
+            (data.message.strip(),),
+            lambda: f"Plugin '{data.message.strip()}' active: {_plugin.is_running}",
             target_users=mumble_utils.get_user_by_id(data.actor),
         )
@@ -13,9 +13,10 @@ from ..lib.database.models.permission_group import PermissionGroupTable
 from ..lib.database.models.command import CommandTable
 from ..lib.database.models.alias import AliasTable
 
-from ..constants import LogCfgFields, MumimoCfgFields, LogOutputIdentifiers
+from ..constants import LogCfgFields, LogOutputIdentifiers
 from ..exceptions import ServiceError
 from ..lib.frameworks.gui.gui import GUIFramework
+from ..lib.server_context import run_in_current_context
 from ..lib.command_history import CommandHistory
 from ..logging import log_privacy
 from ..settings import settings
@@ -28,7 +29,9 @@ if TYPE_CHECKING:
     from pymumble_py3.users import User
 
     from ..config import Config
+    from ..config_snapshot import ConfigSnapshot
     from ..lib.command import Command
+    from ..lib.frameworks.plugins.plugin import PluginBase
     from ..log_config import LogConfig
 
     from ..services.database_service import DatabaseService
@@ -173,10 +176,16 @@ class CommandProcessingService:
     def connection_instance(self) -> "Mumble":
         return self._connection_instance
 
+    def set_connection_instance(self, murmur_connection: "Mumble") -> None:
+        self._connection_instance = murmur_connection
+
     @property
     def log_cfg(self) -> "LogConfig":
         return self._log_cfg
 
+    def set_log_cfg(self, log_cfg: "LogConfig") -> None:
+        self._log_cfg = log_cfg
+
     @property
     def command_queue(self) -> "CommandQueue":
         return self._cmd_queue
@@ -185,25 +194,30 @@ class CommandProcessingService:
         self._connection_instance = murmur_connection
         if self.connection_instance is None:
             raise ServiceError("Unable to retrieve murmur connection: the murmur instance is not connected to a server.", logger=logger)
-        _cfg_instance: Optional["Config"] = settings.configs.get_mumimo_config()
-        if _cfg_instance is None:
+        _snapshot: Optional["ConfigSnapshot"] = settings.configs.get_config_snapshot()
+        if _snapshot is None:
             raise ServiceError("Unable to create command processing service: mumimo config could not be retrieved.", logger=logger)
         _log_cfg: Optional["LogConfig"] = settings.configs.get_log_config()
         if _log_cfg is None:
             raise ServiceError("Unable to create command processing service: log config could not be retrieved.", logger=logger)
         self._log_cfg = _log_cfg
-        settings.commands.history.set_command_history(
-            CommandHistory(history_limit=_cfg_instance.get(MumimoCfgFields.SETTINGS.COMMANDS.COMMAND_HISTORY_LENGTH, None))
-        )
+        settings.commands.history.set_command_history(CommandHistory(history_limit=_snapshot.commands.command_history_length))
         self._privacy_filter = self.OutputPrivacyFilter()
-        self._cmd_queue = CommandQueue(max_size=_cfg_instance.get(MumimoCfgFields.SETTINGS.COMMANDS.COMMAND_HISTORY_LENGTH, None))
+        self._cmd_queue = CommandQueue(max_size=_snapshot.commands.command_history_length)
 
     def process_cmd(self, text) -> None:
         if text is None:
             raise ServiceError("Received text message with a 'None' value.", logger=logger)
 
-        asyncio.run(self._process_alias(text))
-        asyncio.run(self._process_cmd())
+        _loop_rate_service = settings.connection.get_loop_rate_service()
+        if _loop_rate_service is None:
+            asyncio.run(self._process_alias(text))
+            asyncio.run(self._process_cmd())
+            return
+        # Keep the connection loop at its active rate so command output is sent without idle delays.
+        with _loop_rate_service.track_activity():
+            asyncio.run(self._process_alias(text))
+            asyncio.run(self._process_cmd())
 
     async def _process_alias(self, text) -> None:
         parsed_cmd: Optional["Command"] = cmd_parser.parse_command(text)
@@ -260,6 +274,19 @@ class CommandProcessingService:
                     return
                 logger.error(f"Encountered an error enqueueing command: '{parsed_cmd.command}'")
 
+    @staticmethod
+    def _execute_command(cmd_callable: Callable, plugin: "PluginBase", command: "Command") -> None:
+        # The gui output of the command is sent once it completes, so output to the same targets is sent as one message.
+        with GUIFramework.collect():
+            cmd_callable(plugin, command)
+
+    @staticmethod
+    def _get_parameter_usage(title: str, parameters: List[str]) -> List[str]:
+        _msgs: List[str] = [title, "Please use one of the available parameters: "]
+        for idx, param in enumerate(parameters):
+            _msgs.append(f"{idx+1}) {param}")
+        return _msgs
+
     async def _process_cmd(self) -> None:
         for _ in range(self.command_queue.size):
             # Retrieve the command from the queue if the queue is not empty.
@@ -374,27 +401,21 @@ class CommandProcessingService:
                 _parameters_required = _cmd_info.get("parameters_required", False)
                 if _parameters_required and not command.parameters:
                     logger.warning(f"The command: [{_cmd_name}] requires parameters and no parameters were provided.")
-                    _msgs = [
-                        f"Invalid '{_cmd_name}' command. This command requires the usage of parameters. ",
-                        "Please use one of the available parameters: ",
-                    ]
-                    for idx, param in enumerate(_cmd_params):
-                        _msgs.append(f"{idx+1}) {param}")
-                    GUIFramework.gui(
-                        text=_msgs,
+                    GUIFramework.gui_cached(
+                        "commands.parameters.required",
+                        (_cmd_name,),
+                        lambda: self._get_parameter_usage(
+                            f"Invalid '{_cmd_name}' command. This command requires the usage of parameters. ", _cmd_params  # type: ignore
+                        ),
                         target_users=mumble_utils.get_user_by_id(command.actor),
                     )
                     return
                 if any(param.split("=", 1)[0] not in _cmd_params for param in command.parameters):
                     logger.warning(f"The command: [{_cmd_name}] could not be executed because one or more provided parameters do not exist.")
-                    _msgs = [
-                        f"Invalid '{_cmd_name}' command. ",
-                        "Please use one of the available parameters: ",
-                    ]
-                    for idx, param in enumerate(_cmd_params):
-                        _msgs.append(f"{idx+1}) {param}")
-                    GUIFramework.gui(
-                        text=_msgs,
+                    GUIFramework.gui_cached(
+                        "commands.parameters.invalid",
+                        (_cmd_name,),
+                        lambda: self._get_parameter_usage(f"Invalid '{_cmd_name}' command. ", _cmd_params),  # type: ignore
                         target_users=mumble_utils.get_user_by_id(command.actor),
                     )
                     return
@@ -422,8 +443,8 @@ class CommandProcessingService:
             # Execute the command's callable method in a new thread and pass in all command data.
             _cmd_thread = threading.Thread(
                 name=f"mumimo-{_plugin_name}-{_cmd_name}",
-                target=_cmd_callable,
-                args=(_registered_plugins[_plugin_name], command),
+                target=run_in_current_context(self._execute_command),
+                args=(_cmd_callable, _registered_plugins[_plugin_name], command),
             )
             logger.debug(f"Command thread: [{_cmd_thread.name}] initialized.")
             _cmd_thread.start()
@@ -0,0 +1,261 @@
+import functools
+import logging
+import pathlib
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from ..config import Config
+from ..config_snapshot import ConfigSnapshot
+from ..constants import LogOutputIdentifiers, MumimoCfgFields, PluginCfgFields, PluginCfgSections, SysArgs
+from ..exceptions import ConfigError, GUIError, PluginError
+from ..lib.command_history import CommandHistory
+from ..lib.command_queue import CommandQueue
+from ..lib.config_watcher import ConfigWatcher
+from ..lib.frameworks.gui.gui import GUIFramework
+from ..lib.server_context import ServerContext, use_server
+from ..log_config import LogConfig
+from ..logging import reload_handlers
+from ..settings import settings
+from .init_services.client_settings_init_service import ClientSettingsInitService
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigReloadService:
+    # Applies changes to the config files while running, touching only the subsystems that read the changed fields.
+    _watcher: ConfigWatcher
+    _worker_server: Optional[ServerContext]
+    _client_settings: ClientSettingsInitService
+
+    # Fields that take effect without a restart. The command token and paged output are read from the config snapshot on use,
+    # the others are applied to the running services when they change.
+    LIVE_FIELDS: List[str] = [
+        MumimoCfgFields.SETTINGS.COMMANDS.TOKEN,
+        MumimoCfgFields.SETTINGS.COMMANDS.COMMAND_HISTORY_LENGTH,
+        MumimoCfgFields.SETTINGS.CONNECTION.MESSAGE_QUEUE_SIZE,
+        MumimoCfgFields.SETTINGS.CONNECTION.EVENT_QUEUE_SIZE,
+        MumimoCfgFields.SETTINGS.GUI.SELECTED_THEME,
+        MumimoCfgFields.SETTINGS.GUI.PAGED_OUTPUT,
+        MumimoCfgFields.SETTINGS.GUI.RENDER_CACHE_SIZE,
+    ]
+    LIVE_PLUGIN_FIELDS: List[str] = [
+        PluginCfgFields.PLUGIN.COMMANDS.DISABLE_COMMANDS,
+        PluginCfgFields.PLUGIN.COMMANDS.DISABLE_PARAMETERS,
+        PluginCfgSections.PLUGIN_HELP,
+    ]
+
+    @property
+    def watcher(self) -> ConfigWatcher:
+        return self._watcher
+
+    def __init__(
+        self,
+        interval: Optional[float] = ConfigWatcher.DEFAULT_INTERVAL,
+        worker_server: Optional[ServerContext] = None,
+        sys_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        # Worker processes run a single hosted server as their primary connection, so its overrides are applied to every reloaded config.
+        self._watcher = ConfigWatcher(interval)
+        self._worker_server = worker_server
+        self._client_settings = ClientSettingsInitService(sys_args or {})
+
+    def start(self) -> None:
+        _config: Optional[Config] = settings.configs.get_mumimo_config()
+        if _config is not None and _config.file_path is not None:
+            self._watcher.watch(_config.file_path, self.reload_mumimo_config)
+        _log_config: Optional[LogConfig] = settings.configs.get_log_config()
+        if _log_config is not None and _log_config.file_path is not None:
+            self._watcher.watch(_log_config.file_path, self.reload_log_config)
+        _themes: Optional[Config] = settings.configs.get_gui_themes()
+        if _themes is not None and _themes.file_path is not None:
+            self._watcher.watch(_themes.file_path, self.reload_gui_themes)
+        for _plugin_name, _plugin in settings.plugins.get_registered_plugins().items():
+            if _plugin.plugin_metadata.file_path is not None:
+                self._watcher.watch(_plugin.plugin_metadata.file_path, functools.partial(self.reload_plugin_metadata, _plugin_name))
+        self._watcher.start()
+        logger.debug(f"Watching {len(self._watcher.get_watched_files())} config files for changes.")
+
+    def stop(self) -> None:
+        self._watcher.stop()
+
+    def reload_mumimo_config(self, path: pathlib.Path) -> Set[str]:
+        _start: float = time.perf_counter()
+        try:
+            _config: Config = Config(path).read()
+            # System arguments take priority over the config file, so they are applied before the reloaded config is compared.
+            self._client_settings.apply_prioritized_cfg_options(_config)
+            if self._worker_server is not None:
+                _config = self._worker_server.apply_config_overrides(_config)
+            else:
+                ConfigSnapshot.from_config(_config)
+        except ConfigError:
+            logger.warning(f"Unable to reload '{path.name}', the current config is kept until the file is fixed.")
+            return set()
+        _current: Optional[Config] = settings.configs.get_mumimo_config()
+        _changed: Set[str] = self.get_changed_fields(_current if _current is not None else {}, _config)
+        if not _changed:
+            return _changed
+
+        settings.configs.set_mumimo_config(_config)
+        _servers: List[Optional[ServerContext]] = [None]
+        for _server in settings.servers.get_servers().values():
+            try:
+                _server.apply_config_overrides(_config)
+            except ConfigError:
+                logger.warning(
+                    f"[{LogOutputIdentifiers.MUMBLE_SERVERS}]: Unable to apply the reloaded config to '{_server.name}', keeping its current config."
+                )
+                continue
+            _servers.append(_server)
+
+        _queue_size_fields: List[str] = [
+            MumimoCfgFields.SETTINGS.COMMANDS.COMMAND_HISTORY_LENGTH,
+            MumimoCfgFields.SETTINGS.CONNECTION.MESSAGE_QUEUE_SIZE,
+            MumimoCfgFields.SETTINGS.CONNECTION.EVENT_QUEUE_SIZE,
+        ]
+        if self._is_changed(_changed, _queue_size_fields):
+            for _server in _servers:
+                with use_server(_server):
+                    self._apply_queue_sizes(_changed)
+        if self._is_changed(_changed, [MumimoCfgFields.SETTINGS.GUI.RENDER_CACHE_SIZE]):
+            GUIFramework.reset_render_cache()
+        if self._is_changed(_changed, [MumimoCfgFields.SETTINGS.GUI.SELECTED_THEME]):
+            GUIFramework.refresh_theme()
+        elif self._is_changed(_changed, [MumimoCfgFields.SETTINGS.COMMANDS.TOKEN]):
+            # Command usage messages show the command token.
+            GUIFramework.invalidate_render_cache()
+        self._log_reload(path, _start, _changed, self.LIVE_FIELDS)
+        return _changed
+
+    def reload_log_config(self, path: pathlib.Path) -> Set[str]:
+        _start: float = time.perf_counter()
+        try:
+            _log_config: LogConfig = LogConfig(str(path)).read()
+        except IOError:
+            logger.warning(f"Unable to reload '{path.name}', the current log config is kept until the file is fixed.")
+            return set()
+        _current: Optional[LogConfig] = settings.configs.get_log_config()
+        if _current is not None:
+            # The verbosity comes from the command line rather than the file.
+            _log_config.set(SysArgs.SYS_VERBOSE, _current.get(SysArgs.SYS_VERBOSE), create_keys_if_not_exists=True)
+        _changed: Set[str] = self.get_changed_fields(_current if _current is not None else {}, _log_config)
+        if not _changed:
+            return _changed
+
+        settings.configs.set_log_config(_log_config)
+        reload_handlers()
+        for _server in [None, *settings.servers.get_servers().values()]:
+            with use_server(_server):
+                _cmd_service = settings.commands.services.get_cmd_processing_service()
+                if _cmd_service is not None:
+                    _cmd_service.set_log_cfg(_log_config)
+        self._log_reload(path, _start, _changed)
+        return _changed
+
+    def reload_gui_themes(self, path: pathlib.Path) -> Set[str]:
+        _start: float = time.perf_counter()
+        try:
+            _themes: Config = Config(path).read()
+        except ConfigError:
+            logger.warning(f"Unable to reload '{path.name}', the current gui themes are kept until the file is fixed.")
+            return set()
+        _current: Optional[Config] = settings.configs.get_gui_themes()
+        _changed: Set[str] = self.get_changed_fields(_current if _current is not None else {}, _themes)
+        if not _changed:
+            return _changed
+
+        settings.configs.set_gui_themes(_themes)
+        try:
+            GUIFramework.refresh_theme()
+        except GUIError:
+            logger.warning(f"Unable to reload '{path.name}', the current gui themes are kept until the file is fixed.")
+            if _current is not None:
+                settings.configs.set_gui_themes(_current)
+                GUIFramework.refresh_theme()
+            return set()
+        self._log_reload(path, _start, _changed)
+        return _changed
+
+    def reload_plugin_metadata(self, plugin_name: str, path: pathlib.Path) -> Set[str]:
+        _start: float = time.perf_counter()
+        _plugin = settings.plugins.get_registered_plugin(plugin_name)
+        if _plugin is None:
+            return set()
+        try:
+            _metadata: Config = Config(path).read()
+        except ConfigError:
+            logger.warning(
+                f"[{LogOutputIdentifiers.PLUGINS}]: Unable to reload '{plugin_name}' metadata, the current metadata is kept until the file is fixed."
+            )
+            return set()
+        _changed: Set[str] = self.get_changed_fields(_plugin.plugin_metadata, _metadata)
+        if not _changed:
+            return _changed
+
+        try:
+            _plugin.reload_metadata(_metadata, settings.commands.callbacks.get_callbacks(plugin_name))
+        except PluginError:
+            logger.warning(
+                f"[{LogOutputIdentifiers.PLUGINS}]: Unable to rebuild the command parameters of '{plugin_name}' from its reloaded metadata."
+            )
+            return set()
+        self._log_reload(path, _start, _changed, self.LIVE_PLUGIN_FIELDS)
+        return _changed
+
+    @staticmethod
+    def _apply_queue_sizes(changed: Set[str]) -> None:
+        # Applies to the server selected in the current context.
+        _snapshot: Optional[ConfigSnapshot] = settings.configs.get_config_snapshot()
+        if _snapshot is None:
+            return
+        if MumimoCfgFields.SETTINGS.COMMANDS.COMMAND_HISTORY_LENGTH in changed:
+            # The command queue is sized by the history length, as when the command processing service is created.
+            _history_length: Optional[int] = _snapshot.commands.command_history_length
+            _history: Optional[CommandHistory] = settings.commands.history.get_command_history()
+            if _history is not None:
+                _history.limit = _history_length if _history_length is not None else CommandHistory.DEFAULT_HISTORY_LIMIT
+            _cmd_service = settings.commands.services.get_cmd_processing_service()
+            if _cmd_service is not None:
+                _cmd_service.command_queue.max_size = _history_length if _history_length is not None else CommandQueue.DEFAULT_COMMAND_QUEUE_LIMIT
+        if MumimoCfgFields.SETTINGS.CONNECTION.MESSAGE_QUEUE_SIZE in changed:
+            _outbound_service = settings.connection.get_outbound_message_service()
+            if _outbound_service is not None:
+                _outbound_service.set_max_queue_size(_snapshot.connection.message_queue_size)
+        if MumimoCfgFields.SETTINGS.CONNECTION.EVENT_QUEUE_SIZE in changed:
+            _event_bus_service = settings.connection.get_event_bus_service()
+            if _event_bus_service is not None:
+                _event_bus_service.set_max_queue_size(_snapshot.connection.event_queue_size)
+
+    @staticmethod
+    def _log_reload(path: pathlib.Path, start: float, changed: Set[str], live_fields: Optional[Iterable[str]] = None) -> None:
+        _elapsed: float = (time.perf_counter() - start) * 1000
+        logger.info(f"Reloaded '{path.name}' in {_elapsed:.2f}ms: {len(changed)} changed fields.")
+        if live_fields is None:
+            return
+        _live_fields: List[str] = list(live_fields)
+        _restart_fields: List[str] = sorted(field for field in changed if not ConfigReloadService._is_changed({field}, _live_fields))
+        if _restart_fields:
+            logger.warning(f"Changes to [{', '.join(_restart_fields)}] in '{path.name}' take effect after a restart.")
+
+    @staticmethod
+    def _is_changed(changed: Set[str], field_names: Iterable[str]) -> bool:
+        # Changed fields are leaves, so a section is changed when any field below it is.
+        for _field_name in field_names:
+            _prefix: str = f"{_field_name}{Config.PATH_SEPARATOR}"
+            if any(field == _field_name or field.startswith(_prefix) for field in changed):
+                return True
+        return False
+
+    @staticmethod
+    def get_changed_fields(current: Mapping[str, Any], new: Mapping[str, Any], prefix: str = "") -> Set[str]:
+        # Sections are compared key by key, so the result holds the dotted names of the changed, added and removed fields.
+        _changed: Set[str] = set()
+        for _key in set(current.keys()) | set(new.keys()):
+            _field_name: str = f"{prefix}{Config.PATH_SEPARATOR}{_key}" if prefix else str(_key)
+            _current_value: Any = dict.get(current, _key) if isinstance(current, dict) else current.get(_key)
+            _new_value: Any = dict.get(new, _key) if isinstance(new, dict) else new.get(_key)
+            if isinstance(_current_value, Mapping) and isinstance(_new_value, Mapping):
+                _changed |= ConfigReloadService.get_changed_fields(_current_value, _new_value, _field_name)
+            elif _current_value != _new_value:
+                _changed.add(_field_name)
+        return _changed
@@ -0,0 +1,154 @@
+import logging
+import pathlib
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..config import Config
+from ..exceptions import ConfigWriteError
+from ..lib.server_context import run_in_current_context
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigSaveService:
+    # Writes config changes on a background thread, so commands that change a config never wait on the disk.
+    class PendingSave:
+        config: Config
+        file_path: pathlib.Path
+        # None when the whole config is saved, otherwise the fields saved on top of the config file's initial contents.
+        modified_field_names: Optional[List[str]]
+
+        def __init__(self, config: Config, file_path: pathlib.Path, modified_field_names: Optional[List[str]]) -> None:
+            self.config = config
+            self.file_path = file_path
+            self.modified_field_names = modified_field_names
+
+    _thread: Optional[threading.Thread]
+    # Hosted servers keep their own copy of the mumimo config, so saves are keyed by the config as well as its file.
+    _pending: Dict[Tuple[pathlib.Path, int], PendingSave]
+    _pending_lock: threading.Lock
+    _write_lock: threading.Lock
+    _wakeup_event: threading.Event
+    _stop_event: threading.Event
+    _save_delay: float
+    _max_save_delay: float
+
+    DEFAULT_SAVE_DELAY: float = 0.5
+    DEFAULT_MAX_SAVE_DELAY: float = 5.0
+
+    @property
+    def save_delay(self) -> float:
+        return self._save_delay
+
+    @property
+    def pending_count(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def __init__(self, save_delay: Optional[float] = DEFAULT_SAVE_DELAY, max_save_delay: Optional[float] = DEFAULT_MAX_SAVE_DELAY) -> None:
+        if save_delay is None or save_delay < 0:
+            save_delay = self.DEFAULT_SAVE_DELAY
+        if max_save_delay is None or max_save_delay < save_delay:
+            max_save_delay = max(self.DEFAULT_MAX_SAVE_DELAY, save_delay)
+        self._save_delay = float(save_delay)
+        self._max_save_delay = float(max_save_delay)
+        self._thread = None
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup_event = threading.Event()
+        self._stop_event = threading.Event()
+
+    def start(self) -> bool:
+        if self.is_running:
+            return False
+        self._stop_event.clear()
+        self._thread = threading.Thread(name="mumimo-config-writer", target=run_in_current_context(self._run), daemon=True)
+        self._thread.start()
+        logger.debug(f"Config save thread: [{self._thread.name} | {self._thread.ident}] started.")
+        return True
+
+    def stop(self) -> bool:
+        # Pending saves are written before the thread exits, and any saved after it exits are written here.
+        if self._thread is not None:
+            self._stop_event.set()
+            self._wakeup_event.set()
+            self._thread.join()
+            logger.debug(f"Config save thread: [{self._thread.name}] closed.")
+            self._thread = None
+        self.flush()
+        return True
+
+    def save(self, config: Config, file_path: Optional[pathlib.Path] = None, modified_field_name: Optional[str] = None) -> None:
+        # Only records the save, the config is serialized when it is written so a burst of changes to it is written once.
+        _file_path: Optional[pathlib.Path] = file_path if file_path is not None else config.file_path
+        if _file_path is None:
+            raise ConfigWriteError("Unable to save data to a config file because no file was specified.", logger)
+        with self._pending_lock:
+            _key: Tuple[pathlib.Path, int] = (_file_path, id(config))
+            _pending: Optional["ConfigSaveService.PendingSave"] = self._pending.get(_key)
+            if _pending is None:
+                _pending = self.PendingSave(config, _file_path, [] if modified_field_name else None)
+                self._pending[_key] = _pending
+            if modified_field_name is None:
+                _pending.modified_field_names = None
+            elif _pending.modified_field_names is not None and modified_field_name not in _pending.modified_field_names:
+                _pending.modified_field_names.append(modified_field_name)
+        self._wakeup_event.set()
+
+    def flush(self) -> int:
+        # Writes every pending save on the calling thread.
+        _batch: List["ConfigSaveService.PendingSave"] = self._drain()
+        for _pending in _batch:
+            self._write(_pending)
+        return len(_batch)
+
+    def _drain(self) -> List[PendingSave]:
+        with self._pending_lock:
+            _batch = list(self._pending.values())
+            self._pending.clear()
+            self._wakeup_event.clear()
+        return _batch
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup_event.wait()
+            # Saves are held back until the configs have stopped changing for the save delay, or for the max delay during a long burst.
+            _deadline: float = time.monotonic() + self._max_save_delay
+            while not self._stop_event.is_set():
+                self._wakeup_event.clear()
+                _remaining: float = _deadline - time.monotonic()
+                if _remaining <= 0 or self._stop_event.wait(min(self._save_delay, _remaining)) or not self._wakeup_event.is_set():
+                    break
+            self.flush()
+            if self._stop_event.is_set():
+                break
+
+    def _write(self, pending: PendingSave) -> None:
+        try:
+            with self._write_lock:
+                if pending.modified_field_names is None:
+                    _data: str = pending.config.dumps()
+                else:
+                    # Each field is saved on top of the initial contents, and the last dump holds all of them.
+                    for _field_name in pending.modified_field_names:
+                        _data = pending.config.dumps(modified_only=True, modified_field_name=_field_name)
+                pending.config.write_file(pending.file_path, _data)
+            logger.debug(f"Saved config file: {pending.file_path}")
+        except RuntimeError:
+            # The config was changed while it was serialized, so it is saved again after the next save delay.
+            self._requeue(pending)
+        except ConfigWriteError:
+            logger.error(f"Unable to save config file: {pending.file_path}")
+
+    def _requeue(self, pending: PendingSave) -> None:
+        if pending.modified_field_names is None:
+            self.save(pending.config, pending.file_path)
+            return
+        for _field_name in pending.modified_field_names:
+            self.save(pending.config, pending.file_path, _field_name)
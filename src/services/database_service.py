@@ -1,14 +1,14 @@
 import asyncio
 import contextlib
 import logging
+import pathlib
 from typing import TYPE_CHECKING, AsyncGenerator, List, Optional, Tuple
 
-import sqlalchemy_utils
-from sqlalchemy import select
+from sqlalchemy import delete, insert, inspect, select
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker, create_async_engine
 
-from ..constants import LogOutputIdentifiers, MumimoCfgFields
+from ..constants import DATABASE_SCHEMA_VERSION, LogOutputIdentifiers, MumimoCfgFields
 from ..exceptions import DatabaseServiceError
 from ..lib.database import metadata
 from ..lib.database.database_connection_parameters import DatabaseConnectionParameters
@@ -16,12 +16,14 @@ from ..lib.database.models.alias import AliasTable  # noqa
 from ..lib.database.models.command import CommandTable  # noqa
 from ..lib.database.models.permission_group import PermissionGroupTable  # noqa
 from ..lib.database.models.plugin import PluginTable  # noqa
+from ..lib.database.models.schema_version import SchemaVersionTable
 from ..lib.database.models.user import UserTable  # noqa
 from ..lib.singleton import singleton
 from ..settings import settings
 from ..utils.parsers.db_url_parser import get_url
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
     from sqlalchemy.ext.asyncio import AsyncEngine
 
 logger = logging.getLogger(__name__)
@@ -33,6 +35,10 @@ class DatabaseService:
     _connection_parameters: Optional[DatabaseConnectionParameters] = None
     _session_factory: Optional[async_scoped_session] = None
 
+    @property
+    def engine(self) -> Optional["AsyncEngine"]:
+        return self._engine
+
     async def initialize_database(
         self,
         dialect: Optional[str] = None,
@@ -46,6 +52,7 @@ class DatabaseService:
         local_database_path: Optional[str] = None,
         local_database_dialect: Optional[str] = None,
         local_database_driver: Optional[str] = None,
+        import_defaults: bool = True,
     ) -> None:
         db_connection_opts: DatabaseConnectionParameters = DatabaseConnectionParameters(
             dialect=dialect,
@@ -61,7 +68,8 @@ class DatabaseService:
             local_database_driver=local_database_driver,
         )
         await self.setup(db_connection_opts)
-        await self.import_default_values()
+        if import_defaults:
+            await self.import_default_values()
 
     async def _import_default_permission_groups(self, cfg):
         logger.debug(f"[{LogOutputIdentifiers.DB_PERMISSIONS}]: Importing default permission groups...")
@@ -189,15 +197,12 @@ class DatabaseService:
         self._connection_parameters = connection_parameters
 
         # Create or connect to the database, initialize the async engine and create all missing tables.
-        _create_db_url: str = get_url(self._connection_parameters, create_url=True)
         _async_url: str = get_url(self._connection_parameters, create_url=False)
         try:
             if not self._connection_parameters.use_remote:
-                if not sqlalchemy_utils.database_exists(_create_db_url):
-                    sqlalchemy_utils.create_database(_create_db_url)
+                self._prepare_local_database(self._connection_parameters)
             self._engine = create_async_engine(_async_url, echo=False)
-            async with self._engine.begin() as conn:
-                await conn.run_sync(metadata.Base.metadata.create_all)
+            await self._bootstrap_schema(self._engine)
         except NoSuchModuleError as exc:
             raise DatabaseServiceError(
                 f"[{LogOutputIdentifiers.DB}]: Database connection dialect could not be found. Please check your dialect connection parameters.",
@@ -213,6 +218,30 @@ class DatabaseService:
         # Save the database service instance to the settings.
         settings.database.set_database_instance(self)
 
+    def _prepare_local_database(self, connection_parameters: DatabaseConnectionParameters) -> None:
+        # SQLite creates the database file on the first connection, so only the parent directory needs to exist.
+        if connection_parameters.local_database_dialect != "sqlite" or connection_parameters.local_database_path in (None, "", ":memory:"):
+            return
+        pathlib.Path(str(connection_parameters.local_database_path)).parent.mkdir(parents=True, exist_ok=True)
+
+    async def _bootstrap_schema(self, engine: "AsyncEngine") -> None:
+        async with engine.begin() as conn:
+            _schema_version: Optional[int] = await conn.run_sync(self._get_schema_version)
+            if _schema_version == DATABASE_SCHEMA_VERSION:
+                logger.debug(f"[{LogOutputIdentifiers.DB}]: Database schema is up to date (version {_schema_version}). Skipped table creation.")
+                return
+            logger.debug(f"[{LogOutputIdentifiers.DB}]: Database schema version {_schema_version} is outdated. Creating missing tables...")
+            await conn.run_sync(metadata.Base.metadata.create_all)
+            await conn.execute(delete(SchemaVersionTable))
+            await conn.execute(insert(SchemaVersionTable).values(version=DATABASE_SCHEMA_VERSION))
+            logger.debug(f"[{LogOutputIdentifiers.DB}]: Database schema updated to version {DATABASE_SCHEMA_VERSION}.")
+
+    @staticmethod
+    def _get_schema_version(conn: "Connection") -> Optional[int]:
+        if not inspect(conn).has_table(SchemaVersionTable.__tablename__):
+            return None
+        return conn.execute(select(SchemaVersionTable.version)).scalar()
+
     async def _validate_connection_parameters(self, connection_parameters: DatabaseConnectionParameters) -> Tuple[bool, str]:
         _validation_result: Tuple[bool, str] = connection_parameters.validate_parameters()
         return _validation_result
@@ -0,0 +1,171 @@
+import datetime
+import json
+import logging
+import pathlib
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import DateTime, Table, func, select, text
+
+from ..constants import LogOutputIdentifiers
+from ..exceptions import DatabaseServiceError
+from ..lib.database import metadata
+from ..lib.database.models.alias import AliasTable  # noqa
+from ..lib.database.models.command import CommandTable  # noqa
+from ..lib.database.models.permission_group import PermissionGroupTable  # noqa
+from ..lib.database.models.plugin import PluginTable  # noqa
+from ..lib.database.models.schema_version import SchemaVersionTable
+from ..lib.database.models.user import UserTable  # noqa
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseTransferService:
+    _engine: "AsyncEngine"
+    _batch_size: int
+
+    DEFAULT_BATCH_SIZE: int = 1000
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def tables(self) -> List[Table]:
+        # Tables are sorted by foreign key dependency, so association tables are always written after the tables they reference.
+        # The schema version is owned by the target database bootstrap and is never transferred.
+        return [table for table in metadata.Base.metadata.sorted_tables if table.name != SchemaVersionTable.__tablename__]
+
+    def __init__(self, engine: Optional["AsyncEngine"], batch_size: Optional[int] = DEFAULT_BATCH_SIZE) -> None:
+        if engine is None:
+            raise DatabaseServiceError(
+                f"[{LogOutputIdentifiers.DB_TRANSFER}]: Cannot transfer data: the database engine is not initialized.", logger=logger
+            )
+        if batch_size is None or batch_size <= 0:
+            batch_size = self.DEFAULT_BATCH_SIZE
+        self._engine = engine
+        self._batch_size = batch_size
+
+    async def export_tables(self, file_path: Union[str, pathlib.Path]) -> Dict[str, int]:
+        _path = pathlib.Path(file_path)
+        _row_counts: Dict[str, int] = {}
+        _start = time.perf_counter()
+        try:
+            with open(_path, "w", encoding="utf-8") as file_handler:
+                async with self._engine.connect() as conn:
+                    for table in self.tables:
+                        _table_start = time.perf_counter()
+                        _row_counts[table.name] = 0
+                        _result = await conn.stream(select(table))
+                        async for partition in _result.partitions(self._batch_size):
+                            for row in partition:
+                                _line = {"table": table.name, "row": self._serialize_row(row._asdict())}
+                                file_handler.write(json.dumps(_line) + "\n")
+                            _row_counts[table.name] += len(partition)
+                        self._log_progress("Exported", table.name, _row_counts[table.name], _table_start)
+        except IOError as exc:
+            raise DatabaseServiceError(f"[{LogOutputIdentifiers.DB_TRANSFER}]: Unable to write export file at: {_path}", logger=logger) from exc
+        self._log_progress("Exported", "all tables", sum(_row_counts.values()), _start)
+        return _row_counts
+
+    async def import_tables(self, file_path: Union[str, pathlib.Path]) -> Dict[str, int]:
+        _path = pathlib.Path(file_path)
+        if not _path.is_file():
+            raise DatabaseServiceError(f"[{LogOutputIdentifiers.DB_TRANSFER}]: Unable to find import file at: {_path}", logger=logger)
+        _tables: Dict[str, Table] = {table.name: table for table in self.tables}
+        _row_counts: Dict[str, int] = {}
+        _start = time.perf_counter()
+        async with self._engine.begin() as conn:
+            await self._ensure_empty(conn)
+            _table: Optional[Table] = None
+            _table_start = _start
+            _batch: List[Dict[str, Any]] = []
+            try:
+                with open(_path, "r", encoding="utf-8") as file_handler:
+                    for line_number, line in enumerate(file_handler, start=1):
+                        if not line.strip():
+                            continue
+                        _table_name, _row = self._parse_line(line, line_number)
+                        _next_table = _tables.get(_table_name)
+                        if _next_table is None:
+                            raise DatabaseServiceError(
+                                f"[{LogOutputIdentifiers.DB_TRANSFER}]: Unknown table '{_table_name}' on line {line_number} of the import file.",
+                                logger=logger,
+                            )
+                        if _table is not None and _next_table is not _table:
+                            await self._insert_batch(conn, _table, _batch)
+                            _batch = []
+                            self._log_progress("Imported", _table.name, _row_counts[_table.name], _table_start)
+                            _table_start = time.perf_counter()
+                        _table = _next_table
+                        _row_counts.setdefault(_table.name, 0)
+                        _batch.append(self._deserialize_row(_table, _row))
+                        _row_counts[_table.name] += 1
+                        if len(_batch) >= self._batch_size:
+                            await self._insert_batch(conn, _table, _batch)
+                            _batch = []
+            except IOError as exc:
+                raise DatabaseServiceError(f"[{LogOutputIdentifiers.DB_TRANSFER}]: Unable to read import file at: {_path}", logger=logger) from exc
+            if _table is not None:
+                await self._insert_batch(conn, _table, _batch)
+                self._log_progress("Imported", _table.name, _row_counts[_table.name], _table_start)
+            await self._reset_sequences(conn)
+        self._log_progress("Imported", "all tables", sum(_row_counts.values()), _start)
+        return _row_counts
+
+    async def _ensure_empty(self, conn: "AsyncConnection") -> None:
+        # Importing into populated tables would collide with existing primary keys and unique names.
+        for table in self.tables:
+            _count = (await conn.execute(select(func.count()).select_from(table))).scalar()
+            if _count:
+                raise DatabaseServiceError(
+                    f"[{LogOutputIdentifiers.DB_TRANSFER}]: Unable to import data: the '{table.name}' table is not empty in the target database.",
+                    logger=logger,
+                )
+
+    async def _insert_batch(self, conn: "AsyncConnection", table: Table, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        await conn.execute(table.insert(), batch)
+
+    async def _reset_sequences(self, conn: "AsyncConnection") -> None:
+        # Explicit primary keys do not advance postgresql sequences, so move them past the imported rows.
+        if conn.dialect.name != "postgresql":
+            return
+        for table in self.tables:
+            if "id" not in table.c:
+                continue
+            await conn.execute(
+                text(f"SELECT setval(pg_get_serial_sequence('\"{table.name}\"', 'id'), COALESCE((SELECT MAX(id) FROM \"{table.name}\"), 1))")
+            )
+
+    def _parse_line(self, line: str, line_number: int) -> Tuple[str, Dict[str, Any]]:
+        try:
+            _data = json.loads(line)
+            return _data["table"], _data["row"]
+        except (json.JSONDecodeError, KeyError, TypeError) as exc:
+            raise DatabaseServiceError(
+                f"[{LogOutputIdentifiers.DB_TRANSFER}]: Invalid entry on line {line_number} of the import file.", logger=logger
+            ) from exc
+
+    def _serialize_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value.isoformat() if isinstance(value, datetime.datetime) else value for key, value in row.items()}
+
+    def _deserialize_row(self, table: Table, row: Dict[str, Any]) -> Dict[str, Any]:
+        _row: Dict[str, Any] = {}
+        for key, value in row.items():
+            if key not in table.c:
+                continue
+            if value is not None and isinstance(table.c[key].type, DateTime):
+                value = datetime.datetime.fromisoformat(value)
+            _row[key] = value
+        return _row
+
+    def _log_progress(self, action: str, name: str, row_count: int, start: float) -> None:
+        _elapsed = time.perf_counter() - start
+        _rate = row_count / _elapsed if _elapsed > 0 else float(row_count)
+        logger.info(f"[{LogOutputIdentifiers.DB_TRANSFER}]: {action} {row_count} row(s) from '{name}' in {_elapsed:.3f}s ({_rate:.0f} rows/s).")
@@ -0,0 +1,283 @@
+import collections
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..constants import LogOutputIdentifiers
+from ..lib.server_context import run_in_current_context
+
+logger = logging.getLogger(__name__)
+
+
+class EventBusService:
+    class Event:
+        event_type: str
+        args: Tuple[Any, ...]
+        published_at: float
+
+        def __init__(self, event_type: str, args: Tuple[Any, ...]) -> None:
+            self.event_type = event_type
+            self.args = args
+            self.published_at = time.monotonic()
+
+    class Lane:
+        # Events in a lane with a single worker are dispatched in the order they were published.
+        name: str
+        workers: int
+        overload_policy: str
+        queue: Deque["EventBusService.Event"]
+        condition: threading.Condition
+        threads: List[threading.Thread]
+
+        def __init__(self, name: str, overload_policy: str, workers: int = 1) -> None:
+            self.name = name
+            self.overload_policy = overload_policy
+            self.workers = max(1, workers)
+            self.queue = collections.deque()
+            self.condition = threading.Condition()
+            self.threads = []
+
+    _subscribers: Dict[str, List[Callable[..., Any]]]
+    _subscribers_lock: threading.Lock
+    _lane_names: Dict[str, str]
+    _lane_options: Dict[str, Dict[str, Any]]
+    _lanes: Dict[str, Lane]
+    _lanes_lock: threading.Lock
+    _running: bool
+
+    _max_queue_size: int
+    _overload_policy: str
+    _block_timeout: float
+
+    _metrics: Dict[str, Dict[str, Any]]
+    _metrics_lock: threading.Lock
+
+    OVERLOAD_DROP_OLDEST: str = "drop_oldest"
+    OVERLOAD_DROP_NEWEST: str = "drop_newest"
+    OVERLOAD_BLOCK: str = "block"
+    OVERLOAD_POLICIES: Tuple[str, ...] = (OVERLOAD_DROP_OLDEST, OVERLOAD_DROP_NEWEST, OVERLOAD_BLOCK)
+
+    DEFAULT_MAX_QUEUE_SIZE: int = 1000
+    DEFAULT_OVERLOAD_POLICY: str = OVERLOAD_BLOCK
+    DEFAULT_BLOCK_TIMEOUT: float = 1.0
+
+    @property
+    def max_queue_size(self) -> int:
+        return self._max_queue_size
+
+    @property
+    def overload_policy(self) -> str:
+        return self._overload_policy
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def __init__(
+        self,
+        max_queue_size: Optional[int] = DEFAULT_MAX_QUEUE_SIZE,
+        overload_policy: Optional[str] = DEFAULT_OVERLOAD_POLICY,
+        block_timeout: Optional[float] = DEFAULT_BLOCK_TIMEOUT,
+        lanes: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if max_queue_size is None or max_queue_size < 1:
+            max_queue_size = self.DEFAULT_MAX_QUEUE_SIZE
+        if overload_policy not in self.OVERLOAD_POLICIES:
+            overload_policy = self.DEFAULT_OVERLOAD_POLICY
+        if block_timeout is None or block_timeout < 0:
+            block_timeout = self.DEFAULT_BLOCK_TIMEOUT
+        self._max_queue_size = int(max_queue_size)
+        self._overload_policy = str(overload_policy)
+        self._block_timeout = float(block_timeout)
+        # Event types without a lane get a lane of their own, so unrelated events never wait on each other.
+        self._lane_names = dict(lanes or {})
+        self._lane_options = {}
+        self._lanes = {}
+        self._lanes_lock = threading.Lock()
+        self._subscribers = {}
+        self._subscribers_lock = threading.Lock()
+        self._running = False
+        self._metrics = {}
+        self._metrics_lock = threading.Lock()
+
+    def set_lane_options(self, lane_name: str, workers: Optional[int] = None, overload_policy: Optional[str] = None) -> None:
+        # Only applies to lanes created afterwards, so it is set up before the first event of the lane is published.
+        _options: Dict[str, Any] = self._lane_options.setdefault(lane_name, {})
+        if workers is not None and workers >= 1:
+            _options["workers"] = int(workers)
+        if overload_policy in self.OVERLOAD_POLICIES:
+            _options["overload_policy"] = overload_policy
+
+    def set_max_queue_size(self, max_queue_size: Optional[int]) -> None:
+        if max_queue_size is None or max_queue_size < 1:
+            max_queue_size = self.DEFAULT_MAX_QUEUE_SIZE
+        self._max_queue_size = int(max_queue_size)
+        with self._lanes_lock:
+            _lanes: List["EventBusService.Lane"] = list(self._lanes.values())
+        # Publishers blocked on a full lane check the new size straight away.
+        for _lane in _lanes:
+            with _lane.condition:
+                _lane.condition.notify_all()
+
+    def clear_subscribers(self) -> None:
+        with self._subscribers_lock:
+            self._subscribers = {}
+
+    def set_subscriber(self, event_type: str, callback: Callable[..., Any]) -> None:
+        with self._subscribers_lock:
+            self._subscribers[event_type] = [callback]
+
+    def add_subscriber(self, event_type: str, callback: Callable[..., Any]) -> None:
+        with self._subscribers_lock:
+            self._subscribers.setdefault(event_type, []).append(callback)
+
+    def remove_subscriber(self, event_type: str, callback: Callable[..., Any]) -> bool:
+        with self._subscribers_lock:
+            _subscribers: List[Callable[..., Any]] = self._subscribers.get(event_type, [])
+            if callback not in _subscribers:
+                return False
+            # Subscriber lists are replaced rather than modified, so a dispatch in progress keeps its own snapshot.
+            self._subscribers[event_type] = [subscriber for subscriber in _subscribers if subscriber is not callback]
+            return True
+
+    def get_subscribers(self, event_type: str) -> List[Callable[..., Any]]:
+        with self._subscribers_lock:
+            return list(self._subscribers.get(event_type, []))
+
+    def publisher(self, event_type: str) -> Callable[..., bool]:
+        # Registered as the pymumble callback for the event type in place of the subscribers themselves.
+        return functools.partial(self.publish, event_type)
+
+    def start(self) -> None:
+        with self._lanes_lock:
+            if self._running:
+                return
+            self._running = True
+            for _lane in self._lanes.values():
+                self._start_lane(_lane)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        with self._lanes_lock:
+            self._running = False
+            _lanes: List["EventBusService.Lane"] = list(self._lanes.values())
+        for _lane in _lanes:
+            with _lane.condition:
+                _lane.condition.notify_all()
+        # Workers dispatch the events that are already queued before exiting, so state updates are not lost on shutdown.
+        for _lane in _lanes:
+            for _thread in _lane.threads:
+                _thread.join(timeout)
+            _lane.threads = []
+
+    def publish(self, event_type: str, *args: Any) -> bool:
+        with self._subscribers_lock:
+            if not self._subscribers.get(event_type):
+                return False
+        _event = self.Event(event_type, self._copy_payload(args))
+        self._record(event_type, "published")
+        if not self._running:
+            self._dispatch(_event)
+            return True
+
+        _lane: "EventBusService.Lane" = self._get_lane(event_type)
+        with _lane.condition:
+            if len(_lane.queue) >= self._max_queue_size and _lane.overload_policy == self.OVERLOAD_BLOCK:
+                # The publishing pymumble thread is held back for a bounded time only, then the new event is dropped.
+                _deadline: float = time.monotonic() + self._block_timeout
+                while self._running and len(_lane.queue) >= self._max_queue_size:
+                    _remaining: float = _deadline - time.monotonic()
+                    if _remaining <= 0:
+                        break
+                    _lane.condition.wait(_remaining)
+            if len(_lane.queue) >= self._max_queue_size:
+                if _lane.overload_policy == self.OVERLOAD_DROP_OLDEST:
+                    _dropped: "EventBusService.Event" = _lane.queue.popleft()
+                    self._record(_dropped.event_type, "dropped", pending=-1)
+                else:
+                    _dropped = _event
+                    self._record(_dropped.event_type, "dropped")
+                logger.warning(
+                    f"[{LogOutputIdentifiers.MUMBLE}]: Event queue '{_lane.name}' is full ({self._max_queue_size}): "
+                    f"dropped a '{_dropped.event_type}' event."
+                )
+                if _dropped is _event:
+                    return False
+            _lane.queue.append(_event)
+            self._record(event_type, None, pending=1)
+            _lane.condition.notify_all()
+        return True
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._metrics_lock:
+            return {event_type: dict(metrics) for event_type, metrics in self._metrics.items()}
+
+    def reset_metrics(self) -> None:
+        with self._metrics_lock:
+            for _metrics in self._metrics.values():
+                _pending: int = _metrics["pending"]
+                _metrics.update(self._new_metrics())
+                # Pending events are still in the queues, so their count is carried over.
+                _metrics["pending"] = _pending
+
+    def _get_lane(self, event_type: str) -> Lane:
+        _lane_name: str = self._lane_names.get(event_type, event_type)
+        with self._lanes_lock:
+            _lane: Optional["EventBusService.Lane"] = self._lanes.get(_lane_name)
+            if _lane is None:
+                _options: Dict[str, Any] = self._lane_options.get(_lane_name, {})
+                _lane = self.Lane(_lane_name, _options.get("overload_policy", self._overload_policy), _options.get("workers", 1))
+                self._lanes[_lane_name] = _lane
+                if self._running:
+                    self._start_lane(_lane)
+            return _lane
+
+    def _start_lane(self, lane: Lane) -> None:
+        lane.threads = [thread for thread in lane.threads if thread.is_alive()]
+        for _idx in range(len(lane.threads), lane.workers):
+            _thread = threading.Thread(name=f"mumimo-events-{lane.name}-{_idx}", target=run_in_current_context(self._run), args=(lane,), daemon=True)
+            _thread.start()
+            lane.threads.append(_thread)
+
+    def _run(self, lane: Lane) -> None:
+        while True:
+            with lane.condition:
+                while self._running and not lane.queue:
+                    lane.condition.wait()
+                if not lane.queue:
+                    return
+                _event: "EventBusService.Event" = lane.queue.popleft()
+                # Wakes publishers that are blocked on a full queue.
+                lane.condition.notify_all()
+            self._record(_event.event_type, None, pending=-1, wait=time.monotonic() - _event.published_at)
+            self._dispatch(_event)
+
+    def _dispatch(self, event: Event) -> None:
+        for _subscriber in self.get_subscribers(event.event_type):
+            try:
+                _subscriber(*event.args)
+            except Exception as exc:
+                self._record(event.event_type, "failed")
+                logger.warning(f"[{LogOutputIdentifiers.MUMBLE}]: An event subscriber failed to handle a '{event.event_type}' event: {exc}")
+        self._record(event.event_type, "dispatched")
+
+    def _record(self, event_type: str, metric: Optional[str], pending: int = 0, wait: Optional[float] = None) -> None:
+        with self._metrics_lock:
+            _metrics: Dict[str, Any] = self._metrics.setdefault(event_type, self._new_metrics())
+            if metric is not None:
+                _metrics[metric] += 1
+            _metrics["pending"] += pending
+            _metrics["max_pending"] = max(_metrics["max_pending"], _metrics["pending"])
+            if wait is not None:
+                _metrics["max_wait"] = max(_metrics["max_wait"], wait)
+
+    @staticmethod
+    def _new_metrics() -> Dict[str, Any]:
+        return {"published": 0, "dispatched": 0, "dropped": 0, "failed": 0, "pending": 0, "max_pending": 0, "max_wait": 0.0}
+
+    @staticmethod
+    def _copy_payload(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        # Plain dicts such as the 'actions' of an update are copied, so the queued event does not change if the publisher modifies them later.
+        # User and channel objects are dict subclasses that subscribers keep as live references, so they are passed through as-is.
+        return tuple(dict(arg) if type(arg) is dict else arg for arg in args)
@@ -28,4 +28,6 @@ class ConfigInitService:
         _cfg_instance = settings.configs.get_mumimo_config()
         if _cfg_instance is None:
             raise ConfigError("An unexpected error occurred where the config file was not read during initialization.", logger=logger)
+        # Building the snapshot validates the config, so an invalid config fails at startup instead of in the middle of a command.
+        settings.configs.get_config_snapshot()
         return _cfg_instance
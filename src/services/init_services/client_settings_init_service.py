@@ -25,6 +25,10 @@ class ClientSettingsInitService:
         self._prioritized_cfg_opts = self._get_prioritized_client_config_options(cfg_instance)
         self._prioritized_env_opts = self._get_prioritized_client_env_options()
 
+    def apply_prioritized_cfg_options(self, cfg_instance: "Config") -> None:
+        # System arguments are written over the config file when it is reloaded, as they were when the client settings were initialized.
+        self._get_prioritized_client_config_options(cfg_instance)
+
     def get_connection_parameters(self) -> Dict[str, Any]:
         _prioritized_env_opts = self.get_prioritized_env_options()
         _prioritized_cfg_opts = self.get_prioritized_cfg_options()
@@ -24,6 +24,32 @@ class MumimoInitService:
         self._gui_init_service: GUIInitService = GUIInitService(sys_args)
 
     async def initialize(self) -> None:
+        await self._initialize_settings()
+        # Initialize mumimo gui settings.
+        logger.info("Initializing client gui settings...")
+        self._gui_init_service.initialize_gui(self._sys_args.get(SysArgs.SYS_GUI_THEMES_FILE))
+        logger.info("Client gui settings initialized.")
+        # Initialize the internal database.
+        await self._initialize_database()
+        # Initialize the plugins.
+        logger.info("Mumimo plugins initializing...")
+        await self._plugins_init_service.initialize_plugins(self._db_init_service)
+        logger.info("Mumimo plugins initialized.")
+
+    async def initialize_for_transfer(self) -> DatabaseService:
+        # Database transfers only need the configuration and the database connection.
+        # Default values are not imported so that imported rows do not collide with them.
+        await self._initialize_settings()
+        await self._initialize_database(import_defaults=False)
+        return self._db_init_service
+
+    async def initialize_for_supervisor(self) -> DatabaseService:
+        # The supervisor prepares the shared database once so that its workers do not race to create the schema.
+        await self._initialize_settings()
+        await self._initialize_database()
+        return self._db_init_service
+
+    async def _initialize_settings(self) -> None:
         # Initialize the mumimo configuration file.
         logger.info("Initializing configuration file...")
         cfg: "Config" = self._cfg_init_service.initialize_config(self._sys_args.get(SysArgs.SYS_CONFIG_FILE))
@@ -32,11 +58,8 @@ class MumimoInitService:
         logger.info("Initializing client settings...")
         self._client_settings_init_service.initialize_client_settings(cfg)
         logger.info("Mumimo client settings initialized.")
-        # Initialize mumimo gui settings.
-        logger.info("Initializing client gui settings...")
-        self._gui_init_service.initialize_gui(self._sys_args.get(SysArgs.SYS_GUI_THEMES_FILE))
-        logger.info("Client gui settings initialized.")
-        # Initialize the internal database.
+
+    async def _initialize_database(self, import_defaults: bool = True) -> None:
         logger.info("Initializing internal database...")
         # print(cfg)
         _prioritized_cfg_opts = self._client_settings_init_service.get_prioritized_cfg_options()
@@ -54,12 +77,9 @@ class MumimoInitService:
             local_database_dialect=_prioritized_cfg_opts.get(SysArgs.SYS_DB_LOCALDBDIALECT, None),
             local_database_path=_prioritized_cfg_opts.get(SysArgs.SYS_DB_LOCALDBPATH, None),
             local_database_driver=_prioritized_cfg_opts.get(SysArgs.SYS_DB_LOCALDBDRIVER, None),
+            import_defaults=import_defaults,
         )
         logger.info("Mumimo internal database initialized.")
-        # Initialize the plugins.
-        logger.info("Mumimo plugins initializing...")
-        await self._plugins_init_service.initialize_plugins(self._db_init_service)
-        logger.info("Mumimo plugins initialized.")
 
     async def get_connection_parameters(self) -> Dict[str, Any]:
         return self._client_settings_init_service.get_connection_parameters()
@@ -13,6 +13,7 @@ from ...lib.command_callbacks import CommandCallbacks
 from ...lib.database.models.command import CommandTable
 from ...lib.database.models.permission_group import PermissionGroupTable
 from ...lib.database.models.plugin import PluginTable
+from ...lib.frameworks.plugins.event_dispatcher import PluginEventDispatcher
 from ...settings import settings
 
 if TYPE_CHECKING:
@@ -240,6 +241,16 @@ class PluginsInitService:
                 _plugin = _registered_plugin(_plugin_name)
                 _plugin.start()
                 settings.plugins.set_registered_plugin(_plugin_name, _plugin)
+                # Register the server events the plugin subscribes to, they are routed to it once the murmur connection is set up.
+                _event_dispatcher: Optional[PluginEventDispatcher] = settings.plugins.get_event_dispatcher()
+                if _event_dispatcher is None:
+                    _event_dispatcher = PluginEventDispatcher()
+                    settings.plugins.set_event_dispatcher(_event_dispatcher)
+                _subscription_count: int = _event_dispatcher.register_plugin(_plugin)
+                if _subscription_count:
+                    logger.debug(
+                        f"[{LogOutputIdentifiers.PLUGINS}]: Registered {_subscription_count} event subscriptions for plugin '{_plugin_name}'."
+                    )
 
         logger.info(
             f"[{LogOutputIdentifiers.PLUGINS}]: Initialized plugins: [{', '.join([k for k, v in settings.plugins.get_registered_plugins().items()])}]"
@@ -0,0 +1,169 @@
+import contextlib
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Optional
+
+from ..constants import LogOutputIdentifiers
+
+if TYPE_CHECKING:
+    from pymumble_py3.mumble import Mumble
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoopRateService:
+    _connection_instance: Optional["Mumble"]
+    _active_rate: float
+    _idle_rate: float
+    _idle_delay: float
+    _current_rate: float
+    _last_activity: float
+    _in_flight: int
+    _lock: threading.Lock
+
+    _hooked_sound_output: Any
+    _last_tick: Optional[float]
+    _tick_count: int
+    _mean_jitter: float
+    _max_jitter: float
+
+    DEFAULT_ACTIVE_RATE: float = 0.01
+    DEFAULT_IDLE_RATE: float = 0.1
+    DEFAULT_IDLE_DELAY: float = 2.0
+    JITTER_SMOOTHING: float = 0.1
+
+    @property
+    def active_rate(self) -> float:
+        return self._active_rate
+
+    @property
+    def idle_rate(self) -> float:
+        return self._idle_rate
+
+    @property
+    def idle_delay(self) -> float:
+        return self._idle_delay
+
+    @property
+    def current_rate(self) -> float:
+        return self._current_rate
+
+    @property
+    def is_active(self) -> bool:
+        return self._current_rate == self._active_rate
+
+    def __init__(
+        self,
+        connection_instance: Optional["Mumble"] = None,
+        active_rate: Optional[float] = DEFAULT_ACTIVE_RATE,
+        idle_rate: Optional[float] = DEFAULT_IDLE_RATE,
+        idle_delay: Optional[float] = DEFAULT_IDLE_DELAY,
+    ) -> None:
+        if active_rate is None or active_rate <= 0:
+            active_rate = self.DEFAULT_ACTIVE_RATE
+        if idle_rate is None or idle_rate <= 0:
+            idle_rate = self.DEFAULT_IDLE_RATE
+        if idle_delay is None or idle_delay < 0:
+            idle_delay = self.DEFAULT_IDLE_DELAY
+        if idle_rate < active_rate:
+            logger.warning(f"The idle loop rate ({idle_rate}s) is faster than the active loop rate ({active_rate}s): using the active rate for both.")
+            idle_rate = active_rate
+        self._active_rate = float(active_rate)
+        self._idle_rate = float(idle_rate)
+        self._idle_delay = float(idle_delay)
+        self._current_rate = self._idle_rate
+        self._last_activity = 0.0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._connection_instance = None
+        self._hooked_sound_output = None
+        self.reset_metrics()
+        if connection_instance is not None:
+            self.attach(connection_instance)
+
+    def attach(self, connection_instance: "Mumble") -> None:
+        # The sound output is recreated on every (re)connection, so this is also registered as a connection callback.
+        self._connection_instance = connection_instance
+        self._hook_tick(connection_instance)
+        connection_instance.set_loop_rate(self._current_rate)
+
+    def on_connected(self, *args) -> None:
+        if self._connection_instance is not None:
+            self.attach(self._connection_instance)
+
+    def mark_active(self) -> None:
+        self._last_activity = time.monotonic()
+        if not self.is_active:
+            self._set_rate(self._active_rate)
+
+    @contextlib.contextmanager
+    def track_activity(self) -> Generator[None, None, None]:
+        # Keeps the fast loop rate for the whole duration of long-running work such as command processing.
+        with self._lock:
+            self._in_flight += 1
+        self.mark_active()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self.mark_active()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "current_rate": self._current_rate,
+            "active": self.is_active,
+            "in_flight": self._in_flight,
+            "tick_count": self._tick_count,
+            "mean_jitter": self._mean_jitter,
+            "max_jitter": self._max_jitter,
+        }
+
+    def reset_metrics(self) -> None:
+        self._last_tick = None
+        self._tick_count = 0
+        self._mean_jitter = 0.0
+        self._max_jitter = 0.0
+
+    def _hook_tick(self, connection_instance: "Mumble") -> None:
+        _sound_output = getattr(connection_instance, "sound_output", None)
+        if _sound_output is None or _sound_output is self._hooked_sound_output:
+            return
+        # pymumble calls 'send_audio' once per loop iteration, which makes it the only per-tick hook available.
+        _send_audio: Callable = _sound_output.send_audio
+
+        def _tick_send_audio():
+            self._on_tick(_sound_output)
+            return _send_audio()
+
+        _sound_output.send_audio = _tick_send_audio
+        self._hooked_sound_output = _sound_output
+        self._last_tick = None
+
+    def _on_tick(self, sound_output: Any) -> None:
+        _now = time.monotonic()
+        if self._last_tick is not None:
+            # Ticks end early when the socket has data, so only the time spent past the expected rate counts as jitter.
+            _jitter = max(0.0, (_now - self._last_tick) - self._current_rate)
+            self._mean_jitter += (_jitter - self._mean_jitter) * self.JITTER_SMOOTHING
+            self._max_jitter = max(self._max_jitter, _jitter)
+        self._last_tick = _now
+        self._tick_count += 1
+
+        if sound_output.pcm:
+            self.mark_active()
+        elif self.is_active and self._in_flight == 0 and _now - self._last_activity >= self._idle_delay:
+            self._set_rate(self._idle_rate)
+
+    def _set_rate(self, rate: float) -> None:
+        self._current_rate = rate
+        # The tick in progress was scheduled with the previous rate, so it is excluded from the jitter measurement.
+        self._last_tick = None
+        if self._connection_instance is not None:
+            self._connection_instance.set_loop_rate(rate)
+        logger.debug(
+            f"[{LogOutputIdentifiers.MUMBLE}]: Loop rate set to {rate}s "
+            f"(mean jitter: {self._mean_jitter * 1000:.2f}ms, max jitter: {self._max_jitter * 1000:.2f}ms)."
+        )
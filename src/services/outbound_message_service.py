@@ -0,0 +1,242 @@
+import collections
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..constants import LogOutputIdentifiers
+from ..lib.server_context import run_in_current_context
+
+if TYPE_CHECKING:
+    from pymumble_py3.channels import Channel
+    from pymumble_py3.users import User
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboundMessageService:
+    class Message:
+        text: str
+        channels: List["Channel"]
+        users: List["User"]
+        target_key: Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+        def __init__(self, text: str, channels: Optional[List["Channel"]] = None, users: Optional[List["User"]] = None) -> None:
+            self.text = text
+            self.channels = list(channels or [])
+            self.users = list(users or [])
+            self.target_key = (
+                tuple(sorted(channel["channel_id"] for channel in self.channels)),
+                tuple(sorted(user["session"] for user in self.users)),
+            )
+
+    _deliver: Callable[[str, List["Channel"], List["User"]], int]
+    _queue: Deque[Message]
+    _condition: threading.Condition
+    _thread: Optional[threading.Thread]
+    _running: bool
+
+    _rate: float
+    _burst: float
+    _tokens: float
+    _last_refill: float
+    _max_queue_size: int
+    _max_merge_length: int
+
+    _enqueued: int
+    _sent: int
+    _packets: int
+    _merged: int
+    _dropped: int
+    _failed: int
+    _max_depth: int
+    _throttled_time: float
+
+    # Matches the default 'messagelimit' and 'messageburst' of a Murmur server.
+    DEFAULT_RATE: float = 1.0
+    DEFAULT_BURST: int = 5
+    DEFAULT_MAX_QUEUE_SIZE: int = 100
+    DEFAULT_MAX_MERGE_LENGTH: int = 5000
+    TABLE_CLOSE: str = "</table>"
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        return self._burst
+
+    @property
+    def queue_depth(self) -> int:
+        with self._condition:
+            return len(self._queue)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def __init__(
+        self,
+        deliver: Callable[[str, List["Channel"], List["User"]], int],
+        rate: Optional[float] = DEFAULT_RATE,
+        burst: Optional[int] = DEFAULT_BURST,
+        max_queue_size: Optional[int] = DEFAULT_MAX_QUEUE_SIZE,
+        max_merge_length: Optional[int] = DEFAULT_MAX_MERGE_LENGTH,
+    ) -> None:
+        if rate is None or rate <= 0:
+            rate = self.DEFAULT_RATE
+        if burst is None or burst < 1:
+            burst = self.DEFAULT_BURST
+        if max_queue_size is None or max_queue_size < 1:
+            max_queue_size = self.DEFAULT_MAX_QUEUE_SIZE
+        if max_merge_length is None or max_merge_length < 0:
+            max_merge_length = self.DEFAULT_MAX_MERGE_LENGTH
+        self._deliver = deliver
+        self._rate = float(rate)
+        self._burst = float(burst)
+        self._tokens = self._burst
+        self._last_refill = time.monotonic()
+        self._max_queue_size = int(max_queue_size)
+        self._max_merge_length = int(max_merge_length)
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self.reset_metrics()
+
+    def set_max_merge_length(self, max_merge_length: Optional[int]) -> None:
+        if not isinstance(max_merge_length, int) or max_merge_length < 0:
+            return
+        with self._condition:
+            self._max_merge_length = max_merge_length
+
+    def set_max_queue_size(self, max_queue_size: Optional[int]) -> None:
+        # Messages already queued beyond a smaller size are still sent, only new messages are dropped until the queue drains.
+        if max_queue_size is None or max_queue_size < 1:
+            max_queue_size = self.DEFAULT_MAX_QUEUE_SIZE
+        with self._condition:
+            self._max_queue_size = int(max_queue_size)
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        with self._condition:
+            self._running = True
+        self._thread = threading.Thread(target=run_in_current_context(self._run), name="mumimo-outbound-messages", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._condition:
+            if self._queue:
+                logger.warning(f"[{LogOutputIdentifiers.MUMBLE}]: Discarded {len(self._queue)} queued outbound messages on shutdown.")
+                self._dropped += len(self._queue)
+                self._queue.clear()
+
+    def enqueue(self, text: str, channels: Optional[List["Channel"]] = None, users: Optional[List["User"]] = None) -> None:
+        _message = self.Message(text, channels, users)
+        with self._condition:
+            self._enqueued += 1
+            if self._queue and self._merge(self._queue[-1], _message):
+                self._merged += 1
+                return
+            if len(self._queue) >= self._max_queue_size:
+                # The oldest reply is the most likely to be stale, so it is the one given up under sustained bursts.
+                _dropped = self._queue.popleft()
+                self._dropped += 1
+                logger.warning(
+                    f"[{LogOutputIdentifiers.MUMBLE}]: Outbound message queue is full ({self._max_queue_size}): "
+                    f"dropped a message to {len(_dropped.channels)} channels and {len(_dropped.users)} users "
+                    f"({self._dropped} dropped in total)."
+                )
+            self._queue.append(_message)
+            self._max_depth = max(self._max_depth, len(self._queue))
+            self._condition.notify()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self._max_depth,
+                "enqueued": self._enqueued,
+                "sent": self._sent,
+                "packets": self._packets,
+                "merged": self._merged,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "throttled_time": self._throttled_time,
+                "tokens": self._tokens,
+            }
+
+    def reset_metrics(self) -> None:
+        with self._condition:
+            self._enqueued = 0
+            self._sent = 0
+            self._packets = 0
+            self._merged = 0
+            self._dropped = 0
+            self._failed = 0
+            self._max_depth = 0
+            self._throttled_time = 0.0
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                _delay: float = self._reserve_token()
+                if _delay > 0:
+                    # Messages queued while waiting for a token can still be merged into the pending ones.
+                    _wait_start = time.monotonic()
+                    self._condition.wait(_delay)
+                    self._throttled_time += time.monotonic() - _wait_start
+                    continue
+                _message: "OutboundMessageService.Message" = self._queue.popleft()
+            try:
+                _packets: int = self._deliver(_message.text, _message.channels, _message.users)
+            except Exception as exc:
+                with self._condition:
+                    self._failed += 1
+                logger.warning(f"[{LogOutputIdentifiers.MUMBLE}]: Failed to send an outbound message: {exc}")
+                continue
+            with self._condition:
+                self._sent += 1
+                self._packets += _packets
+                # Murmur rate limits every packet, so packets beyond the reserved one are charged to the bucket as well.
+                self._tokens -= max(0, _packets - 1)
+
+    def _reserve_token(self) -> float:
+        _now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (_now - self._last_refill) * self._rate)
+        self._last_refill = _now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    def _merge(self, queued: Message, message: Message) -> bool:
+        if queued.target_key != message.target_key:
+            return False
+        _text: str = self._merge_text(queued.text, message.text)
+        if self._max_merge_length and len(_text) > self._max_merge_length:
+            return False
+        queued.text = _text
+        return True
+
+    @classmethod
+    def _merge_text(cls, first: str, second: str) -> str:
+        # GUI output is a single table, so consecutive tables with the same styling are combined into one table.
+        if first.endswith(cls.TABLE_CLOSE) and second.startswith("<table"):
+            _open_tag: str = second[: second.find(">") + 1]
+            if first.startswith(_open_tag):
+                return f"{first[: -len(cls.TABLE_CLOSE)]}{second[len(_open_tag):]}"
+        return f"{first}<br>{second}"
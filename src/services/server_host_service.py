@@ -0,0 +1,99 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from ..constants import LogOutputIdentifiers, MumimoCfgFields, SysArgs
+from ..exceptions import ConnectivityError, ServiceError
+from ..lib.server_context import ServerContext, use_server
+from ..murmur_connection import MurmurConnectionBase
+from ..settings import settings
+from ..utils import memory_utils
+
+logger = logging.getLogger(__name__)
+
+
+class ServerHostService:
+    _base_connection_params: Dict[str, Any]
+
+    CONNECTION_FIELDS: List[str] = [
+        SysArgs.SYS_HOST,
+        SysArgs.SYS_PORT,
+        SysArgs.SYS_USER,
+        SysArgs.SYS_PASS,
+        SysArgs.SYS_CERT,
+        SysArgs.SYS_KEY,
+        SysArgs.SYS_TOKENS,
+    ]
+
+    def __init__(self, base_connection_params: Dict[str, Any]) -> None:
+        self._base_connection_params = base_connection_params
+
+    def load_servers(self, server_configs: Optional[List[Dict[str, Any]]] = None) -> List[ServerContext]:
+        if server_configs is None:
+            _cfg_instance = settings.configs.get_mumimo_config()
+            if _cfg_instance is None:
+                raise ServiceError("Unable to load hosted servers: the mumimo config could not be retrieved.", logger=logger)
+            server_configs = _cfg_instance.get(MumimoCfgFields.SETTINGS.SERVERS.INSTANCES, []) or []
+        _contexts: List[ServerContext] = []
+        for _server_config in server_configs:
+            _name = _server_config.get("name")
+            if not _name:
+                raise ServiceError("Unable to load hosted servers: every server entry requires a 'name'.", logger=logger)
+            if _name in [context.name for context in _contexts] or settings.servers.get_server(_name) is not None:
+                raise ServiceError(f"Unable to load hosted servers: the server name '{_name}' is used more than once.", logger=logger)
+            # Connection fields that are not set for a server are inherited from the primary connection.
+            _connection_params = dict(self._base_connection_params)
+            _connection_params.update({field: _server_config[field] for field in self.CONNECTION_FIELDS if field in _server_config})
+            _contexts.append(ServerContext(_name, _connection_params, dict(_server_config.get("overrides", {}))))
+        return _contexts
+
+    async def start_server(self, context: ServerContext) -> bool:
+        _base_config = settings.configs.get_mumimo_config()
+        if _base_config is None:
+            raise ServiceError(f"Unable to start server '{context.name}': the mumimo config could not be retrieved.", logger=logger)
+        _memory_before: Optional[int] = memory_utils.get_resident_memory()
+        with use_server(context):
+            context.apply_config_overrides(_base_config)
+            logger.info(f"[{LogOutputIdentifiers.MUMBLE_SERVERS}]: Establishing Murmur connectivity for server '{context.name}'...")
+            _connection = MurmurConnectionBase()
+            _connection.setup(context.connection_params)
+            try:
+                _connection.ready().connect()
+            except ConnectivityError:
+                # One unreachable server should not keep the other hosted servers from starting.
+                logger.error(f"[{LogOutputIdentifiers.MUMBLE_SERVERS}]: Failed to establish Murmur connectivity for server '{context.name}'.")
+                _connection.stop()
+                return False
+            settings.connection.set_murmur_connection(_connection)
+            _client_state = settings.state.get_client_state()
+            if _client_state is not None:
+                _client_state.audio_properties.mute()
+            if not _connection.start():
+                logger.error(f"[{LogOutputIdentifiers.MUMBLE_SERVERS}]: Failed to start the connection thread for server '{context.name}'.")
+                return False
+            await _connection._async_post_connection_actions()
+        settings.servers.add_server(context)
+        _memory_after: Optional[int] = memory_utils.get_resident_memory()
+        if _memory_before is not None and _memory_after is not None:
+            context.memory_usage = _memory_after - _memory_before
+        logger.info(f"[{LogOutputIdentifiers.MUMBLE_SERVERS}]: Established Murmur connectivity for server '{context.name}'.")
+        return True
+
+    async def start_servers(self, contexts: List[ServerContext]) -> List[ServerContext]:
+        _started: List[ServerContext] = []
+        for _context in contexts:
+            if await self.start_server(_context):
+                _started.append(_context)
+        if _started:
+            logger.info(f"[{LogOutputIdentifiers.MUMBLE_SERVERS}]: Hosting {len(_started) + 1} servers in this process.")
+            for _context in _started:
+                if _context.memory_usage is not None:
+                    _memory_usage = _context.memory_usage / 1024 / 1024
+                    logger.info(f"[{LogOutputIdentifiers.MUMBLE_SERVERS}]: Server '{_context.name}' added {_memory_usage:.2f}MiB of resident memory.")
+        return _started
+
+    @staticmethod
+    def stop_servers() -> None:
+        for _name, _context in list(settings.servers.get_servers().items()):
+            logger.info(f"[{LogOutputIdentifiers.MUMBLE_SERVERS}]: Disconnecting from server '{_name}'...")
+            _context.stop()
+            settings.servers.remove_server(_name)
@@ -0,0 +1,325 @@
+import logging
+import multiprocessing
+import os
+import queue
+import random
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from ..constants import DEFAULT_PATH_CONFIG_CACHE_DIRECTORY, LogOutputIdentifiers, SysArgs
+from ..exceptions import ServiceError
+from ..lib.config_cache import config_cache
+from ..settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+PRIMARY_SERVER_NAME: str = "primary"
+
+
+def run_worker(sys_args: Dict[str, Any], status_queue: Any) -> None:
+    # Entry point of every worker process: a regular mumimo client restricted to a single server.
+    from ..logging import init_logger
+    from ..mumimo import MumimoService
+
+    config_cache.set_cache_directory(DEFAULT_PATH_CONFIG_CACHE_DIRECTORY)
+    init_logger(sys_args)
+    MumimoService(sys_args, status_queue)
+
+
+class WorkerStatusReporter:
+    _server_name: str
+    _status_queue: Any
+    _interval: float
+    _thread: Optional[threading.Thread]
+    _stop_event: threading.Event
+
+    DEFAULT_INTERVAL: float = 5.0
+
+    def __init__(self, server_name: str, status_queue: Any, interval: float = DEFAULT_INTERVAL) -> None:
+        self._server_name = server_name
+        self._status_queue = status_queue
+        self._interval = interval
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="mumimo-status-reporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval)
+            self._thread = None
+
+    def report(self) -> None:
+        try:
+            self._status_queue.put_nowait(self.collect_status(self._server_name))
+        except queue.Full:
+            logger.debug(f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: Skipped a status report: the supervisor status queue is full.")
+
+    def _run(self) -> None:
+        self.report()
+        while not self._stop_event.wait(self._interval):
+            self.report()
+
+    @staticmethod
+    def collect_status(server_name: str) -> Dict[str, Any]:
+        _murmur_connection = settings.connection.get_murmur_connection()
+        _loop_rate_service = settings.connection.get_loop_rate_service()
+        _client_state = settings.state.get_client_state()
+        _user_service = settings.database.get_user_persistence_service()
+        return {
+            "server": server_name,
+            "pid": os.getpid(),
+            "timestamp": time.time(),
+            "connected": _murmur_connection.is_connected if _murmur_connection is not None else False,
+            "users": len(_client_state.server_properties.state.users) if _client_state is not None else 0,
+            "pending_user_updates": _user_service.pending_count if _user_service is not None else 0,
+            "reconnect": _murmur_connection.reconnect_metrics if _murmur_connection is not None else {},
+            "loop_rate": _loop_rate_service.get_metrics() if _loop_rate_service is not None else {},
+        }
+
+
+class SupervisorService:
+    class Worker:
+        name: str
+        process: Optional[multiprocessing.process.BaseProcess]
+        restarts: int
+        consecutive_crashes: int
+        exitcode: Optional[int]
+        started_on: Optional[float]
+        restart_at: Optional[float]
+        status: Dict[str, Any]
+
+        def __init__(self, name: str) -> None:
+            self.name = name
+            self.process = None
+            self.restarts = 0
+            self.consecutive_crashes = 0
+            self.exitcode = None
+            self.started_on = None
+            self.restart_at = None
+            self.status = {}
+
+        @property
+        def is_alive(self) -> bool:
+            return self.process is not None and self.process.is_alive()
+
+    _sys_args: Dict[str, Any]
+    _workers: Dict[str, Worker]
+    _worker_target: Callable[[Dict[str, Any], Any], None]
+    _context: Any
+    _status_queue: Any
+    _stop_event: threading.Event
+    _health_interval: float
+    _restart_base_delay: float
+    _restart_max_delay: float
+    _stable_after: float
+
+    DEFAULT_HEALTH_INTERVAL: float = 30.0
+    DEFAULT_RESTART_BASE_DELAY: float = 1.0
+    DEFAULT_RESTART_MAX_DELAY: float = 60.0
+    # A worker that keeps crashing is restarted forever, so the backoff stops doubling long before the delay could overflow a float.
+    MAX_RESTART_BACKOFF_EXPONENT: int = 30
+    MONITOR_INTERVAL: float = 0.5
+    STOP_TIMEOUT: float = 10.0
+
+    def __init__(
+        self,
+        sys_args: Dict[str, Any],
+        server_names: List[str],
+        worker_target: Callable[[Dict[str, Any], Any], None] = run_worker,
+        health_interval: Optional[float] = DEFAULT_HEALTH_INTERVAL,
+        restart_base_delay: Optional[float] = DEFAULT_RESTART_BASE_DELAY,
+        restart_max_delay: Optional[float] = DEFAULT_RESTART_MAX_DELAY,
+    ) -> None:
+        if not server_names:
+            raise ServiceError("Unable to initialize the supervisor: no servers have been provided.", logger=logger)
+        if len(set(server_names)) != len(server_names):
+            raise ServiceError("Unable to initialize the supervisor: every server requires a unique name.", logger=logger)
+        if health_interval is None or health_interval <= 0:
+            health_interval = self.DEFAULT_HEALTH_INTERVAL
+        if restart_base_delay is None or restart_base_delay < 0:
+            restart_base_delay = self.DEFAULT_RESTART_BASE_DELAY
+        if restart_max_delay is None or restart_max_delay < restart_base_delay:
+            restart_max_delay = max(restart_base_delay, self.DEFAULT_RESTART_MAX_DELAY)
+        self._sys_args = sys_args
+        self._workers = {name: self.Worker(name) for name in server_names}
+        self._worker_target = worker_target
+        self._context = multiprocessing.get_context()
+        self._status_queue = self._context.Queue()
+        self._stop_event = threading.Event()
+        self._health_interval = float(health_interval)
+        self._restart_base_delay = float(restart_base_delay)
+        self._restart_max_delay = float(restart_max_delay)
+        # A worker that stays up for a full maximum backoff period is considered recovered.
+        self._stable_after = self._restart_max_delay
+
+    @property
+    def workers(self) -> Dict[str, Worker]:
+        return self._workers
+
+    @property
+    def is_stopping(self) -> bool:
+        return self._stop_event.is_set()
+
+    def start(self) -> None:
+        self._stop_event.clear()
+        for _worker in self._workers.values():
+            self._start_worker(_worker)
+
+    def run(self) -> None:
+        _previous_handlers: Dict[int, Any] = self._add_signal_handlers()
+        try:
+            self.start()
+            _next_report: float = time.monotonic() + self._health_interval
+            while not self._stop_event.is_set():
+                self.poll(self.MONITOR_INTERVAL)
+                if time.monotonic() >= _next_report:
+                    self._log_health()
+                    _next_report = time.monotonic() + self._health_interval
+                if not any(worker.is_alive or worker.restart_at is not None for worker in self._workers.values()):
+                    logger.info(f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: All workers have exited.")
+                    break
+        finally:
+            self.stop()
+            self._remove_signal_handlers(_previous_handlers)
+
+    def request_stop(self, *args) -> None:
+        self._stop_event.set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        for _worker in self._workers.values():
+            _worker.restart_at = None
+            if _worker.is_alive:
+                logger.info(f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: Stopping worker '{_worker.name}'...")
+                _worker.process.terminate()  # type: ignore
+        for _worker in self._workers.values():
+            if _worker.process is None:
+                continue
+            _worker.process.join(self.STOP_TIMEOUT)
+            if _worker.process.is_alive():
+                logger.warning(f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: Worker '{_worker.name}' did not exit in time and was killed.")
+                _worker.process.kill()
+                _worker.process.join()
+            _worker.exitcode = _worker.process.exitcode
+
+    def poll(self, timeout: float = 0) -> None:
+        # Blocks on the status queue, so status reports are handled as soon as they arrive.
+        self._drain_status(timeout)
+        _now = time.monotonic()
+        for _worker in self._workers.values():
+            if _worker.process is None:
+                continue
+            if _worker.is_alive:
+                if _worker.consecutive_crashes and _worker.started_on is not None and _now - _worker.started_on >= self._stable_after:
+                    _worker.consecutive_crashes = 0
+                continue
+            if _worker.restart_at is None and _worker.exitcode is None:
+                self._on_worker_exit(_worker, _now)
+            if _worker.restart_at is not None and _now >= _worker.restart_at and not self._stop_event.is_set():
+                _worker.restart_at = None
+                _worker.restarts += 1
+                self._start_worker(_worker)
+
+    def get_health(self) -> Dict[str, Any]:
+        _now = time.time()
+        _workers: Dict[str, Any] = {}
+        for _name, _worker in self._workers.items():
+            _status = dict(_worker.status)
+            _timestamp = _status.get("timestamp")
+            _workers[_name] = {
+                "pid": _worker.process.pid if _worker.process is not None else None,
+                "alive": _worker.is_alive,
+                "restarts": _worker.restarts,
+                "exitcode": _worker.exitcode,
+                "restart_pending": _worker.restart_at is not None,
+                "status_age": _now - _timestamp if _timestamp is not None else None,
+                "status": _status,
+            }
+        return {
+            "workers": _workers,
+            "totals": {
+                "workers": len(_workers),
+                "alive": sum(1 for worker in _workers.values() if worker["alive"]),
+                "connected": sum(1 for worker in _workers.values() if worker["status"].get("connected")),
+                "users": sum(worker["status"].get("users", 0) for worker in _workers.values()),
+                "restarts": sum(worker["restarts"] for worker in _workers.values()),
+            },
+        }
+
+    def _start_worker(self, worker: Worker) -> None:
+        _sys_args: Dict[str, Any] = dict(self._sys_args)
+        _sys_args[SysArgs.SYS_SUPERVISE] = False
+        _sys_args[SysArgs.SYS_WORKER_SERVER] = worker.name
+        worker.exitcode = None
+        worker.started_on = time.monotonic()
+        worker.status = {}
+        worker.process = self._context.Process(
+            target=self._worker_target,
+            args=(_sys_args, self._status_queue),
+            name=f"mumimo-worker-{worker.name}",
+        )
+        worker.process.start()
+        logger.info(f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: Started worker '{worker.name}' (pid: {worker.process.pid}).")
+
+    def _on_worker_exit(self, worker: Worker, now: float) -> None:
+        worker.process.join()  # type: ignore
+        worker.exitcode = worker.process.exitcode  # type: ignore
+        if worker.exitcode == 0 or self._stop_event.is_set():
+            logger.info(f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: Worker '{worker.name}' exited.")
+            return
+        _delay: float = self._get_restart_delay(worker.consecutive_crashes)
+        worker.consecutive_crashes += 1
+        worker.restart_at = now + _delay
+        logger.warning(
+            f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: Worker '{worker.name}' crashed with exit code {worker.exitcode}, "
+            f"restarting in {_delay:.2f}s."
+        )
+
+    def _get_restart_delay(self, attempt: int) -> float:
+        _delay: float = min(self._restart_max_delay, self._restart_base_delay * (2 ** min(attempt, self.MAX_RESTART_BACKOFF_EXPONENT)))
+        return _delay / 2 + random.uniform(0, _delay / 2)
+
+    def _drain_status(self, timeout: float) -> None:
+        _block: bool = timeout > 0
+        while True:
+            try:
+                _status: Dict[str, Any] = self._status_queue.get(block=_block, timeout=timeout if _block else None)
+            except queue.Empty:
+                return
+            _block = False
+            _worker = self._workers.get(_status.get("server", ""))
+            if _worker is not None:
+                _worker.status.update(_status)
+
+    def _log_health(self) -> None:
+        _health = self.get_health()
+        _totals = _health["totals"]
+        logger.info(
+            f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: {_totals['alive']}/{_totals['workers']} workers alive, "
+            f"{_totals['connected']} connected, {_totals['users']} users, {_totals['restarts']} restarts."
+        )
+        for _name, _worker in _health["workers"].items():
+            logger.debug(f"[{LogOutputIdentifiers.MUMBLE_SUPERVISOR}]: Worker '{_name}': {_worker}")
+
+    def _add_signal_handlers(self) -> Dict[int, Any]:
+        _previous_handlers: Dict[int, Any] = {}
+        if threading.current_thread() is not threading.main_thread():
+            return _previous_handlers
+        for _signal in (signal.SIGINT, signal.SIGTERM):
+            _previous_handlers[_signal] = signal.signal(_signal, self.request_stop)
+        return _previous_handlers
+
+    @staticmethod
+    def _remove_signal_handlers(previous_handlers: Dict[int, Any]) -> None:
+        for _signal, _handler in previous_handlers.items():
+            signal.signal(_signal, _handler)
@@ -0,0 +1,153 @@
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from pymumble_py3 import mumble_pb2
+from pymumble_py3.constants import PYMUMBLE_MSG_TYPES_TEXTMESSAGE
+from pymumble_py3.errors import ImageTooBigError, TextTooLongError
+from pymumble_py3.messages import Cmd
+
+from ..constants import LogOutputIdentifiers
+from ..exceptions import ServiceError
+
+if TYPE_CHECKING:
+    from pymumble_py3.channels import Channel
+    from pymumble_py3.mumble import Mumble
+    from pymumble_py3.users import User
+
+
+logger = logging.getLogger(__name__)
+
+
+MUMIMO_CMD_MULTI_TEXTMESSAGE: str = "MumimoMultiTargetTextMessage"
+
+
+class MultiTargetTextMessage(Cmd):
+    def __init__(self, channel_ids: List[int], sessions: List[int], message: str) -> None:
+        Cmd.__init__(self)
+        self.cmd = MUMIMO_CMD_MULTI_TEXTMESSAGE
+        self.parameters = {"channel_ids": channel_ids, "sessions": sessions, "message": message}
+
+
+class TextMessageService:
+    _connection_instance: Optional["Mumble"]
+    _hooked_instance: Optional["Mumble"]
+    _max_targets: int
+    _metrics_lock: threading.Lock
+    _messages_sent: int
+    _targets_sent: int
+    _packets_sent: int
+
+    DEFAULT_MAX_TARGETS: int = 0
+    # Murmur drops control connections that send a packet larger than this.
+    MAX_PACKET_SIZE: int = 0x7FFFFF
+    # A varint encoded channel id or session never needs more than 5 bytes, plus a 1 byte field tag.
+    MAX_TARGET_SIZE: int = 6
+
+    @property
+    def max_targets(self) -> int:
+        return self._max_targets
+
+    @property
+    def is_attached(self) -> bool:
+        return self._connection_instance is not None
+
+    @property
+    def packets_saved(self) -> int:
+        return self._targets_sent - self._packets_sent
+
+    def __init__(self, connection_instance: Optional["Mumble"] = None, max_targets: Optional[int] = DEFAULT_MAX_TARGETS) -> None:
+        if max_targets is None or max_targets < 0:
+            max_targets = self.DEFAULT_MAX_TARGETS
+        self._max_targets = int(max_targets)
+        self._connection_instance = None
+        self._hooked_instance = None
+        self._metrics_lock = threading.Lock()
+        self.reset_metrics()
+        if connection_instance is not None:
+            self.attach(connection_instance)
+
+    def attach(self, connection_instance: "Mumble") -> None:
+        self._connection_instance = connection_instance
+        if connection_instance is self._hooked_instance:
+            return
+        # pymumble only knows single target text messages, so multi-target packets are handled before its own command dispatch.
+        # Commands are sent from the pymumble thread, which keeps writes to the control socket on a single thread.
+        _treat_command = connection_instance.treat_command
+
+        def _treat_multi_target_command(cmd: Cmd) -> None:
+            if cmd.cmd != MUMIMO_CMD_MULTI_TEXTMESSAGE:
+                return _treat_command(cmd)
+            _text_message = mumble_pb2.TextMessage()
+            _text_message.channel_id.extend(cmd.parameters["channel_ids"])
+            _text_message.session.extend(cmd.parameters["sessions"])
+            _text_message.message = cmd.parameters["message"]
+            connection_instance.send_message(PYMUMBLE_MSG_TYPES_TEXTMESSAGE, _text_message)
+            cmd.response = True
+            connection_instance.commands.answer(cmd)
+
+        connection_instance.treat_command = _treat_multi_target_command
+        self._hooked_instance = connection_instance
+
+    def send(self, message: str, channels: Optional[Iterable["Channel"]] = None, users: Optional[Iterable["User"]] = None) -> int:
+        if self._connection_instance is None:
+            raise ServiceError("Unable to send text message: the text message service is not attached to a murmur connection.", logger=logger)
+        self._validate_message(message)
+        _channel_ids: List[int] = list(dict.fromkeys(channel["channel_id"] for channel in channels or []))
+        _sessions: List[int] = list(dict.fromkeys(user["session"] for user in users or []))
+        _targets: int = len(_channel_ids) + len(_sessions)
+        if _targets == 0:
+            return 0
+
+        _packets: int = 0
+        _batch_size: int = self._get_batch_size(message)
+        _all_targets: List[Any] = [(True, channel_id) for channel_id in _channel_ids] + [(False, session) for session in _sessions]
+        for _idx in range(0, _targets, _batch_size):
+            _batch = _all_targets[_idx : _idx + _batch_size]
+            _cmd = MultiTargetTextMessage(
+                [target for is_channel, target in _batch if is_channel],
+                [target for is_channel, target in _batch if not is_channel],
+                message,
+            )
+            self._connection_instance.execute_command(_cmd)
+            _packets += 1
+
+        with self._metrics_lock:
+            self._messages_sent += 1
+            self._targets_sent += _targets
+            self._packets_sent += _packets
+        if _packets < _targets:
+            logger.debug(f"[{LogOutputIdentifiers.MUMBLE}]: Sent a text message to {_targets} targets in {_packets} packets.")
+        return _packets
+
+    def get_metrics(self) -> Dict[str, int]:
+        with self._metrics_lock:
+            return {
+                "messages_sent": self._messages_sent,
+                "targets_sent": self._targets_sent,
+                "packets_sent": self._packets_sent,
+                "packets_saved": self._targets_sent - self._packets_sent,
+            }
+
+    def reset_metrics(self) -> None:
+        with self._metrics_lock:
+            self._messages_sent = 0
+            self._targets_sent = 0
+            self._packets_sent = 0
+
+    def _get_batch_size(self, message: str) -> int:
+        _available: int = self.MAX_PACKET_SIZE - len(message.encode("utf-8")) - self.MAX_TARGET_SIZE
+        _batch_size: int = max(1, _available // self.MAX_TARGET_SIZE)
+        if self._max_targets > 0:
+            _batch_size = min(_batch_size, self._max_targets)
+        return _batch_size
+
+    def _validate_message(self, message: str) -> None:
+        # Mirrors the length checks pymumble applies to single target messages.
+        _max_image_length: int = self._connection_instance.get_max_image_length()  # type: ignore
+        if len(message) > _max_image_length != 0:
+            raise ImageTooBigError(_max_image_length)
+        if not ("<img" in message and "src" in message):
+            _max_message_length: int = self._connection_instance.get_max_message_length()  # type: ignore
+            if len(message) > _max_message_length != 0:
+                raise TextTooLongError(_max_message_length)
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from ..constants import LogOutputIdentifiers
+from ..lib.server_context import run_in_current_context
+from ..utils import mumble_utils
+
+logger = logging.getLogger(__name__)
+
+
+class UserPersistenceService:
+    _thread: Optional[threading.Thread]
+    _loop: Optional[asyncio.AbstractEventLoop]
+    _pending: Dict[str, Dict[str, Any]]
+    _pending_lock: threading.Lock
+    _wakeup_event: threading.Event
+    _stop_event: threading.Event
+    _batch_window: float
+
+    DEFAULT_BATCH_WINDOW: float = 0.25
+
+    @property
+    def batch_window(self) -> float:
+        return self._batch_window
+
+    @property
+    def pending_count(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def __init__(self, batch_window: Optional[float] = DEFAULT_BATCH_WINDOW) -> None:
+        if batch_window is None or batch_window < 0:
+            batch_window = self.DEFAULT_BATCH_WINDOW
+        self._batch_window = float(batch_window)
+        self._thread = None
+        self._loop = None
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._wakeup_event = threading.Event()
+        self._stop_event = threading.Event()
+
+    def start(self) -> bool:
+        if self.is_running:
+            return False
+        self._stop_event.clear()
+        self._thread = threading.Thread(name="mumimo-user-writer", target=run_in_current_context(self._run), daemon=True)
+        self._thread.start()
+        logger.debug(f"[{LogOutputIdentifiers.DB_USERS}]: User persistence thread: [{self._thread.name} | {self._thread.ident}] started.")
+        return True
+
+    def stop(self) -> bool:
+        if self._thread is None:
+            return False
+        # Wake the writer so any pending join events are flushed before the thread exits.
+        self._stop_event.set()
+        self._wakeup_event.set()
+        self._thread.join()
+        logger.debug(f"[{LogOutputIdentifiers.DB_USERS}]: User persistence thread: [{self._thread.name}] closed.")
+        self._thread = None
+        return True
+
+    def user_joined(self, user: Dict[str, Any]) -> None:
+        # Called from the pymumble thread: only record the event and never block on database I/O.
+        with self._pending_lock:
+            self._pending[user["name"]] = user
+        self._wakeup_event.set()
+
+    def user_left(self, user: Dict[str, Any]) -> None:
+        # A user that leaves before the batch is flushed should not be written to the server state.
+        with self._pending_lock:
+            self._pending.pop(user["name"], None)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        with self._pending_lock:
+            _batch = list(self._pending.values())
+            self._pending.clear()
+            self._wakeup_event.clear()
+        return _batch
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        try:
+            while True:
+                self._wakeup_event.wait()
+                if not self._stop_event.is_set():
+                    # Collect the rest of the burst before writing; a stop request ends the window early.
+                    self._stop_event.wait(self._batch_window)
+                _batch = self._drain()
+                if _batch:
+                    self._flush(_batch)
+                if self._stop_event.is_set():
+                    break
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        if self._loop is None:
+            return
+        try:
+            self._loop.run_until_complete(mumble_utils.Management.UserManagement.add_users(batch))
+            logger.debug(f"[{LogOutputIdentifiers.DB_USERS}]: Flushed {len(batch)} user join event(s) in a single transaction.")
+        except Exception:
+            logger.exception(f"[{LogOutputIdentifiers.DB_USERS}]: Unable to flush {len(batch)} user join event(s).")
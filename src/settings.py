@@ -2,7 +2,9 @@ import logging
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 
+from .config_snapshot import ConfigSnapshot
 from .lib.command_callbacks import CommandCallbacks
+from .lib.server_context import ServerContext, get_current_server
 from .lib.singleton import singleton
 
 logger = logging.getLogger(__name__)
@@ -16,7 +18,16 @@ if TYPE_CHECKING:
     from .log_config import LogConfig
     from .murmur_connection import MurmurConnection
     from .services.database_service import DatabaseService
+    from .services.loop_rate_service import LoopRateService
+    from .services.outbound_message_service import OutboundMessageService
+    from .services.text_message_service import TextMessageService
+    from .services.event_bus_service import EventBusService
+    from .lib.frameworks.plugins.event_dispatcher import PluginEventDispatcher
+    from .lib.frameworks.gui.gui import GUIFramework
+    from .lib.frameworks.gui.pager import GUIPager
     from .services.cmd_processing_service import CommandProcessingService
+    from .services.config_save_service import ConfigSaveService
+    from .services.user_persistence_service import UserPersistenceService
 
 
 @singleton
@@ -27,16 +38,87 @@ class MumimoSettings:
     commands: "Commands"
     state: "State"
     database: "Database"
+    servers: "Servers"
+
+    # Per-server getters and setters use the server selected in the current context (see 'lib.server_context'),
+    # and fall back to the process-wide values for the primary server.
 
     class Connection:
         _murmur_connection: Optional["MurmurConnection"] = None
 
         def set_murmur_connection(self, murmur_connection: "MurmurConnection") -> None:
+            _server = get_current_server()
+            if _server is not None:
+                _server.murmur_connection = murmur_connection
+                return
             self._murmur_connection = murmur_connection
 
         def get_murmur_connection(self) -> Optional["MurmurConnection"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.murmur_connection
             return self._murmur_connection
 
+        _loop_rate_service: Optional["LoopRateService"] = None
+
+        def set_loop_rate_service(self, loop_rate_service: "LoopRateService") -> None:
+            _server = get_current_server()
+            if _server is not None:
+                _server.loop_rate_service = loop_rate_service
+                return
+            self._loop_rate_service = loop_rate_service
+
+        def get_loop_rate_service(self) -> Optional["LoopRateService"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.loop_rate_service
+            return self._loop_rate_service
+
+        _text_message_service: Optional["TextMessageService"] = None
+
+        def set_text_message_service(self, text_message_service: "TextMessageService") -> None:
+            _server = get_current_server()
+            if _server is not None:
+                _server.text_message_service = text_message_service
+                return
+            self._text_message_service = text_message_service
+
+        def get_text_message_service(self) -> Optional["TextMessageService"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.text_message_service
+            return self._text_message_service
+
+        _outbound_message_service: Optional["OutboundMessageService"] = None
+
+        def set_outbound_message_service(self, outbound_message_service: "OutboundMessageService") -> None:
+            _server = get_current_server()
+            if _server is not None:
+                _server.outbound_message_service = outbound_message_service
+                return
+            self._outbound_message_service = outbound_message_service
+
+        def get_outbound_message_service(self) -> Optional["OutboundMessageService"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.outbound_message_service
+            return self._outbound_message_service
+
+        _event_bus_service: Optional["EventBusService"] = None
+
+        def set_event_bus_service(self, event_bus_service: "EventBusService") -> None:
+            _server = get_current_server()
+            if _server is not None:
+                _server.event_bus_service = event_bus_service
+                return
+            self._event_bus_service = event_bus_service
+
+        def get_event_bus_service(self) -> Optional["EventBusService"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.event_bus_service
+            return self._event_bus_service
+
     class Plugins:
         _registered_plugins: Dict[str, "PluginBase"] = {}
 
@@ -49,17 +131,46 @@ class MumimoSettings:
         def set_registered_plugin(self, plugin_name: str, plugin: "PluginBase") -> None:
             self._registered_plugins[plugin_name] = plugin
 
+        _event_dispatcher: Optional["PluginEventDispatcher"] = None
+
+        def get_event_dispatcher(self) -> Optional["PluginEventDispatcher"]:
+            return self._event_dispatcher
+
+        def set_event_dispatcher(self, event_dispatcher: "PluginEventDispatcher") -> None:
+            self._event_dispatcher = event_dispatcher
+
     class Configs:
         _mumimo_cfg: Optional["Config"] = None
         _log_cfg: Optional["LogConfig"] = None
         _gui_themes: Optional["Config"] = None
 
         def get_mumimo_config(self) -> Optional["Config"]:
+            _server = get_current_server()
+            if _server is not None and _server.config is not None:
+                return _server.config
             return self._mumimo_cfg
 
         def set_mumimo_config(self, cfg: "Config") -> None:
             self._mumimo_cfg = cfg
 
+        _config_snapshot: Optional[ConfigSnapshot] = None
+
+        def get_config_snapshot(self) -> Optional[ConfigSnapshot]:
+            # The snapshot is rebuilt when the config was replaced or changed since it was built, and is always replaced as a whole.
+            _config: Optional["Config"] = self.get_mumimo_config()
+            if _config is None:
+                return None
+            _server = get_current_server()
+            _is_server_config: bool = _server is not None and _server.config is not None
+            _snapshot: Optional[ConfigSnapshot] = _server.config_snapshot if _is_server_config else self._config_snapshot  # type: ignore
+            if _snapshot is None or not _snapshot.is_snapshot_of(_config):
+                _snapshot = ConfigSnapshot.from_config(_config)
+                if _is_server_config:
+                    _server.config_snapshot = _snapshot  # type: ignore
+                else:
+                    self._config_snapshot = _snapshot
+            return _snapshot
+
         def get_log_config(self) -> Optional["LogConfig"]:
             return self._log_cfg
 
@@ -72,15 +183,60 @@ class MumimoSettings:
         def set_gui_themes(self, themes: "Config") -> Optional["Config"]:
             self._gui_themes = themes
 
+        _config_save_service: Optional["ConfigSaveService"] = None
+
+        def get_config_save_service(self) -> Optional["ConfigSaveService"]:
+            return self._config_save_service
+
+        def set_config_save_service(self, service: Optional["ConfigSaveService"]) -> None:
+            self._config_save_service = service
+
+        _gui_render_settings: Optional["GUIFramework.RenderSettings"] = None
+
+        def get_gui_render_settings(self) -> Optional["GUIFramework.RenderSettings"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.gui_render_settings
+            return self._gui_render_settings
+
+        def set_gui_render_settings(self, render_settings: "GUIFramework.RenderSettings") -> None:
+            # Hosted servers can select a different theme, so each one keeps its own compiled theme.
+            _server = get_current_server()
+            if _server is not None:
+                _server.gui_render_settings = render_settings
+                return
+            self._gui_render_settings = render_settings
+
     class State:
         _client_state: Optional["ClientState"] = None
+        _gui_pager: Optional["GUIPager"] = None
 
         def get_client_state(self) -> Optional["ClientState"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.client_state
             return self._client_state
 
         def set_client_state(self, client_state: "ClientState") -> None:
+            _server = get_current_server()
+            if _server is not None:
+                _server.client_state = client_state
+                return
             self._client_state = client_state
 
+        def get_gui_pager(self) -> Optional["GUIPager"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.gui_pager
+            return self._gui_pager
+
+        def set_gui_pager(self, pager: "GUIPager") -> None:
+            _server = get_current_server()
+            if _server is not None:
+                _server.gui_pager = pager
+                return
+            self._gui_pager = pager
+
     class Commands:
         history: "History"
         callbacks: "Callbacks"
@@ -95,23 +251,38 @@ class MumimoSettings:
             _cmd_processing_service: Optional["CommandProcessingService"] = None
 
             def set_cmd_processing_service(self, service: "CommandProcessingService") -> None:
+                _server = get_current_server()
+                if _server is not None:
+                    _server.cmd_processing_service = service
+                    return
                 self._cmd_processing_service = service
 
             def get_cmd_processing_service(self) -> Optional["CommandProcessingService"]:
+                _server = get_current_server()
+                if _server is not None:
+                    return _server.cmd_processing_service
                 return self._cmd_processing_service
 
         class History:
             _cmd_history: Optional["CommandHistory"] = None
 
             def get_command_history(self) -> Optional["CommandHistory"]:
+                _server = get_current_server()
+                if _server is not None:
+                    return _server.command_history
                 return self._cmd_history
 
             def set_command_history(self, history: "CommandHistory") -> None:
+                _server = get_current_server()
+                if _server is not None:
+                    _server.command_history = history
+                    return
                 self._cmd_history = history
 
             def add_command_to_history(self, command: "Command") -> Optional["Command"]:
-                if self._cmd_history:
-                    return self._cmd_history.add(command)
+                _history = self.get_command_history()
+                if _history:
+                    return _history.add(command)
                 return None
 
         class Callbacks:
@@ -147,6 +318,7 @@ class MumimoSettings:
 
     class Database:
         _database_instance: Optional["DatabaseService"] = None
+        _user_persistence_service: Optional["UserPersistenceService"] = None
 
         def get_database_instance(self) -> Optional["DatabaseService"]:
             return self._database_instance
@@ -154,6 +326,34 @@ class MumimoSettings:
         def set_database_instance(self, instance: "DatabaseService") -> None:
             self._database_instance = instance
 
+        def get_user_persistence_service(self) -> Optional["UserPersistenceService"]:
+            _server = get_current_server()
+            if _server is not None:
+                return _server.user_persistence_service
+            return self._user_persistence_service
+
+        def set_user_persistence_service(self, service: Optional["UserPersistenceService"]) -> None:
+            _server = get_current_server()
+            if _server is not None:
+                _server.user_persistence_service = service
+                return
+            self._user_persistence_service = service
+
+    class Servers:
+        _servers: Dict[str, ServerContext] = {}
+
+        def get_servers(self) -> Dict[str, ServerContext]:
+            return self._servers
+
+        def get_server(self, name: str) -> Optional[ServerContext]:
+            return self._servers.get(name)
+
+        def add_server(self, server: ServerContext) -> None:
+            self._servers[server.name] = server
+
+        def remove_server(self, name: str) -> Optional[ServerContext]:
+            return self._servers.pop(name, None)
+
     def __init__(self) -> None:
         self.commands = self.Commands()
         self.configs = self.Configs()
@@ -161,6 +361,7 @@ class MumimoSettings:
         self.plugins = self.Plugins()
         self.state = self.State()
         self.database = self.Database()
+        self.servers = self.Servers()
 
 
 settings = MumimoSettings()
@@ -78,3 +78,25 @@ group_database.add_argument("-dbps", "--db-pass", help="specify the database con
 group_database.add_argument("-dbh", "--db-host", help="specify the database connection host for remote connections", type=str)
 group_database.add_argument("-dbp", "--db-port", help="specify the database connection port for remote connections", type=str)
 group_database.add_argument("-dbn", "--db-name", help="specify the database name for remote connections", type=str)
+
+# Database transfer system arguments
+group_database_transfer = args_parser.add_argument_group("database transfer")
+group_database_transfer.add_argument(
+    "-dbex", "--db-export", help="export all database tables to the specified jsonl file and exit without connecting to a server", type=str
+)
+group_database_transfer.add_argument(
+    "-dbim", "--db-import", help="import all database tables from the specified jsonl file and exit without connecting to a server", type=str
+)
+group_database_transfer.add_argument(
+    "-dbbs", "--db-batch-size", help="the number of rows read or written per batch during a database export or import", type=int
+)
+
+# Supervisor system arguments
+group_supervisor = args_parser.add_argument_group("supervisor")
+group_supervisor.add_argument(
+    "-sup",
+    "--supervise",
+    help="run the primary server and every configured server in separate worker processes and restart workers that crash",
+    action="store_true",
+)
+group_supervisor.add_argument("-ws", "--worker-server", help=argparse.SUPPRESS, type=str)
@@ -0,0 +1,19 @@
+import os
+import sys
+from typing import Optional
+
+
+def get_resident_memory() -> Optional[int]:
+    # '/proc' is only available on Linux, other platforms fall back to the peak resident size reported by 'resource'.
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as file_handler:
+            return int(file_handler.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        _max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return _max_rss if sys.platform == "darwin" else _max_rss * 1024
+    except (ImportError, ValueError):
+        return None
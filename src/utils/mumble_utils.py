@@ -21,7 +21,10 @@ if TYPE_CHECKING:
     from pymumble_py3 import Mumble
 
     from ..murmur_connection import MurmurConnection
+    from ..client_state import ClientState
     from ..services.database_service import DatabaseService
+    from ..services.outbound_message_service import OutboundMessageService
+    from ..services.text_message_service import TextMessageService
 
 
 def echo(
@@ -64,8 +67,8 @@ def echo(
     if target_channels:
         if _delay > 0:
             time.sleep(_delay)
+        send_text_message(text.strip(), channels=target_channels)
         for channel in target_channels:
-            channel.send_text_message(text.strip())
             logger.log(
                 level=log_severity,
                 msg=f"'{_user}' echoed [Channel->{channel['name']}]: {raw_text.strip()}",
@@ -73,8 +76,8 @@ def echo(
     elif target_users:
         if _delay > 0:
             time.sleep(_delay)
+        send_text_message(text.strip(), users=target_users)
         for user in target_users:
-            user.send_text_message(text.strip())
             logger.log(
                 level=log_severity,
                 msg=f"'{_user}' echoed [User->{user['name']}]: {raw_text.strip()}",
@@ -86,13 +89,52 @@ def echo(
             return None
         if _delay > 0:
             time.sleep(_delay)
-        _channel.send_text_message(text.strip())
+        send_text_message(text.strip(), channels=[_channel])
         logger.log(
             level=log_severity,
             msg=f"'{_user}' echoed [Channel->{_channel['name']}]: {raw_text.strip()}",
         )
 
 
+def send_text_message(text: str, channels: Optional[List["Channel"]] = None, users: Optional[List["User"]] = None) -> None:
+    # Messages are paced to the server's rate limits when the outbound queue is running, instead of being dropped by the server.
+    _outbound_service: Optional["OutboundMessageService"] = settings.connection.get_outbound_message_service()
+    if _outbound_service is not None and _outbound_service.is_running:
+        _outbound_service.enqueue(text, channels=channels, users=users)
+        return
+    deliver_text_message(text, channels=channels, users=users)
+
+
+def deliver_text_message(text: str, channels: Optional[List["Channel"]] = None, users: Optional[List["User"]] = None) -> int:
+    # All targets share one message, so they are packed into as few packets as possible when the connection supports it.
+    _text_message_service: Optional["TextMessageService"] = settings.connection.get_text_message_service()
+    if _text_message_service is not None and _text_message_service.is_attached:
+        return _text_message_service.send(text, channels=channels, users=users)
+    for channel in channels or []:
+        channel.send_text_message(text)
+    for user in users or []:
+        user.send_text_message(text)
+    return len(channels or []) + len(users or [])
+
+
+def get_max_message_length(image: bool = False) -> int:
+    # The limits are sent by the server in its ServerConfig message once connected. A value of 0 means there is no limit.
+    _inst: Optional["Mumble"] = Management.get_connection_instance()
+    if _inst is None:
+        return 0
+    if image:
+        return _inst.get_max_image_length() or 0
+    return _inst.get_max_message_length() or 0
+
+
+def _get_indexed_server_state() -> Optional["ClientState.ServerProperties.ServerState"]:
+    # The indexes are built once connected; lookups made before that fall back to scanning the pymumble state.
+    _client_state: Optional["ClientState"] = settings.state.get_client_state()
+    if _client_state is None or not _client_state.server_properties.state.is_indexed:
+        return None
+    return _client_state.server_properties.state
+
+
 def get_user_by_id(id: int) -> Optional["User"]:
     _inst: Optional["Mumble"] = Management.get_connection_instance()
     if _inst is not None:
@@ -104,6 +146,9 @@ def get_user_by_id(id: int) -> Optional["User"]:
 
 
 def get_user_by_name(name: str) -> Optional["User"]:
+    _server_state: Optional["ClientState.ServerProperties.ServerState"] = _get_indexed_server_state()
+    if _server_state is not None:
+        return _server_state.get_user_by_name(name)
     _inst: Optional["Mumble"] = Management.get_connection_instance()
     if _inst is not None:
         try:
@@ -142,6 +187,9 @@ def get_my_channel() -> Optional["Channel"]:
 
 
 def get_all_channels() -> List["Channel"]:
+    _server_state: Optional["ClientState.ServerProperties.ServerState"] = _get_indexed_server_state()
+    if _server_state is not None:
+        return _server_state.get_channel_list()
     _channels: List["Channel"] = []
     _inst: Optional["Mumble"] = Management.get_connection_instance()
     if _inst is not None:
@@ -154,6 +202,15 @@ def get_all_channels() -> List["Channel"]:
 
 def get_channel_by_name(channel_name: str) -> Optional["Channel"]:
     _inst: Optional["Mumble"] = Management.get_connection_instance()
+    _server_state: Optional["ClientState.ServerProperties.ServerState"] = _get_indexed_server_state()
+    if _inst is not None and _server_state is not None:
+        # Identically named channels can be told apart with their full path, such as 'Root/Games/CS'.
+        if _server_state.PATH_SEPARATOR in channel_name:
+            return get_channel_by_path(channel_name)
+        _channel_id: Optional[int] = _server_state.get_channel_id_by_name(channel_name.strip())
+        if _channel_id is None:
+            return None
+        return _server_state.get_channel(_channel_id)
     if _inst is not None:
         try:
             return _inst.channels.find_by_name(channel_name.strip())
@@ -162,6 +219,34 @@ def get_channel_by_name(channel_name: str) -> Optional["Channel"]:
     return None
 
 
+def get_channel_by_path(channel_path: str) -> Optional["Channel"]:
+    _server_state: Optional["ClientState.ServerProperties.ServerState"] = _get_indexed_server_state()
+    if _server_state is None:
+        return None
+    _channel_id: Optional[int] = _server_state.get_channel_id_by_path(channel_path)
+    if _channel_id is None:
+        return None
+    return _server_state.get_channel(_channel_id)
+
+
+def get_subtree_channels(channel: "Channel") -> List["Channel"]:
+    _server_state: Optional["ClientState.ServerProperties.ServerState"] = _get_indexed_server_state()
+    if _server_state is None:
+        return []
+    return [_server_state.get_channel(channel_id) for channel_id in _server_state.get_subtree_channel_ids(channel["channel_id"])]  # type: ignore
+
+
+def get_occupied_channels(include_myself: bool = False) -> List["Channel"]:
+    _server_state: Optional["ClientState.ServerProperties.ServerState"] = _get_indexed_server_state()
+    if _server_state is None:
+        return get_all_channels()
+    _excluded_sessions: List[int] = []
+    _inst: Optional["Mumble"] = Management.get_connection_instance()
+    if not include_myself and _inst is not None and _inst.users.myself_session is not None:
+        _excluded_sessions.append(_inst.users.myself_session)
+    return [_server_state.get_channel(channel_id) for channel_id in _server_state.get_occupied_channel_ids(_excluded_sessions)]  # type: ignore
+
+
 class Management:
     class UserManagement:
         @staticmethod
@@ -203,6 +288,44 @@ class Management:
                 await session.rollback()
                 return
 
+        @staticmethod
+        async def add_users(actors: List[Dict[str, Any]]) -> None:
+            if not actors:
+                return
+            _db_service: Optional["DatabaseService"] = settings.database.get_database_instance()
+            if not _db_service:
+                raise ServiceError("Unable to add new users: the database service could not retrieve the database instance.", logger=logger)
+
+            # Collapse duplicate join events so each user is only upserted once per batch.
+            _actors: Dict[str, Dict[str, Any]] = {actor["name"]: actor for actor in actors}
+
+            async with _db_service.session() as session:
+                _existing_query = await session.execute(select(UserTable.name).filter(UserTable.name.in_(_actors.keys())))
+                _existing_names = set(_existing_query.scalars().all())
+                _new_names: List[str] = [name for name in _actors.keys() if name not in _existing_names]
+                if _new_names:
+                    _permission_query = await session.execute(select(PermissionGroupTable).filter_by(name=DefaultPermissionGroups.DEFAULT_GUEST))
+                    _permission_info: Optional[PermissionGroupTable] = _permission_query.scalar()
+                    if not _permission_info:
+                        raise ServiceError(
+                            f"Unable to add new users: the default permission '{DefaultPermissionGroups.DEFAULT_GUEST}' is not in the database."
+                        )
+                    for _name in _new_names:
+                        _user_info = UserTable(name=_name)
+                        _user_info.permission_groups.append(_permission_info)
+                        session.add(_user_info)
+                    await session.commit()
+                    logger.debug(f"[{LogOutputIdentifiers.DB_USERS}]: Added new users to the database -> [{', '.join(_new_names)}]")
+
+            _client_state = settings.state.get_client_state()
+            if not _client_state:
+                raise ServiceError("Unable to add new users: the client state could not be retrieved.")
+            _server_state = _client_state.server_properties.state
+            for _name, _actor in _actors.items():
+                if not _server_state.add_user(_actor):
+                    logger.error(f"Unable to add new user '{_name}' to the server state.")
+            logger.debug(f"Added {len(_actors)} user(s) to the server state.")
+
         @staticmethod
         async def remove_user(actor: Dict[str, Any]) -> None:
             _db_service: Optional["DatabaseService"] = settings.database.get_database_instance()
@@ -253,6 +376,19 @@ class Management:
         logger.info("Gracefully exiting plugins...")
         for _, plugin in all_plugins.items():
             plugin.quit()
+        if settings.servers.get_servers():
+            from ..services.server_host_service import ServerHostService
+
+            logger.info("Disconnecting from hosted Murmur servers...")
+            ServerHostService.stop_servers()
+        _user_service = settings.database.get_user_persistence_service()
+        if _user_service is not None:
+            logger.info("Flushing pending user updates...")
+            _user_service.stop()
+        _config_save_service = settings.configs.get_config_save_service()
+        if _config_save_service is not None:
+            logger.info("Flushing pending config saves...")
+            _config_save_service.stop()
         _murmur_instance = settings.connection.get_murmur_connection()
         if _murmur_instance is not None:
             logger.info("Disconnecting from Murmur server...")
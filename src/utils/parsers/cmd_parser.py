@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from ...constants import MumimoCfgFields
 from ...exceptions import ServiceError
 from ...lib.command import Command
 from ...settings import settings
@@ -27,10 +26,10 @@ def parse_command(text) -> Optional[Command]:
     if not message:
         return None
 
-    _cfg_instance = settings.configs.get_mumimo_config()
-    if _cfg_instance is None:
+    _snapshot = settings.configs.get_config_snapshot()
+    if _snapshot is None:
         raise ServiceError("Unable to process commands: mumimo config is not initialized.")
-    if message[0] != _cfg_instance.get(MumimoCfgFields.SETTINGS.COMMANDS.TOKEN, "!"):
+    if message[0] != _snapshot.commands.token:
         return Command(message=message, actor=actor, channel_id=channel_id, session_id=session_id)
 
     text_parse_list: List[str] = message.split(" ", 1)
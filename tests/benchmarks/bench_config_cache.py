@@ -0,0 +1,57 @@
+"""
+Compares parsing config files with toml against loading them from the parsed-config cache, in memory and on disk.
+
+Usage: python -m tests.benchmarks.bench_config_cache
+"""
+
+import pathlib
+import tempfile
+import timeit
+from typing import Callable, List
+
+import toml
+
+from src.lib.config_cache import config_cache
+
+CONFIG_PATHS: List[pathlib.Path] = [
+    pathlib.Path("config/config_template.toml"),
+    pathlib.Path("config/logging_template.toml"),
+    pathlib.Path("src/plugins/builtin_core/resources/gui_themes_template.toml"),
+    *sorted(pathlib.Path("src/plugins").glob("*/metadata_template.toml")),
+]
+
+
+def _parse(path: pathlib.Path) -> dict:
+    # The parsing done before the cache was added.
+    with open(str(path), "r", encoding="utf-8") as file_handler:
+        return toml.load(file_handler, _dict=dict)
+
+
+def _load_from_disk(path: pathlib.Path) -> dict:
+    config_cache.clear()
+    return config_cache.load(path)
+
+
+def _measure(func: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as _cache_directory:
+        config_cache.set_cache_directory(_cache_directory)
+        print(f"{'file':<60} {'toml':>12} {'memory':>12} {'disk':>12}")
+        for _path in CONFIG_PATHS:
+            if not _path.is_file():
+                continue
+            assert config_cache.load(_path) == _parse(_path)
+            _results: List[float] = [
+                _measure(lambda: _parse(_path), 100),
+                _measure(lambda: config_cache.load(_path), 1000),
+                _measure(lambda: _load_from_disk(_path), 1000),
+            ]
+            print(f"{str(_path):<60} " + " ".join(f"{result:>9.2f} us" for result in _results))
+        config_cache.set_cache_directory(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compares config lookups that deep copy the whole config with lookups through the flattened field index.
+
+Usage: python -m tests.benchmarks.bench_config_get
+"""
+
+import copy
+import pathlib
+import timeit
+from typing import Any, Callable, List
+
+from src.config import Config
+from src.constants import MumimoCfgFields
+
+CONFIG_PATH: pathlib.Path = pathlib.Path("config/config_template.toml")
+FIELD_NAMES: List[str] = [
+    MumimoCfgFields.SETTINGS.COMMANDS.TOKEN,
+    MumimoCfgFields.SETTINGS.GUI.SELECTED_THEME,
+    MumimoCfgFields.SETTINGS.CONNECTION.LISTENING_CHANNEL_EXCLUSIONS,
+    "settings.media.audio_ducking",
+    "settings.missing.field",
+]
+
+
+def _deep_copy_get(config: Config, field_name: str) -> Any:
+    # The lookup used before the field index was added.
+    _field: Any = copy.deepcopy(config)
+    try:
+        for _key in field_name.split("."):
+            _field = _field[_key]
+    except KeyError:
+        return None
+    return _field
+
+
+def _measure(func: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    _config = Config(CONFIG_PATH)
+    _config.read()
+
+    print(f"{'field':<50} {'deep copy':>12} {'index':>12} {'index+copy':>12}")
+    for _field_name in FIELD_NAMES:
+        assert _config.get(_field_name, copy=True) == _deep_copy_get(_config, _field_name)
+        _results: List[float] = [
+            _measure(lambda: _deep_copy_get(_config, _field_name), 1000),
+            _measure(lambda: _config.get(_field_name), 100000),
+            _measure(lambda: _config.get(_field_name, copy=True), 10000),
+        ]
+        print(f"{_field_name:<50} " + " ".join(f"{result:>9.2f} us" for result in _results))
+
+    _number: int = 1000
+    _rebuild: float = _measure(lambda: (_config._invalidate_index(), _config._build_index()), _number)
+    print(f"index rebuild: {_rebuild:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compares the row-by-row content box builder with the compiled gui templates.
+
+Usage: python -m tests.benchmarks.bench_gui_rendering
+"""
+
+import pathlib
+import timeit
+from typing import Callable, List
+from unittest.mock import patch
+
+from src.config import Config
+from src.lib.frameworks.gui.gui import GUIFramework
+from src.settings import settings
+
+ROW_COUNTS: List[int] = [10, 100, 1000]
+CONFIG_PATH: pathlib.Path = pathlib.Path("config/config_template.toml")
+THEMES_PATH: pathlib.Path = pathlib.Path("src/plugins/builtin_core/resources/gui_themes_template.toml")
+
+
+def _content_box(rows: List[str]) -> str:
+    _content = GUIFramework.ContentBox()
+    _content.open()
+    for _row in rows:
+        _content.add_row(_row)
+    _content.close()
+    return _content.compile()
+
+
+def _measure(func: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    _config = Config(CONFIG_PATH)
+    _config.read()
+    settings.configs.set_mumimo_config(_config)
+    _themes = Config(THEMES_PATH)
+    _themes.read()
+    settings.configs.set_gui_themes(_themes)
+
+    print(f"{'rows':>6} {'content box':>14} {'render':>14} {'render+escape':>14} {'gui':>14}")
+    with patch("src.utils.mumble_utils.echo"):
+        for _count in ROW_COUNTS:
+            _rows: List[str] = [f"row {idx} <b>text</b>" for idx in range(_count)]
+            _number: int = max(10, 20000 // _count)
+            assert GUIFramework.render(_rows) == _content_box(_rows)
+            _results: List[float] = [
+                _measure(lambda: _content_box(_rows), _number),
+                _measure(lambda: GUIFramework.render(_rows), _number),
+                _measure(lambda: GUIFramework.render(_rows, escape=True), _number),
+                _measure(lambda: GUIFramework.gui(_rows, target_users=None), _number),
+            ]
+            print(f"{_count:>6} " + " ".join(f"{result:>11.1f} us" for result in _results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import html
+import pathlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config import Config
+from src.constants import MumimoCfgFields
+from src.lib.frameworks.gui.constants import TextTypes
+from src.lib.frameworks.gui.gui import GUIFramework
+from src.lib.frameworks.gui.template import BoxTemplate
+from src.settings import settings
+
+
+def _compile_content_box(rows, **kwargs) -> str:
+    _content = GUIFramework.ContentBox()
+    _content.open()
+    for _row in rows:
+        _content.add_row(_row, **kwargs)
+    _content.close()
+    return _content.compile()
+
+
+class TestGUIFramework:
+    @pytest.fixture(autouse=True)
+    def themes(self):
+        _themes = Config(pathlib.Path("src/plugins/builtin_core/resources/gui_themes_template.toml"))
+        _themes.read()
+        _config = Config()
+        _config.set(MumimoCfgFields.SETTINGS.GUI.SELECTED_THEME, "dark", create_keys_if_not_exists=True)
+        with patch.object(settings.configs, "_gui_themes", _themes), patch.object(settings.configs, "_mumimo_cfg", _config), patch.object(
+            settings.configs, "_gui_render_settings", None
+        ), patch.object(settings.state, "_gui_pager", None), patch.object(GUIFramework, "_render_cache", None):
+            yield _themes
+
+    class TestRenderSettings:
+        def test_compiles_selected_theme_once(self, themes: Config) -> None:
+            _render_settings = GUIFramework.get_render_settings()
+            assert _render_settings.theme_name == "dark"
+            assert _render_settings.table_open.startswith(f'<table bgcolor="{themes["dark"]["table_bg_color"]}"')
+            with patch.object(GUIFramework, "compile_theme") as mock_compile:
+                assert GUIFramework.get_render_settings() is _render_settings
+                mock_compile.assert_not_called()
+
+        def test_values_are_read_only(self) -> None:
+            with pytest.raises(TypeError):
+                GUIFramework.get_render_settings().values["text_color"] = "red"  # type: ignore
+
+        def test_refresh_swaps_theme(self, themes: Config) -> None:
+            _render_settings = GUIFramework.get_render_settings()
+            themes["dark"]["text_color"] = "red"
+            _refreshed = GUIFramework.refresh_theme()
+            assert _refreshed is not _render_settings
+            assert 'color="red"' in _refreshed.row_prefix
+            assert 'color="red"' not in _render_settings.row_prefix
+
+    class TestRender:
+        def test_compiled_render_matches_content_box(self) -> None:
+            _rows = ["first", "second"]
+            assert GUIFramework.render(_rows) == _compile_content_box(_rows)
+
+        def test_header_render_matches_content_box(self) -> None:
+            assert GUIFramework.render("title", text_type=TextTypes.HEADER) == _compile_content_box(["title"], text_type=TextTypes.HEADER)
+
+        def test_style_overrides_are_applied(self) -> None:
+            _text = GUIFramework.render("row", text_color="red", target_users=None)
+            assert '<font color="red">row</font>' in _text
+            assert 'color="red"' not in GUIFramework.render("row", target_users=None)
+
+    class TestBoxTemplate:
+        def test_empty_rows(self) -> None:
+            _template = BoxTemplate(GUIFramework.ContentBox.Settings())
+            assert _template.render([]) == f"{_template.table_open}{_template.table_close}"
+
+        def test_escapes_each_row_once(self) -> None:
+            _template = BoxTemplate(GUIFramework.ContentBox.Settings())
+            with patch("src.lib.frameworks.gui.template.html.escape", wraps=html.escape) as mock_escape:
+                _text: str = _template.render(["<b>first</b>", "a & b"], escape=True)
+            assert mock_escape.call_count == 2
+            assert "&lt;b&gt;first&lt;/b&gt;" in _text and "a &amp; b" in _text
+            assert "<b>first</b>" in _template.render(["<b>first</b>"])
+
+        def test_mixed_text_types(self) -> None:
+            _template = BoxTemplate(GUIFramework.ContentBox.Settings())
+            _header_prefix, _header_suffix = _template.get_row_fragments(TextTypes.HEADER)
+            _body_prefix, _body_suffix = _template.get_row_fragments(TextTypes.BODY)
+            assert "<th " in _header_prefix and "<td " in _body_prefix
+            assert (
+                _template.render_rows([(TextTypes.HEADER, "title"), (TextTypes.BODY, "row")])
+                == f"{_template.table_open}{_header_prefix}title{_header_suffix}{_body_prefix}row{_body_suffix}{_template.table_close}"
+            )
+
+    class TestPagination:
+        def test_pages_fit_the_limit(self) -> None:
+            _template = GUIFramework.get_render_settings().template
+            _rows = [f"row {idx} ✓" for idx in range(200)]
+            _pages = _template.paginate(_rows, 2000)
+            assert len(_pages) > 1
+            assert [row for page in _pages for row in page] == _rows
+            for _idx, _page in enumerate(_pages):
+                assert BoxTemplate.get_length(_template.render(_page)) <= 2000
+                if _idx + 1 < len(_pages):
+                    # Pages are only split when the next row does not fit.
+                    assert BoxTemplate.get_length(_template.render(_page + [_pages[_idx + 1][0]])) > 2000
+
+        def test_oversized_row_gets_own_page(self) -> None:
+            _template = GUIFramework.get_render_settings().template
+            assert _template.paginate(["short", "x" * 500, "short"], 300) == [["short"], ["x" * 500], ["short"]]
+
+        def test_gui_splits_long_output(self) -> None:
+            _rows = [f"row {idx}" for idx in range(100)]
+            with patch("src.utils.mumble_utils.get_max_message_length", return_value=1000), patch("src.utils.mumble_utils.echo") as mock_echo:
+                GUIFramework.gui(_rows, target_users=None, paged=False)
+            assert mock_echo.call_count > 1
+            assert all(BoxTemplate.get_length(call.args[0]) <= 1000 for call in mock_echo.call_args_list)
+
+        def test_paged_output_waits_for_more(self) -> None:
+            _rows = [f"row {idx}" for idx in range(100)]
+            with patch("src.utils.mumble_utils.get_max_message_length", return_value=1000), patch("src.utils.mumble_utils.echo") as mock_echo:
+                GUIFramework.gui(_rows, user_id=5, paged=True)
+                assert mock_echo.call_count == 1
+                assert "more' for the next page." in mock_echo.call_args.args[0]
+                _pages: int = GUIFramework.get_pager().get_remaining(5) + 1
+                while GUIFramework.show_next_page(5):
+                    pass
+            assert mock_echo.call_count == _pages
+            assert f"Page {_pages} of {_pages}." in mock_echo.call_args.args[0]
+            assert all(BoxTemplate.get_length(call.args[0]) <= 1000 for call in mock_echo.call_args_list)
+            assert not GUIFramework.show_next_page(5)
+
+    class TestRenderCache:
+        def test_cached_output_is_built_once(self) -> None:
+            _build = MagicMock(return_value=["first", "second"])
+            with patch("src.utils.mumble_utils.echo") as mock_echo:
+                GUIFramework.gui_cached("test.cached", ("key",), _build, target_users=None)
+                GUIFramework.gui_cached("test.cached", ("key",), _build, target_users=None)
+            _build.assert_called_once()
+            assert mock_echo.call_args_list[0].args[0] == mock_echo.call_args_list[1].args[0] == GUIFramework.render(["first", "second"])
+            assert GUIFramework.get_render_cache().get_metrics()["hits"] == 1
+
+        def test_arguments_and_styles_are_keyed(self) -> None:
+            _build = MagicMock(return_value="row")
+            with patch("src.utils.mumble_utils.echo"):
+                GUIFramework.gui_cached("test.cached", ("first",), _build, target_users=None)
+                GUIFramework.gui_cached("test.cached", ("second",), _build, target_users=None)
+                GUIFramework.gui_cached("test.cached", ("first",), _build, target_users=None, text_color="red")
+            assert _build.call_count == 3
+
+        def test_theme_refresh_invalidates(self, themes: Config) -> None:
+            _build = MagicMock(return_value="row")
+            with patch("src.utils.mumble_utils.echo") as mock_echo:
+                GUIFramework.gui_cached("test.cached", (), _build, target_users=None)
+                themes["dark"]["text_color"] = "red"
+                GUIFramework.refresh_theme()
+                GUIFramework.gui_cached("test.cached", (), _build, target_users=None)
+            assert _build.call_count == 2
+            assert 'color="red"' in mock_echo.call_args.args[0]
+
+    class TestCollect:
+        def test_merges_output_to_the_same_target(self) -> None:
+            _user = {"session": 1, "name": "user"}
+            with patch("src.utils.mumble_utils.echo") as mock_echo:
+                with GUIFramework.collect() as collector:
+                    GUIFramework.gui("first warning", target_users=_user)
+                    GUIFramework.gui(["second warning", "third warning"], target_users=[_user], user_id=1)
+                    mock_echo.assert_not_called()
+            assert collector.collected == 2
+            mock_echo.assert_called_once()
+            assert mock_echo.call_args.args[0] == GUIFramework.render(["first warning", "second warning", "third warning"])
+            assert mock_echo.call_args.kwargs["user_id"] == 1
+
+        def test_keeps_targets_and_styles_apart(self) -> None:
+            _first, _second = {"session": 1, "name": "first"}, {"session": 2, "name": "second"}
+            with patch("src.utils.mumble_utils.echo") as mock_echo:
+                with GUIFramework.collect():
+                    GUIFramework.gui("to first", target_users=_first)
+                    GUIFramework.gui("to second", target_users=_second)
+                    GUIFramework.gui("red to first", target_users=_first, text_color="red")
+                    GUIFramework.gui("again to first", target_users=_first)
+            assert [call.kwargs["target_users"] for call in mock_echo.call_args_list] == [_first, _second, _first]
+            assert mock_echo.call_args_list[0].args[0] == GUIFramework.render(["to first", "again to first"])
+
+        def test_nested_blocks_send_once(self) -> None:
+            with patch("src.utils.mumble_utils.echo") as mock_echo:
+                with GUIFramework.collect():
+                    GUIFramework.gui("outer", target_users=None)
+                    with GUIFramework.collect():
+                        GUIFramework.gui("inner", target_users=None)
+                    mock_echo.assert_not_called()
+            mock_echo.assert_called_once()
+
+        def test_sends_output_when_the_command_fails(self) -> None:
+            with patch("src.utils.mumble_utils.echo") as mock_echo:
+                with pytest.raises(RuntimeError):
+                    with GUIFramework.collect():
+                        GUIFramework.gui("before the error", target_users=None)
+                        raise RuntimeError("command failed")
+            mock_echo.assert_called_once()
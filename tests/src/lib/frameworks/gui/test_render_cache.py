@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.lib.frameworks.gui.render_cache import RenderCache
+
+
+class TestRenderCache:
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        yield RenderCache(max_size=2)
+
+    def test_evicts_least_recently_used(self, cache: RenderCache) -> None:
+        cache.put(("a",), "first")
+        cache.put(("b",), "second")
+        assert cache.get(("a",)) == "first"
+        cache.put(("c",), "third")
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == "first"
+        assert cache.get_metrics()["evictions"] == 1
+
+    def test_get_or_render_counts_hits(self, cache: RenderCache) -> None:
+        _render = MagicMock(return_value="rendered")
+        for _ in range(4):
+            assert cache.get_or_render(("a", 1), _render) == "rendered"
+        _render.assert_called_once()
+        _metrics = cache.get_metrics()
+        assert (_metrics["hits"], _metrics["misses"], _metrics["hit_rate"]) == (3, 1, 0.75)
+
+    def test_invalidate_template(self, cache: RenderCache) -> None:
+        cache.put(("a", 1), "first")
+        cache.put(("b", 1), "second")
+        assert cache.invalidate("a") == 1
+        assert cache.get(("a", 1)) is None
+        assert cache.get(("b", 1)) == "second"
+        assert cache.invalidate() == 1
+        assert len(cache) == 0
+
+    def test_disabled_cache(self) -> None:
+        _cache = RenderCache(max_size=0)
+        _cache.put(("a",), "first")
+        assert _cache.get(("a",)) is None
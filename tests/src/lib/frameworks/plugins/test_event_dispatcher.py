@@ -0,0 +1,78 @@
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymumble_py3.constants import PYMUMBLE_CLBK_SOUNDRECEIVED, PYMUMBLE_CLBK_USERCREATED, PYMUMBLE_CLBK_USERUPDATED
+
+from src.client_state import ClientState
+from src.lib.frameworks.plugins.event_dispatcher import PluginEventDispatcher
+from src.lib.frameworks.plugins.plugin import PluginBase, PluginConstants, PluginEvent
+from src.services.event_bus_service import EventBusService
+
+
+class GreeterPlugin(PluginBase):
+    event = PluginBase.makeEventRegister()
+    received: List[PluginEvent]
+
+    def __init__(self, plugin_name: str) -> None:
+        self._plugin_name = plugin_name
+        self._is_running = True
+        self.received = []
+
+    @event(PluginConstants.Event.USER_JOINED, PluginConstants.Event.USER_MOVED, channels=["Root/Lobby*"])
+    def greet(self, event: PluginEvent) -> None:
+        self.received.append(event)
+
+
+class TestPluginEventDispatcher:
+    @pytest.fixture(autouse=True)
+    def client_state(self):
+        _client_state = ClientState(MagicMock())
+        _client_state.server_properties.state.rebuild_indexes(
+            [], [{"channel_id": 0, "name": "Root"}, {"channel_id": 1, "name": "Lobby", "parent": 0}, {"channel_id": 2, "name": "AFK", "parent": 0}]
+        )
+        with patch("src.settings.MumimoSettings.State.get_client_state", return_value=_client_state):
+            yield _client_state
+
+    @pytest.fixture(autouse=True)
+    def plugin(self) -> GreeterPlugin:
+        return GreeterPlugin("greeter")
+
+    @pytest.fixture(autouse=True)
+    def dispatcher(self, plugin: GreeterPlugin) -> PluginEventDispatcher:
+        _dispatcher = PluginEventDispatcher()
+        assert _dispatcher.register_plugin(plugin) == 2
+        return _dispatcher
+
+    def test_only_subscribed_callbacks_are_routed(self, dispatcher: PluginEventDispatcher) -> None:
+        assert dispatcher.get_callback_types() == [PYMUMBLE_CLBK_USERCREATED, PYMUMBLE_CLBK_USERUPDATED]
+        assert PYMUMBLE_CLBK_SOUNDRECEIVED not in dispatcher.get_callback_types()
+
+    def test_filters_by_channel_path(self, dispatcher: PluginEventDispatcher, plugin: GreeterPlugin) -> None:
+        with patch("src.settings.MumimoSettings.Connection.get_event_bus_service", return_value=None):
+            assert dispatcher.handle(PYMUMBLE_CLBK_USERCREATED, {"name": "alice", "session": 1, "channel_id": 1}) == 1
+            assert dispatcher.handle(PYMUMBLE_CLBK_USERCREATED, {"name": "bob", "session": 2, "channel_id": 2}) == 0
+            # Updates that do not change the channel are not moves.
+            assert dispatcher.handle(PYMUMBLE_CLBK_USERUPDATED, {"name": "bob", "session": 2, "channel_id": 2}, {"mute": True}) == 0
+            assert dispatcher.handle(PYMUMBLE_CLBK_USERUPDATED, {"name": "bob", "session": 2, "channel_id": 1}, {"channel_id": 1}) == 1
+        assert [(event.event_type, event.user["name"], event.channel_path) for event in plugin.received] == [
+            (PluginConstants.Event.USER_JOINED, "alice", "Root/Lobby"),
+            (PluginConstants.Event.USER_MOVED, "bob", "Root/Lobby"),
+        ]
+
+    def test_stopped_plugin_is_skipped(self, dispatcher: PluginEventDispatcher, plugin: GreeterPlugin) -> None:
+        plugin._is_running = False
+        with patch("src.settings.MumimoSettings.Connection.get_event_bus_service", return_value=None):
+            assert dispatcher.handle(PYMUMBLE_CLBK_USERCREATED, {"name": "alice", "session": 1, "channel_id": 1}) == 0
+
+    def test_delivers_through_plugin_lane(self, dispatcher: PluginEventDispatcher, plugin: GreeterPlugin) -> None:
+        _event_bus = EventBusService()
+        dispatcher.attach(_event_bus)
+        assert _event_bus.get_subscribers(dispatcher.get_lane_name("greeter"))
+        _event_bus.start()
+        with patch("src.settings.MumimoSettings.Connection.get_event_bus_service", return_value=_event_bus):
+            _event_bus.publish(PYMUMBLE_CLBK_USERCREATED, {"name": "alice", "session": 1, "channel_id": 1})
+            # Stopping drains both the callback lane and the plugin lane it publishes to.
+            _event_bus.stop()
+        assert [event.user["name"] for event in plugin.received] == ["alice"]
+        assert _event_bus.get_metrics()[dispatcher.get_lane_name("greeter")]["dispatched"] == 1
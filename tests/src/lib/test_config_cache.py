@@ -0,0 +1,75 @@
+import datetime
+import pathlib
+
+import pytest
+
+from src.config import Config
+from src.lib.config_cache import ConfigCache, config_cache
+
+
+class TestConfigCache:
+    @pytest.fixture(autouse=True)
+    def cache_directory(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        _cache_directory = tmp_path / "cache"
+        config_cache.set_cache_directory(_cache_directory)
+        config_cache.clear()
+        config_cache.reset_metrics()
+        yield _cache_directory
+        config_cache.set_cache_directory(None)
+        config_cache.clear()
+
+    @pytest.fixture(autouse=True)
+    def config_file(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        _path = tmp_path / "config.toml"
+        _path.write_text('[settings]\ntheme = "dark"\nthemes = ["dark", "light"]\n', encoding="utf-8")
+        return _path
+
+    class TestLoad:
+        def test_parsed_once(self, config_file: pathlib.Path) -> None:
+            assert config_cache.load(config_file) == config_cache.load(config_file)
+            assert config_cache.get_metrics()["misses"] == 1
+            assert config_cache.get_metrics()["hits"] == 1
+
+        def test_loads_are_copies(self, config_file: pathlib.Path) -> None:
+            _data = config_cache.load(config_file)
+            _data["settings"]["themes"].append("custom")
+            assert config_cache.load(config_file)["settings"]["themes"] == ["dark", "light"]
+
+        def test_changed_file(self, config_file: pathlib.Path) -> None:
+            config_cache.load(config_file)
+            config_file.write_text('[settings]\ntheme = "light"\n', encoding="utf-8")
+            assert config_cache.load(config_file) == {"settings": {"theme": "light"}}
+            assert config_cache.get_metrics()["misses"] == 2
+
+        def test_unmarshalable_values(self, config_file: pathlib.Path, cache_directory: pathlib.Path) -> None:
+            config_file.write_text("[settings]\ndate = 2020-01-01\n", encoding="utf-8")
+            assert config_cache.load(config_file) == config_cache.load(config_file) == {"settings": {"date": datetime.date(2020, 1, 1)}}
+            assert not cache_directory.exists()
+
+    class TestCacheDirectory:
+        def test_loaded_from_disk(self, config_file: pathlib.Path, cache_directory: pathlib.Path) -> None:
+            _data = config_cache.load(config_file)
+            assert len(list(cache_directory.glob(f"*{ConfigCache.FILE_SUFFIX}"))) == 1
+            config_cache.clear()
+            assert config_cache.load(config_file) == _data
+            assert config_cache.get_metrics()["disk_hits"] == 1
+
+        def test_corrupt_cache_file(self, config_file: pathlib.Path, cache_directory: pathlib.Path) -> None:
+            _data = config_cache.load(config_file)
+            for _file_path in cache_directory.iterdir():
+                _file_path.write_bytes(b"corrupt")
+            config_cache.clear()
+            assert config_cache.load(config_file) == _data
+            assert config_cache.get_metrics()["misses"] == 2
+
+        def test_without_cache_directory(self, config_file: pathlib.Path, cache_directory: pathlib.Path) -> None:
+            config_cache.set_cache_directory(None)
+            config_cache.load(config_file)
+            assert not cache_directory.exists()
+
+    class TestConfig:
+        def test_config_read(self, config_file: pathlib.Path) -> None:
+            _config = Config(config_file).read()
+            _config.set("settings.theme", "light")
+            assert Config(config_file).read().get("settings.theme") == "dark"
+            assert config_cache.get_metrics()["hits"] == 1
@@ -0,0 +1,76 @@
+import os
+import pathlib
+from typing import List
+
+import pytest
+
+from src.lib.config_watcher import ConfigWatcher
+
+
+class TestConfigWatcher:
+    @pytest.fixture(autouse=True)
+    def config_file(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        _path = tmp_path / "config.toml"
+        _path.write_text("[settings]\nvalue = 1\n", encoding="utf-8")
+        return _path
+
+    @pytest.fixture(autouse=True)
+    def changes(self) -> List[pathlib.Path]:
+        return []
+
+    @pytest.fixture(autouse=True)
+    def watcher(self, config_file: pathlib.Path, changes: List[pathlib.Path]) -> ConfigWatcher:
+        _watcher = ConfigWatcher(interval=0.01)
+        _watcher.watch(config_file, changes.append)
+        yield _watcher
+        _watcher.stop()
+
+    @staticmethod
+    def _modify(path: pathlib.Path, text: str) -> None:
+        path.write_text(text, encoding="utf-8")
+        # Some file systems keep modification times in whole seconds, so the time is moved forward explicitly.
+        _stat = path.stat()
+        os.utime(path, ns=(_stat.st_atime_ns, _stat.st_mtime_ns + 1_000_000_000))
+
+    class TestPoll:
+        def test_unchanged_file(self, watcher: ConfigWatcher, changes: List[pathlib.Path]) -> None:
+            assert watcher.poll() == []
+            assert changes == []
+
+        def test_changed_file(self, watcher: ConfigWatcher, config_file: pathlib.Path, changes: List[pathlib.Path]) -> None:
+            TestConfigWatcher._modify(config_file, "[settings]\nvalue = 2\n")
+            assert watcher.poll() == [config_file.resolve()]
+            assert changes == [config_file.resolve()]
+            assert watcher.poll() == []
+
+        def test_removed_file(self, watcher: ConfigWatcher, config_file: pathlib.Path, changes: List[pathlib.Path]) -> None:
+            config_file.unlink()
+            assert watcher.poll() == []
+            TestConfigWatcher._modify(config_file, "[settings]\nvalue = 3\n")
+            assert watcher.poll() == [config_file.resolve()]
+
+        def test_failing_callback(self, watcher: ConfigWatcher, config_file: pathlib.Path, changes: List[pathlib.Path]) -> None:
+            def _fail(path: pathlib.Path) -> None:
+                raise ValueError(path)
+
+            watcher.watch(config_file, _fail)
+            watcher.watch(config_file, changes.append)
+            TestConfigWatcher._modify(config_file, "[settings]\nvalue = 2\n")
+            watcher.poll()
+            assert len(changes) == 2
+
+        def test_unwatch(self, watcher: ConfigWatcher, config_file: pathlib.Path, changes: List[pathlib.Path]) -> None:
+            assert watcher.unwatch(config_file)
+            TestConfigWatcher._modify(config_file, "[settings]\nvalue = 2\n")
+            assert watcher.poll() == []
+            assert not watcher.unwatch(config_file)
+
+    class TestThread:
+        def test_start_stop(self, watcher: ConfigWatcher) -> None:
+            watcher.start()
+            assert watcher.is_running
+            watcher.stop()
+            assert not watcher.is_running
+
+        def test_invalid_interval(self) -> None:
+            assert ConfigWatcher(interval=0).interval == ConfigWatcher.DEFAULT_INTERVAL
@@ -0,0 +1,64 @@
+import threading
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config import Config
+from src.lib.server_context import ServerContext, bind_current_server, get_current_server, run_in_current_context, use_server
+from src.settings import settings
+
+
+class TestServerContext:
+    @pytest.fixture(autouse=True)
+    def server_context(self) -> ServerContext:
+        return ServerContext("secondary", {"host": "127.0.0.1"}, {"settings.connection.default_channel": "Lobby"})
+
+    class TestUseServer:
+        def test_use_server(self, server_context: ServerContext) -> None:
+            assert get_current_server() is None
+            with use_server(server_context):
+                assert get_current_server() is server_context
+            assert get_current_server() is None
+
+        def test_settings_are_isolated(self, server_context: ServerContext) -> None:
+            _primary_state = settings.state.get_client_state()
+            _server_state = MagicMock()
+            with use_server(server_context):
+                assert settings.state.get_client_state() is None
+                settings.state.set_client_state(_server_state)
+                assert settings.state.get_client_state() is _server_state
+            assert server_context.client_state is _server_state
+            assert settings.state.get_client_state() is _primary_state
+
+    class TestThreads:
+        def test_bind_current_server(self, server_context: ServerContext) -> None:
+            _seen: list = []
+            with use_server(server_context):
+                _callback = bind_current_server(lambda: _seen.append(get_current_server()))
+            _thread = threading.Thread(target=_callback)
+            _thread.start()
+            _thread.join()
+            assert _seen == [server_context]
+
+        def test_bind_without_server(self) -> None:
+            _callback = print
+            assert bind_current_server(_callback) is _callback
+
+        def test_run_in_current_context(self, server_context: ServerContext) -> None:
+            _seen: list = []
+            with use_server(server_context):
+                _thread = threading.Thread(target=run_in_current_context(lambda: _seen.append(get_current_server())))
+            _thread.start()
+            _thread.join()
+            assert _seen == [server_context]
+
+    class TestConfigOverrides:
+        def test_apply_config_overrides(self, server_context: ServerContext) -> None:
+            _base_config = Config()
+            _base_config.set("settings.connection.default_channel", "Root", create_keys_if_not_exists=True)
+            _server_config: Optional[Config] = server_context.apply_config_overrides(_base_config)
+            assert _server_config.get("settings.connection.default_channel") == "Lobby"
+            assert _base_config.get("settings.connection.default_channel") == "Root"
+            with use_server(server_context):
+                assert settings.configs.get_mumimo_config() is _server_config
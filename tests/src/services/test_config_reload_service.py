@@ -0,0 +1,94 @@
+import pathlib
+from unittest.mock import Mock
+
+import pytest
+
+from src.config import Config
+from src.constants import MumimoCfgFields, PluginCfgFields, SysArgs
+from src.lib.command_history import CommandHistory
+from src.services.config_reload_service import ConfigReloadService
+from src.settings import settings
+
+
+class TestConfigReloadService:
+    @pytest.fixture(autouse=True)
+    def config_file(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        _path = tmp_path / "config.toml"
+        _path.write_text((pathlib.Path.cwd() / "config/config_template.toml").read_text(encoding="utf-8"), encoding="utf-8")
+        return _path
+
+    @pytest.fixture(autouse=True)
+    def restore_settings(self, config_file: pathlib.Path):
+        _config = settings.configs._mumimo_cfg
+        _history = settings.commands.history._cmd_history
+        settings.configs.set_mumimo_config(Config(config_file).read())
+        yield
+        settings.configs._mumimo_cfg = _config
+        settings.commands.history._cmd_history = _history
+
+    @pytest.fixture(autouse=True)
+    def reload_service(self) -> ConfigReloadService:
+        return ConfigReloadService()
+
+    class TestChangedFields:
+        def test_nested_fields(self) -> None:
+            _current = {"settings": {"gui": {"selected_theme": "dark", "paged_output": False}, "removed": 1}}
+            _new = {"settings": {"gui": {"selected_theme": "light", "paged_output": False}, "added": [1]}}
+            assert ConfigReloadService.get_changed_fields(_current, _new) == {"settings.gui.selected_theme", "settings.removed", "settings.added"}
+
+        def test_replaced_section(self) -> None:
+            assert ConfigReloadService.get_changed_fields({"settings": {"gui": 1}}, {"settings": 1}) == {"settings"}
+
+    class TestMumimoConfig:
+        def test_unchanged_config(self, reload_service: ConfigReloadService, config_file: pathlib.Path) -> None:
+            _config = settings.configs.get_mumimo_config()
+            assert reload_service.reload_mumimo_config(config_file) == set()
+            assert settings.configs.get_mumimo_config() is _config
+
+        def test_changed_config(self, reload_service: ConfigReloadService, config_file: pathlib.Path) -> None:
+            settings.commands.history.set_command_history(CommandHistory(25))
+            _text = config_file.read_text(encoding="utf-8")
+            _text = _text.replace('command_token = "!"', 'command_token = "?"').replace("command_history_length = 25", "command_history_length = 5")
+            config_file.write_text(_text, encoding="utf-8")
+
+            _changed = reload_service.reload_mumimo_config(config_file)
+            assert _changed == {MumimoCfgFields.SETTINGS.COMMANDS.TOKEN, MumimoCfgFields.SETTINGS.COMMANDS.COMMAND_HISTORY_LENGTH}
+            assert settings.configs.get_config_snapshot().commands.token == "?"
+            assert settings.commands.history.get_command_history().limit == 5
+
+        def test_keeps_system_arguments(self, config_file: pathlib.Path) -> None:
+            _reload_service = ConfigReloadService(sys_args={SysArgs.SYS_NAME: "CliName"})
+            settings.configs.get_mumimo_config().set(MumimoCfgFields.SETTINGS.CONNECTION.NAME, "CliName")
+            config_file.write_text(config_file.read_text(encoding="utf-8").replace('command_token = "!"', 'command_token = "?"'), encoding="utf-8")
+
+            assert _reload_service.reload_mumimo_config(config_file) == {MumimoCfgFields.SETTINGS.COMMANDS.TOKEN}
+            assert settings.configs.get_config_snapshot().connection.name == "CliName"
+            assert settings.configs.get_config_snapshot().commands.token == "?"
+
+        def test_invalid_config(self, reload_service: ConfigReloadService, config_file: pathlib.Path) -> None:
+            _config = settings.configs.get_mumimo_config()
+            config_file.write_text(config_file.read_text(encoding="utf-8").replace('command_token = "!"', 'command_token = "!!"'), encoding="utf-8")
+            assert reload_service.reload_mumimo_config(config_file) == set()
+            assert settings.configs.get_mumimo_config() is _config
+
+    class TestPluginMetadata:
+        @pytest.fixture(autouse=True)
+        def plugin(self, tmp_path: pathlib.Path):
+            _path = tmp_path / "metadata.toml"
+            _path.write_text("[plugin]\nenabled = true\n[plugin.commands]\ndisable_commands = []\n", encoding="utf-8")
+            _plugin = Mock(plugin_metadata=Config(_path).read())
+            _plugins = settings.plugins._registered_plugins
+            settings.plugins._registered_plugins = {"test_plugin": _plugin}
+            yield _plugin
+            settings.plugins._registered_plugins = _plugins
+
+        def test_changed_metadata(self, reload_service: ConfigReloadService, plugin: Mock) -> None:
+            _path: pathlib.Path = plugin.plugin_metadata.file_path
+            _path.write_text("[plugin]\nenabled = true\n[plugin.commands]\ndisable_commands = ['test']\n", encoding="utf-8")
+            assert reload_service.reload_plugin_metadata("test_plugin", _path) == {PluginCfgFields.PLUGIN.COMMANDS.DISABLE_COMMANDS}
+            _metadata = plugin.reload_metadata.call_args.args[0]
+            assert _metadata.get(PluginCfgFields.PLUGIN.COMMANDS.DISABLE_COMMANDS) == ("test",)
+
+        def test_unchanged_metadata(self, reload_service: ConfigReloadService, plugin: Mock) -> None:
+            assert reload_service.reload_plugin_metadata("test_plugin", plugin.plugin_metadata.file_path) == set()
+            plugin.reload_metadata.assert_not_called()
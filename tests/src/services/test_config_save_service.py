@@ -0,0 +1,76 @@
+import pathlib
+from unittest.mock import patch
+
+import pytest
+import toml
+
+from src.config import Config
+from src.services.config_save_service import ConfigSaveService
+
+
+class TestConfigSaveService:
+    @pytest.fixture(autouse=True)
+    def config(self, tmp_path: pathlib.Path) -> Config:
+        _path = tmp_path / "config.toml"
+        _path.write_text('[settings]\ntheme = "dark"\nvalue = 1\n', encoding="utf-8")
+        return Config(_path).read()
+
+    @pytest.fixture(autouse=True)
+    def save_service(self) -> ConfigSaveService:
+        _service = ConfigSaveService(save_delay=0.01, max_save_delay=0.1)
+        yield _service
+        _service.stop()
+
+    class TestSave:
+        def test_save_is_deferred(self, save_service: ConfigSaveService, config: Config) -> None:
+            config.set("settings.value", 2)
+            save_service.save(config)
+            assert save_service.pending_count == 1
+            assert toml.loads(config.file_path.read_text(encoding="utf-8"))["settings"]["value"] == 1
+
+        def test_burst_is_saved_once(self, save_service: ConfigSaveService, config: Config) -> None:
+            for _value in range(5):
+                config.set("settings.value", _value)
+                save_service.save(config)
+            with patch.object(Config, "write_file", wraps=Config.write_file) as write_file:
+                assert save_service.flush() == 1
+                assert write_file.call_count == 1
+            assert toml.loads(config.file_path.read_text(encoding="utf-8"))["settings"]["value"] == 4
+
+        def test_modified_fields_only(self, save_service: ConfigSaveService, config: Config) -> None:
+            config.update({"settings": {"theme": "light", "value": 2}})
+            save_service.save(config, modified_field_name="settings.theme")
+            save_service.flush()
+            assert toml.loads(config.file_path.read_text(encoding="utf-8"))["settings"] == {"theme": "light", "value": 1}
+
+        def test_whole_config_replaces_modified_fields(self, save_service: ConfigSaveService, config: Config) -> None:
+            config.set("settings.value", 2)
+            save_service.save(config, modified_field_name="settings.theme")
+            save_service.save(config)
+            save_service.flush()
+            assert toml.loads(config.file_path.read_text(encoding="utf-8"))["settings"]["value"] == 2
+
+        def test_failed_write_keeps_file(self, save_service: ConfigSaveService, config: Config) -> None:
+            config.set("settings.value", 2)
+            save_service.save(config)
+            with patch("os.replace", side_effect=OSError("failed")):
+                save_service.flush()
+            assert toml.loads(config.file_path.read_text(encoding="utf-8"))["settings"]["value"] == 1
+            assert list(config.file_path.parent.iterdir()) == [config.file_path]
+
+    class TestThread:
+        def test_saved_in_background(self, save_service: ConfigSaveService, config: Config) -> None:
+            save_service.start()
+            config.set("settings.value", 2)
+            save_service.save(config)
+            save_service.stop()
+            assert save_service.pending_count == 0
+            assert toml.loads(config.file_path.read_text(encoding="utf-8"))["settings"]["value"] == 2
+
+        def test_flushed_on_stop(self, config: Config) -> None:
+            _service = ConfigSaveService(save_delay=60)
+            _service.start()
+            config.set("settings.value", 2)
+            _service.save(config)
+            _service.stop()
+            assert toml.loads(config.file_path.read_text(encoding="utf-8"))["settings"]["value"] == 2
@@ -6,10 +6,13 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker
 
+from src.constants import DATABASE_SCHEMA_VERSION
 from src.exceptions import DatabaseServiceError
 from src.lib.database.database_connection_parameters import DatabaseConnectionParameters
+from src.lib.database.metadata import Base
 from src.lib.database.models.alias import AliasTable
 from src.lib.database.models.permission_group import PermissionGroupTable
+from src.lib.database.models.schema_version import SchemaVersionTable
 from src.services.database_service import DatabaseService
 
 
@@ -305,6 +308,31 @@ class TestDatabaseService:
             with pytest.raises(DatabaseServiceError, match=r"Please check your dialect connection parameters.$"):
                 _ = await _db_service.setup(_db_connection_params)
 
+        @pytest.mark.asyncio
+        async def test_setup_records_schema_version(
+            self, get_connection_params_object: DatabaseConnectionParameters, get_database_service: DatabaseService
+        ) -> None:
+            _db_service: DatabaseService = get_database_service
+            _db_service._engine = None
+            await _db_service.setup(get_connection_params_object)
+            async with _db_service.session() as session:
+                _versions = (await session.execute(select(SchemaVersionTable.version))).scalars().all()
+            await _db_service.close(clean=True)
+            assert _versions == [DATABASE_SCHEMA_VERSION]
+
+        @pytest.mark.asyncio
+        async def test_setup_skips_create_all_when_schema_matches(
+            self, get_connection_params_object: DatabaseConnectionParameters, get_database_service: DatabaseService
+        ) -> None:
+            _db_service: DatabaseService = get_database_service
+            _db_service._engine = None
+            await _db_service.setup(get_connection_params_object)
+            await _db_service.close(clean=True)
+            with patch.object(Base.metadata, "create_all") as mock_create_all:
+                await _db_service.setup(get_connection_params_object)
+                await _db_service.close(clean=True)
+                mock_create_all.assert_not_called()
+
     class TestImportDefaultValues:
         @pytest.mark.asyncio
         async def test_import_engine_is_none(self, get_database_service: DatabaseService) -> None:
@@ -0,0 +1,93 @@
+import json
+import pathlib
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from src.exceptions import DatabaseServiceError
+from src.lib.database.metadata import Base
+from src.lib.database.models.permission_group import PermissionGroupTable
+from src.lib.database.models.user import UserTable
+from src.services.database_transfer_service import DatabaseTransferService
+
+
+async def _create_engine(path: str) -> AsyncEngine:
+    _engine = create_async_engine(f"sqlite+aiosqlite:///{path}", echo=False)
+    async with _engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return _engine
+
+
+class TestDatabaseTransferService:
+    @pytest.fixture(autouse=True)
+    def export_path(self) -> pathlib.Path:
+        return pathlib.Path("tests/data/generated/mumimo_export.jsonl")
+
+    @pytest.fixture(autouse=True)
+    async def source_engine(self) -> AsyncGenerator[AsyncEngine, None]:
+        _engine = await _create_engine("tests/data/generated/mumimo_transfer_source.db")
+        async with _engine.begin() as conn:
+            await conn.execute(PermissionGroupTable.__table__.insert(), [{"id": 1, "name": "guest"}, {"id": 2, "name": "admin"}])
+            await conn.execute(UserTable.__table__.insert(), [{"id": idx, "name": f"user_{idx}"} for idx in range(1, 26)])
+            await conn.execute(
+                Base.metadata.tables["user_permission_association_table"].insert(),
+                [{"user_id": idx, "permission_group_id": 1} for idx in range(1, 26)],
+            )
+        yield _engine
+        await _engine.dispose(close=True)
+
+    @pytest.fixture(autouse=True)
+    async def target_engine(self) -> AsyncGenerator[AsyncEngine, None]:
+        _engine = await _create_engine("tests/data/generated/mumimo_transfer_target.db")
+        yield _engine
+        await _engine.dispose(close=True)
+
+    class TestInit:
+        def test_init_without_engine(self) -> None:
+            with pytest.raises(DatabaseServiceError):
+                DatabaseTransferService(None)
+
+        def test_init_default_batch_size(self, source_engine: AsyncEngine) -> None:
+            assert DatabaseTransferService(source_engine, None).batch_size == DatabaseTransferService.DEFAULT_BATCH_SIZE
+
+    class TestExport:
+        @pytest.mark.asyncio
+        async def test_export_tables(self, source_engine: AsyncEngine, export_path: pathlib.Path) -> None:
+            _row_counts = await DatabaseTransferService(source_engine, batch_size=10).export_tables(export_path)
+            assert _row_counts["user"] == 25
+            assert _row_counts["permission_group"] == 2
+            assert _row_counts["user_permission_association_table"] == 25
+            with open(export_path, "r", encoding="utf-8") as file_handler:
+                _tables = [json.loads(line)["table"] for line in file_handler]
+            assert len(_tables) == sum(_row_counts.values())
+            # Association rows must be written after the rows they reference.
+            assert _tables.index("user_permission_association_table") > _tables.index("user")
+
+    class TestImport:
+        @pytest.mark.asyncio
+        async def test_import_tables(self, source_engine: AsyncEngine, target_engine: AsyncEngine, export_path: pathlib.Path) -> None:
+            await DatabaseTransferService(source_engine, batch_size=10).export_tables(export_path)
+            _row_counts = await DatabaseTransferService(target_engine, batch_size=7).import_tables(export_path)
+            assert _row_counts["user"] == 25
+            async with target_engine.connect() as conn:
+                _users = (await conn.execute(select(UserTable.__table__))).all()
+                assert len(_users) == 25
+            async with AsyncSession(target_engine) as session:
+                _user = (
+                    await session.execute(select(UserTable).filter_by(name="user_5").options(selectinload(UserTable.permission_groups)))
+                ).scalar()
+                assert [group.name for group in _user.permission_groups] == ["guest"]
+
+        @pytest.mark.asyncio
+        async def test_import_into_populated_database(self, source_engine: AsyncEngine, export_path: pathlib.Path) -> None:
+            await DatabaseTransferService(source_engine).export_tables(export_path)
+            with pytest.raises(DatabaseServiceError):
+                await DatabaseTransferService(source_engine).import_tables(export_path)
+
+        @pytest.mark.asyncio
+        async def test_import_missing_file(self, target_engine: AsyncEngine, export_path: pathlib.Path) -> None:
+            with pytest.raises(DatabaseServiceError):
+                await DatabaseTransferService(target_engine).import_tables(export_path)
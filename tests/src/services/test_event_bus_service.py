@@ -0,0 +1,99 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from src.services.event_bus_service import EventBusService
+
+
+class TestEventBusService:
+    @pytest.fixture(autouse=True)
+    def event_bus(self) -> EventBusService:
+        _service = EventBusService(max_queue_size=2, overload_policy=EventBusService.OVERLOAD_DROP_OLDEST, lanes={"joined": "state", "left": "state"})
+        yield _service
+        _service.stop()
+
+    class TestSubscribers:
+        def test_publish_without_subscribers_is_ignored(self, event_bus: EventBusService) -> None:
+            assert event_bus.publish("joined", {"name": "user"}) is False
+            assert event_bus.get_metrics() == {}
+
+        def test_dispatches_synchronously_when_stopped(self, event_bus: EventBusService) -> None:
+            _received: List[tuple] = []
+            event_bus.set_subscriber("joined", lambda *args: _received.append(args))
+            event_bus.add_subscriber("joined", lambda *args: _received.append(args))
+            assert event_bus.publish("joined", "user", {"channel_id": 1}) is True
+            assert _received == [("user", {"channel_id": 1}), ("user", {"channel_id": 1})]
+
+        def test_failing_subscriber_does_not_stop_dispatch(self, event_bus: EventBusService) -> None:
+            _received: List[str] = []
+
+            def _failing(*args) -> None:
+                raise RuntimeError("failed")
+
+            event_bus.set_subscriber("joined", _failing)
+            event_bus.add_subscriber("joined", _received.append)
+            event_bus.publish("joined", "user")
+            assert _received == ["user"]
+            assert event_bus.get_metrics()["joined"]["failed"] == 1
+
+    class TestDispatch:
+        def test_lane_preserves_order_off_thread(self, event_bus: EventBusService) -> None:
+            _received: List[str] = []
+            _threads: List[str] = []
+            _done = threading.Event()
+
+            def _subscriber(name: str) -> None:
+                _threads.append(threading.current_thread().name)
+                _received.append(name)
+                if len(_received) == 4:
+                    _done.set()
+
+            for _event_type in ("joined", "left"):
+                event_bus.set_subscriber(_event_type, _subscriber)
+            event_bus.start()
+            for _event_type, _name in (("joined", "a"), ("left", "b"), ("joined", "c"), ("left", "d")):
+                event_bus.publish(_event_type, _name)
+                time.sleep(0.01)
+            assert _done.wait(2)
+            assert _received == ["a", "b", "c", "d"]
+            assert set(_threads) == {"mumimo-events-state-0"}
+            assert event_bus.get_metrics()["joined"]["dispatched"] == 2
+
+    class TestOverload:
+        @pytest.fixture(autouse=True)
+        def blocker(self, event_bus: EventBusService) -> threading.Event:
+            # Holds the worker on its first event so later events stay queued.
+            _release = threading.Event()
+            event_bus.set_subscriber("joined", lambda name: _release.wait(2))
+            event_bus.start()
+            event_bus.publish("joined", "busy")
+            time.sleep(0.05)
+            yield _release
+            _release.set()
+
+        def test_drop_oldest(self, event_bus: EventBusService) -> None:
+            for _name in ("a", "b", "c"):
+                assert event_bus.publish("joined", _name) is True
+            assert [event.args[0] for event in event_bus._lanes["state"].queue] == ["b", "c"]
+            _metrics = event_bus.get_metrics()["joined"]
+            assert _metrics["dropped"] == 1
+            assert _metrics["pending"] == 2
+
+        def test_block_then_drop_newest(self, event_bus: EventBusService) -> None:
+            event_bus._lanes["state"].overload_policy = EventBusService.OVERLOAD_BLOCK
+            event_bus._block_timeout = 0.05
+            event_bus.publish("joined", "a")
+            event_bus.publish("joined", "b")
+            _start = time.monotonic()
+            assert event_bus.publish("joined", "c") is False
+            assert time.monotonic() - _start >= 0.05
+            assert [event.args[0] for event in event_bus._lanes["state"].queue] == ["a", "b"]
+
+        def test_stop_drains_queue(self, event_bus: EventBusService, blocker: threading.Event) -> None:
+            event_bus.publish("joined", "a")
+            blocker.set()
+            event_bus.stop()
+            assert event_bus.get_metrics()["joined"]["pending"] == 0
+            assert event_bus.get_metrics()["joined"]["dispatched"] == 2
@@ -0,0 +1,85 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.loop_rate_service import LoopRateService
+
+
+class TestLoopRateService:
+    @pytest.fixture(autouse=True)
+    def mumble_instance(self) -> MagicMock:
+        _instance = MagicMock()
+        _instance.sound_output.pcm = []
+        return _instance
+
+    @pytest.fixture(autouse=True)
+    def loop_rate_service(self, mumble_instance: MagicMock) -> LoopRateService:
+        return LoopRateService(mumble_instance, active_rate=0.01, idle_rate=0.1, idle_delay=0.05)
+
+    class TestInit:
+        def test_init_default_rates(self) -> None:
+            _service = LoopRateService(active_rate=None, idle_rate=-1, idle_delay=None)
+            assert _service.active_rate == LoopRateService.DEFAULT_ACTIVE_RATE
+            assert _service.idle_rate == LoopRateService.DEFAULT_IDLE_RATE
+            assert _service.idle_delay == LoopRateService.DEFAULT_IDLE_DELAY
+
+        def test_init_idle_rate_faster_than_active_rate(self) -> None:
+            _service = LoopRateService(active_rate=0.1, idle_rate=0.01)
+            assert _service.idle_rate == _service.active_rate
+
+        def test_init_starts_idle(self, loop_rate_service: LoopRateService, mumble_instance: MagicMock) -> None:
+            assert loop_rate_service.current_rate == 0.1
+            mumble_instance.set_loop_rate.assert_called_with(0.1)
+
+    class TestAdaptiveRate:
+        def test_mark_active(self, loop_rate_service: LoopRateService, mumble_instance: MagicMock) -> None:
+            loop_rate_service.mark_active()
+            assert loop_rate_service.is_active
+            mumble_instance.set_loop_rate.assert_called_with(0.01)
+
+        def test_backs_off_when_idle(self, loop_rate_service: LoopRateService, mumble_instance: MagicMock) -> None:
+            loop_rate_service.mark_active()
+            mumble_instance.sound_output.send_audio()
+            assert loop_rate_service.is_active
+            time.sleep(0.06)
+            mumble_instance.sound_output.send_audio()
+            assert loop_rate_service.current_rate == 0.1
+            mumble_instance.set_loop_rate.assert_called_with(0.1)
+
+        def test_audio_keeps_active_rate(self, loop_rate_service: LoopRateService, mumble_instance: MagicMock) -> None:
+            mumble_instance.sound_output.pcm = [b"\x00\x00"]
+            mumble_instance.sound_output.send_audio()
+            assert loop_rate_service.is_active
+            time.sleep(0.06)
+            mumble_instance.sound_output.send_audio()
+            assert loop_rate_service.is_active
+
+        def test_in_flight_work_keeps_active_rate(self, loop_rate_service: LoopRateService, mumble_instance: MagicMock) -> None:
+            with loop_rate_service.track_activity():
+                time.sleep(0.06)
+                mumble_instance.sound_output.send_audio()
+                assert loop_rate_service.is_active
+            assert loop_rate_service.get_metrics()["in_flight"] == 0
+
+    class TestMetrics:
+        def test_tick_metrics(self, loop_rate_service: LoopRateService, mumble_instance: MagicMock) -> None:
+            loop_rate_service.mark_active()
+            for _ in range(3):
+                mumble_instance.sound_output.send_audio()
+                time.sleep(0.02)
+            _metrics = loop_rate_service.get_metrics()
+            assert _metrics["tick_count"] == 3
+            assert _metrics["max_jitter"] > 0
+            assert _metrics["current_rate"] == 0.01
+
+        def test_reset_metrics(self, loop_rate_service: LoopRateService, mumble_instance: MagicMock) -> None:
+            mumble_instance.sound_output.send_audio()
+            loop_rate_service.reset_metrics()
+            assert loop_rate_service.get_metrics()["tick_count"] == 0
+
+        def test_reattach_hooks_new_sound_output(self, loop_rate_service: LoopRateService, mumble_instance: MagicMock) -> None:
+            mumble_instance.sound_output = MagicMock(pcm=[])
+            loop_rate_service.on_connected()
+            mumble_instance.sound_output.send_audio()
+            assert loop_rate_service.get_metrics()["tick_count"] == 1
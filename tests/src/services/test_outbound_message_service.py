@@ -0,0 +1,99 @@
+import threading
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.outbound_message_service import OutboundMessageService
+from src.utils import mumble_utils
+
+
+def _channel(channel_id: int) -> dict:
+    return {"channel_id": channel_id, "name": f"channel_{channel_id}"}
+
+
+class TestOutboundMessageService:
+    @pytest.fixture(autouse=True)
+    def delivered(self) -> List[tuple]:
+        return []
+
+    @pytest.fixture(autouse=True)
+    def outbound_service(self, delivered: List[tuple]) -> OutboundMessageService:
+        def _deliver(text, channels, users) -> int:
+            delivered.append((text, channels, users))
+            return 1
+
+        _service = OutboundMessageService(_deliver, rate=20, burst=2, max_queue_size=3)
+        yield _service
+        _service.stop()
+
+    class TestCoalescing:
+        def test_merges_tables(self, outbound_service: OutboundMessageService) -> None:
+            outbound_service.enqueue('<table bgcolor="black"><tr><td>a</td></tr></table>', channels=[_channel(1)])
+            outbound_service.enqueue('<table bgcolor="black"><tr><td>b</td></tr></table>', channels=[_channel(1)])
+            assert outbound_service.queue_depth == 1
+            assert outbound_service._queue[0].text == '<table bgcolor="black"><tr><td>a</td></tr><tr><td>b</td></tr></table>'
+            assert outbound_service.get_metrics()["merged"] == 1
+
+        def test_merges_plain_text(self, outbound_service: OutboundMessageService) -> None:
+            outbound_service.enqueue("a", channels=[_channel(1), _channel(2)])
+            outbound_service.enqueue("b", channels=[_channel(2), _channel(1)])
+            assert outbound_service._queue[0].text == "a<br>b"
+
+        def test_does_not_merge_other_targets(self, outbound_service: OutboundMessageService) -> None:
+            outbound_service.enqueue("a", channels=[_channel(1)])
+            outbound_service.enqueue("b", channels=[_channel(2)])
+            assert outbound_service.queue_depth == 2
+
+        def test_does_not_merge_past_max_length(self, outbound_service: OutboundMessageService) -> None:
+            outbound_service.set_max_merge_length(5)
+            outbound_service.enqueue("abc", channels=[_channel(1)])
+            outbound_service.enqueue("def", channels=[_channel(1)])
+            assert outbound_service.queue_depth == 2
+
+    class TestQueue:
+        def test_drops_oldest_when_full(self, outbound_service: OutboundMessageService) -> None:
+            for idx in range(4):
+                outbound_service.enqueue(str(idx), channels=[_channel(idx)])
+            assert [message.text for message in outbound_service._queue] == ["1", "2", "3"]
+            assert outbound_service.get_metrics()["dropped"] == 1
+
+        def test_paces_sends(self, outbound_service: OutboundMessageService, delivered: List[tuple]) -> None:
+            for idx in range(3):
+                outbound_service.enqueue(str(idx), channels=[_channel(idx)])
+            _start = time.monotonic()
+            outbound_service.start()
+            while len(delivered) < 3 and time.monotonic() - _start < 5:
+                time.sleep(0.01)
+            assert [text for text, _, _ in delivered] == ["0", "1", "2"]
+            # Two messages fit in the burst, the third has to wait for a token.
+            assert time.monotonic() - _start >= 0.04
+            assert outbound_service.get_metrics()["throttled_time"] > 0
+
+        def test_counts_failed_sends(self) -> None:
+            _failed = threading.Event()
+
+            def _deliver(text, channels, users) -> int:
+                _failed.set()
+                raise RuntimeError("send failed")
+
+            _service = OutboundMessageService(_deliver)
+            _service.start()
+            _service.enqueue("a", channels=[_channel(1)])
+            assert _failed.wait(5)
+            _service.stop()
+            assert _service.get_metrics()["failed"] == 1
+
+    class TestEcho:
+        @patch("src.settings.MumimoSettings.Connection.get_outbound_message_service")
+        @patch("src.utils.mumble_utils.get_my_channel")
+        def test_echo_without_targets_is_queued(self, mock_my_channel, mock_outbound_service, outbound_service: OutboundMessageService) -> None:
+            _my_channel = MagicMock()
+            mock_my_channel.return_value = _my_channel
+            mock_outbound_service.return_value = outbound_service
+            outbound_service.start()
+            with patch.object(outbound_service, "enqueue") as mock_enqueue:
+                mumble_utils.echo(" reply ")
+            mock_enqueue.assert_called_once_with("reply", channels=[_my_channel], users=None)
+            _my_channel.send_text_message.assert_not_called()
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.config import Config
+from src.constants import SysArgs
+from src.exceptions import ConnectivityError, ServiceError
+from src.murmur_connection import MurmurConnectionBase
+from src.services.server_host_service import ServerHostService
+from src.settings import settings
+
+
+class TestServerHostService:
+    @pytest.fixture(autouse=True)
+    def host_service(self) -> ServerHostService:
+        return ServerHostService({SysArgs.SYS_HOST: "127.0.0.1", SysArgs.SYS_PORT: "64738", SysArgs.SYS_USER: "Mumimo"})
+
+    class TestLoadServers:
+        def test_load_servers_inherits_connection_fields(self, host_service: ServerHostService) -> None:
+            _contexts = host_service.load_servers(
+                [{"name": "secondary", "port": 64739, "overrides": {"settings.connection.default_channel": "Lobby"}}]
+            )
+            assert len(_contexts) == 1
+            assert _contexts[0].name == "secondary"
+            assert _contexts[0].connection_params[SysArgs.SYS_HOST] == "127.0.0.1"
+            assert _contexts[0].connection_params[SysArgs.SYS_PORT] == 64739
+            assert _contexts[0].config_overrides == {"settings.connection.default_channel": "Lobby"}
+
+        def test_load_servers_without_name(self, host_service: ServerHostService) -> None:
+            with pytest.raises(ServiceError):
+                host_service.load_servers([{"port": 64739}])
+
+        def test_load_servers_duplicate_name(self, host_service: ServerHostService) -> None:
+            with pytest.raises(ServiceError):
+                host_service.load_servers([{"name": "secondary"}, {"name": "secondary"}])
+
+    class TestStartServers:
+        @pytest.mark.asyncio
+        @patch.object(MurmurConnectionBase, "stop")
+        @patch.object(MurmurConnectionBase, "connect", side_effect=ConnectivityError("unreachable"))
+        @patch.object(MurmurConnectionBase, "ready", autospec=True, side_effect=lambda connection: connection)
+        @patch.object(MurmurConnectionBase, "setup")
+        @patch("src.settings.MumimoSettings.Configs.get_mumimo_config")
+        async def test_start_servers_skips_unreachable_server(
+            self, mock_config, mock_setup, mock_ready, mock_connect, mock_stop, host_service: ServerHostService
+        ) -> None:
+            mock_config.return_value = Config("tests/data/config/test_config.toml").read()
+            _contexts = host_service.load_servers([{"name": "secondary"}, {"name": "tertiary"}])
+            assert await host_service.start_servers(_contexts) == []
+            assert mock_connect.call_count == 2
+            assert mock_stop.call_count == 2
+            assert settings.servers.get_servers() == {}
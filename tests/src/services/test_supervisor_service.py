@@ -0,0 +1,80 @@
+import sys
+import time
+from typing import Any, Dict
+
+import pytest
+
+from src.constants import SysArgs
+from src.exceptions import ServiceError
+from src.services.supervisor_service import SupervisorService
+
+
+def _stand_in_server(sys_args: Dict[str, Any], status_queue: Any) -> None:
+    status_queue.put({"server": sys_args[SysArgs.SYS_WORKER_SERVER], "timestamp": time.time(), "connected": True, "users": 2})
+    time.sleep(30)
+
+
+def _crashing_server(sys_args: Dict[str, Any], status_queue: Any) -> None:
+    sys.exit(1)
+
+
+def _exiting_server(sys_args: Dict[str, Any], status_queue: Any) -> None:
+    sys.exit(0)
+
+
+def _poll_until(supervisor: SupervisorService, condition, timeout: float = 10.0) -> bool:
+    _deadline = time.monotonic() + timeout
+    while time.monotonic() < _deadline:
+        supervisor.poll(0.05)
+        if condition():
+            return True
+    return False
+
+
+class TestSupervisorService:
+    class TestInit:
+        def test_init_without_servers(self) -> None:
+            with pytest.raises(ServiceError):
+                SupervisorService({}, [])
+
+        def test_init_duplicate_servers(self) -> None:
+            with pytest.raises(ServiceError):
+                SupervisorService({}, ["primary", "primary"])
+
+    class TestWorkers:
+        def test_aggregates_worker_health(self) -> None:
+            _supervisor = SupervisorService({}, ["primary", "secondary", "tertiary"], worker_target=_stand_in_server)
+            try:
+                _supervisor.start()
+                assert _poll_until(_supervisor, lambda: all(worker.status for worker in _supervisor.workers.values()))
+                _totals = _supervisor.get_health()["totals"]
+                assert _totals["alive"] == 3
+                assert _totals["connected"] == 3
+                assert _totals["users"] == 6
+            finally:
+                _supervisor.stop()
+            assert not any(worker.is_alive for worker in _supervisor.workers.values())
+
+        def test_restarts_crashed_worker(self) -> None:
+            _supervisor = SupervisorService({}, ["primary"], worker_target=_crashing_server, restart_base_delay=0.01, restart_max_delay=0.02)
+            try:
+                _supervisor.start()
+                assert _poll_until(_supervisor, lambda: _supervisor.workers["primary"].restarts >= 2)
+                assert _supervisor.get_health()["workers"]["primary"]["exitcode"] in (None, 1)
+            finally:
+                _supervisor.stop()
+
+        def test_restart_delay_after_many_crashes(self) -> None:
+            _supervisor = SupervisorService({}, ["primary"], restart_base_delay=1.0, restart_max_delay=60.0)
+            _delay = _supervisor._get_restart_delay(5000)
+            assert 30.0 <= _delay <= 60.0
+
+        def test_does_not_restart_clean_exit(self) -> None:
+            _supervisor = SupervisorService({}, ["primary"], worker_target=_exiting_server, restart_base_delay=0.01)
+            try:
+                _supervisor.start()
+                assert _poll_until(_supervisor, lambda: _supervisor.workers["primary"].exitcode == 0)
+                _supervisor.poll(0.05)
+                assert _supervisor.workers["primary"].restarts == 0
+            finally:
+                _supervisor.stop()
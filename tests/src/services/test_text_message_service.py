@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pymumble_py3.constants import PYMUMBLE_MSG_TYPES_TEXTMESSAGE
+from pymumble_py3.errors import TextTooLongError
+from pymumble_py3.messages import TextMessage
+
+from src.exceptions import ServiceError
+from src.services.text_message_service import MUMIMO_CMD_MULTI_TEXTMESSAGE, TextMessageService
+
+
+class TestTextMessageService:
+    @pytest.fixture(autouse=True)
+    def mumble_instance(self) -> MagicMock:
+        _instance = MagicMock()
+        _instance.get_max_message_length.return_value = 5000
+        _instance.get_max_image_length.return_value = 131072
+        return _instance
+
+    @pytest.fixture(autouse=True)
+    def text_message_service(self, mumble_instance: MagicMock) -> TextMessageService:
+        return TextMessageService(mumble_instance)
+
+    @pytest.fixture(autouse=True)
+    def channels(self) -> list:
+        return [{"channel_id": idx, "name": f"channel_{idx}"} for idx in range(300)]
+
+    class TestSend:
+        def test_send_packs_targets(self, text_message_service: TextMessageService, mumble_instance: MagicMock, channels: list) -> None:
+            assert text_message_service.send("<b>hello</b>", channels=channels) == 1
+            _cmd = mumble_instance.execute_command.call_args.args[0]
+            assert _cmd.cmd == MUMIMO_CMD_MULTI_TEXTMESSAGE
+            assert _cmd.parameters["channel_ids"] == list(range(300))
+            assert text_message_service.get_metrics()["packets_saved"] == 299
+
+        def test_send_max_targets(self, mumble_instance: MagicMock, channels: list) -> None:
+            _service = TextMessageService(mumble_instance, max_targets=100)
+            _users = [{"session": idx} for idx in range(50)]
+            assert _service.send("hello", channels=channels, users=_users) == 4
+            assert _service.get_metrics() == {"messages_sent": 1, "targets_sent": 350, "packets_sent": 4, "packets_saved": 346}
+
+        def test_send_deduplicates_targets(self, text_message_service: TextMessageService, mumble_instance: MagicMock) -> None:
+            text_message_service.send("hello", channels=[{"channel_id": 1}, {"channel_id": 1}])
+            assert mumble_instance.execute_command.call_args.args[0].parameters["channel_ids"] == [1]
+
+        def test_send_text_too_long(self, text_message_service: TextMessageService) -> None:
+            with pytest.raises(TextTooLongError):
+                text_message_service.send("a" * 5001, channels=[{"channel_id": 1}])
+
+        def test_send_detached(self) -> None:
+            with pytest.raises(ServiceError):
+                TextMessageService().send("hello", channels=[{"channel_id": 1}])
+
+    class TestTreatCommand:
+        def test_multi_target_packet(self, text_message_service: TextMessageService, mumble_instance: MagicMock, channels: list) -> None:
+            text_message_service.send("hello", channels=channels[:3], users=[{"session": 7}])
+            mumble_instance.treat_command(mumble_instance.execute_command.call_args.args[0])
+            _message_type, _message = mumble_instance.send_message.call_args.args
+            assert _message_type == PYMUMBLE_MSG_TYPES_TEXTMESSAGE
+            assert list(_message.channel_id) == [0, 1, 2]
+            assert list(_message.session) == [7]
+            mumble_instance.commands.answer.assert_called_once()
+
+        def test_other_commands_are_delegated(self) -> None:
+            _instance = MagicMock()
+            _treat_command = _instance.treat_command
+            TextMessageService(_instance)
+            _cmd = TextMessage(1, 1, "hello")
+            _instance.treat_command(_cmd)
+            _treat_command.assert_called_once_with(_cmd)
+            _instance.send_message.assert_not_called()
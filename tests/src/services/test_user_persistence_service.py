@@ -0,0 +1,81 @@
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.user_persistence_service import UserPersistenceService
+from src.utils import mumble_utils
+
+
+class TestUserPersistenceService:
+    @pytest.fixture(autouse=True)
+    def user_service(self):
+        _service = UserPersistenceService(batch_window=0.05)
+        yield _service
+        _service.stop()
+
+    @pytest.fixture(autouse=True)
+    def users(self) -> List[Dict[str, Any]]:
+        return [{"name": f"user_{idx}", "session": idx} for idx in range(10)]
+
+    class TestInit:
+        def test_init_default_batch_window(self) -> None:
+            _service = UserPersistenceService(batch_window=None)
+            assert _service.batch_window == UserPersistenceService.DEFAULT_BATCH_WINDOW
+
+        def test_init_negative_batch_window(self) -> None:
+            _service = UserPersistenceService(batch_window=-1)
+            assert _service.batch_window == UserPersistenceService.DEFAULT_BATCH_WINDOW
+
+        def test_start_twice(self, user_service: UserPersistenceService) -> None:
+            assert user_service.start() is True
+            assert user_service.start() is False
+            assert user_service.is_running is True
+
+        def test_stop_without_start(self, user_service: UserPersistenceService) -> None:
+            assert user_service.stop() is False
+
+    class TestBatching:
+        @patch.object(mumble_utils.Management.UserManagement, "add_users", new_callable=AsyncMock)
+        def test_join_events_coalesce_into_single_flush(
+            self, mock_add_users: AsyncMock, user_service: UserPersistenceService, users: List[Dict[str, Any]]
+        ) -> None:
+            for _user in users:
+                user_service.user_joined(_user)
+            user_service.start()
+            user_service.stop()
+            mock_add_users.assert_awaited_once()
+            assert [user["name"] for user in mock_add_users.await_args.args[0]] == [user["name"] for user in users]
+            assert user_service.pending_count == 0
+
+        @patch.object(mumble_utils.Management.UserManagement, "add_users", new_callable=AsyncMock)
+        def test_duplicate_join_events_are_merged(
+            self, mock_add_users: AsyncMock, user_service: UserPersistenceService, users: List[Dict[str, Any]]
+        ) -> None:
+            user_service.user_joined(users[0])
+            user_service.user_joined(users[0])
+            assert user_service.pending_count == 1
+            user_service.start()
+            user_service.stop()
+            assert len(mock_add_users.await_args.args[0]) == 1
+
+        @patch.object(mumble_utils.Management.UserManagement, "add_users", new_callable=AsyncMock)
+        def test_leave_cancels_pending_join(
+            self, mock_add_users: AsyncMock, user_service: UserPersistenceService, users: List[Dict[str, Any]]
+        ) -> None:
+            user_service.user_joined(users[0])
+            user_service.user_joined(users[1])
+            user_service.user_left(users[0])
+            user_service.start()
+            user_service.stop()
+            assert [user["name"] for user in mock_add_users.await_args.args[0]] == [users[1]["name"]]
+
+        @patch.object(mumble_utils.Management.UserManagement, "add_users", new_callable=AsyncMock)
+        def test_flush_error_does_not_stop_writer(
+            self, mock_add_users: AsyncMock, user_service: UserPersistenceService, users: List[Dict[str, Any]]
+        ) -> None:
+            mock_add_users.side_effect = Exception("database unavailable")
+            user_service.start()
+            user_service.user_joined(users[0])
+            user_service.stop()
+            mock_add_users.assert_awaited_once()
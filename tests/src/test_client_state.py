@@ -207,3 +207,84 @@ class TestClientState:
                 audio_properties._state = None
 
                 assert audio_properties.undeafen() is False
+
+    class TestServerState:
+        @pytest.fixture(autouse=True)
+        def server_state(self) -> ClientState.ServerProperties.ServerState:
+            _server_state = ClientState.ServerProperties.ServerState()
+            _users = [{"session": 1, "name": "alice", "channel_id": 0}, {"session": 2, "name": "bob", "channel_id": 1}]
+            _channels = [
+                {"channel_id": 0, "name": "Root"},
+                {"channel_id": 1, "name": "Lobby", "parent": 0},
+                {"channel_id": 2, "name": "Games", "parent": 0},
+                {"channel_id": 3, "name": "Lobby", "parent": 2},
+            ]
+            _server_state.rebuild_indexes(_users, _channels)
+            return _server_state
+
+        def test_user_indexes(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            assert server_state.is_indexed
+            assert server_state.get_user_by_name("bob")["session"] == 2
+            assert server_state.get_user_by_session(1)["name"] == "alice"
+            assert server_state.get_user_by_name("carol") is None
+
+        def test_user_rename(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            _user = server_state.get_user_by_session(2)
+            _user["name"] = "robert"
+            server_state.index_user(_user)
+            assert server_state.get_user_by_name("bob") is None
+            assert server_state.get_user_by_name("robert") is _user
+
+        def test_unindex_user(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            server_state.unindex_user({"session": 1, "name": "alice"})
+            assert server_state.get_user_by_name("alice") is None
+            assert server_state.get_user_by_session(1) is None
+
+        def test_channel_indexes(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            assert server_state.get_channel_id_by_name("Games") == 2
+            assert server_state.get_channel_id_by_name("Lobby") == 1
+            assert server_state.get_child_channel_ids(0) == [1, 2]
+            assert server_state.get_child_channel_ids(2) == [3]
+
+        def test_channel_moved_and_removed(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            server_state.index_channel({"channel_id": 3, "name": "Arcade", "parent": 1})
+            assert server_state.get_child_channel_ids(2) == []
+            assert server_state.get_child_channel_ids(1) == [3]
+            assert server_state.get_channel_id_by_name("Arcade") == 3
+            server_state.unindex_channel({"channel_id": 1, "name": "Lobby", "parent": 0})
+            assert server_state.get_channel_id_by_name("Lobby") is None
+            assert server_state.channels == {0: "Root", 2: "Games", 3: "Arcade"}
+
+        def test_remove_user_by_session(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            server_state.add_user(server_state.get_user_by_session(2))
+            assert server_state.remove_user(2)
+            assert "bob" not in server_state.users
+            assert not server_state.remove_user("bob")
+
+        def test_channel_paths(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            assert server_state.get_channel_id_by_path("Root/Games/Lobby") == 3
+            assert server_state.get_channel_id_by_path("Games/Lobby") == 3
+            assert server_state.get_channel_id_by_path("Root/Lobby") == 1
+            assert server_state.get_channel_id_by_path("Root/Music") is None
+            assert server_state.get_channel_path(3) == "Root/Games/Lobby"
+
+        def test_subtree(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            assert server_state.get_subtree_channel_ids(0) == [0, 1, 2, 3]
+            assert server_state.get_subtree_channel_ids(2) == [2, 3]
+            assert server_state.get_subtree_channel_ids(9) == []
+
+        def test_occupied_channels(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            assert server_state.get_occupied_channel_ids() == [0, 1]
+            assert server_state.get_occupied_channel_ids(exclude_sessions=[1]) == [1]
+            _user = server_state.get_user_by_session(2)
+            _user["channel_id"] = 3
+            server_state.index_user(_user)
+            assert server_state.get_occupied_channel_ids() == [0, 3]
+
+        def test_channel_list_cache(self, server_state: ClientState.ServerProperties.ServerState) -> None:
+            _channel_list = server_state.get_channel_list()
+            assert [channel["channel_id"] for channel in _channel_list] == [0, 1, 2, 3]
+            assert server_state.get_channel_list() is _channel_list
+            server_state.index_channel({"channel_id": 4, "name": "Music", "parent": 0})
+            assert server_state.get_channel_list() is not _channel_list
+            assert len(server_state.get_channel_list()) == 5
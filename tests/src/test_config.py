@@ -1,5 +1,6 @@
 import pathlib
 import re
+from copy import deepcopy
 from typing import Any, Dict
 from unittest.mock import patch
 
@@ -218,7 +219,7 @@ class TestConfig:
             with pytest.raises(ConfigWriteError, match=r"the field name does not exist.$"):
                 empty_config.save(modified_only=True, modified_field_name="test.testing123")
 
-        @patch.object(toml, "dump")
+        @patch.object(toml, "dumps")
         def test_config_save_toml_dump_failed(self, toml_return, empty_config: Config, save_config_path: str) -> None:
             toml_return.return_value = None
             empty_config._config_file_path = pathlib.Path.cwd() / save_config_path
@@ -230,6 +231,25 @@ class TestConfig:
             with pytest.raises(ConfigWriteError, match=r"^Unable to save config file at:"):
                 empty_config.save()
 
+    class TestConfigCopyWithOverrides:
+        def test_config_copy_with_overrides(self, config: Config) -> None:
+            config.read()
+            _copy: Config = config.copy_with_overrides({"test_section_1.test_1": "override"})
+            assert _copy.get("test_section_1.test_1") == "override"
+            assert _copy.file_path == config.file_path
+            assert config.get("test_section_1.test_1") != "override"
+
+        def test_config_copy_saves_do_not_change_original(self, config: Config) -> None:
+            config.read()
+            _version: int = config.version
+            _initial: Dict[str, Any] = deepcopy(dict(config._initial_config))
+            _copy: Config = config.copy_with_overrides()
+            _copy.set("test_section_1.test_1", "changed")
+            _copy.dumps(modified_only=True, modified_field_name="test_section_1.test_1")
+            assert config.get("test_section_1.test_1") != "changed"
+            assert dict(config._initial_config) == _initial
+            assert config.version == _version
+
     class TestConfigReset:
         def test_config_reset_valid_field(self, empty_config: Config) -> None:
             empty_config.update({"field": "test"})
@@ -330,3 +350,51 @@ class TestConfig:
         def test_config_get_nested_field_does_not_exist_fallback(self, empty_config: Config) -> None:
             empty_config.update({"main": {"test": "val"}})
             assert empty_config.get("main.new_test", fallback={"new_test": "val"}) == {"new_test": "val"}
+
+    class TestConfigIndex:
+        def test_config_get_section_is_read_only(self, empty_config: Config) -> None:
+            empty_config.update({"main": {"test": "value"}})
+            _section = empty_config.get("main")
+            with pytest.raises(TypeError):
+                _section["test"] = "changed"  # type: ignore
+            assert empty_config.get("main.test") == "value"
+
+        def test_config_get_list_is_read_only(self, empty_config: Config) -> None:
+            empty_config.update({"main": {"test": ["value"]}})
+            assert empty_config.get("main.test") == ("value",)
+
+        def test_config_get_copy_can_be_modified(self, empty_config: Config) -> None:
+            empty_config.update({"main": {"test": ["value"]}})
+            _section = empty_config.get("main", copy=True)
+            _section["test"].append("changed")
+            assert _section == {"test": ["value", "changed"]}
+            assert empty_config.get("main.test") == ("value",)
+
+        def test_config_index_updated_after_set(self, empty_config: Config) -> None:
+            empty_config.update({"main": {"test": "value"}})
+            assert empty_config.get("main.test") == "value"
+            assert empty_config.set("main.test", {"nested": "value"}) is True
+            assert empty_config.get("main.test.nested") == "value"
+
+        def test_config_index_updated_after_update(self, empty_config: Config) -> None:
+            empty_config.update({"main": {"test": "value"}})
+            assert empty_config.get("main.test") == "value"
+            empty_config.update({"main": {"test": "changed"}})
+            assert empty_config.get("main.test") == "changed"
+
+        def test_config_index_updated_after_delete(self, empty_config: Config) -> None:
+            empty_config.update({"main": {"test": "value"}})
+            assert empty_config.get("main.test") == "value"
+            del empty_config["main"]
+            assert empty_config.get("main.test") is None
+
+        def test_config_index_built_after_read(self, config: Config) -> None:
+            config.read()
+            assert config._index is not None
+            assert config._index["test_section_1.nested.test_1"] == (config["test_section_1"]["nested"], "test_1")
+
+        def test_config_get_field_added_to_nested_section(self, empty_config: Config) -> None:
+            empty_config.update({"main": {"test": "value"}})
+            assert empty_config.get("main.test") == "value"
+            empty_config["main"]["new_test"] = "value"
+            assert empty_config.get("main.new_test") == "value"
@@ -0,0 +1,91 @@
+import pathlib
+
+import pytest
+
+from src.config import Config
+from src.config_snapshot import ConfigSnapshot
+from src.constants import MumimoCfgFields
+from src.exceptions import ConfigValidationError
+from src.lib.server_context import ServerContext, use_server
+from src.settings import settings
+
+
+class TestConfigSnapshot:
+    @pytest.fixture(autouse=True)
+    def config(self) -> Config:
+        _config = Config(pathlib.Path.cwd() / "config/config_template.toml")
+        _config.read()
+        return _config
+
+    class TestFromConfig:
+        def test_snapshot_fields(self, config: Config) -> None:
+            _snapshot = ConfigSnapshot.from_config(config)
+            assert _snapshot.commands.token == "!"
+            assert _snapshot.commands.command_history_length == 25
+            assert _snapshot.connection.listening_channel_exclusions == ()
+            assert _snapshot.gui.paged_output is False
+            assert _snapshot.media.audio_ducking.threshold == 2500.0
+
+        def test_snapshot_missing_fields(self) -> None:
+            _snapshot = ConfigSnapshot.from_config(Config())
+            assert _snapshot.commands.token == ConfigSnapshot.Commands.DEFAULT_TOKEN
+            assert _snapshot.connection.message_rate_limit is None
+            assert _snapshot.plugins.disabled_plugins == ()
+
+        def test_snapshot_is_read_only(self, config: Config) -> None:
+            _snapshot = ConfigSnapshot.from_config(config)
+            with pytest.raises(AttributeError):
+                _snapshot.commands.token = "?"  # type: ignore
+
+        def test_snapshot_single_string_list(self, config: Config) -> None:
+            config.set(MumimoCfgFields.SETTINGS.CONNECTION.LISTENING_CHANNEL_EXCLUSIONS, "AFK")
+            assert ConfigSnapshot.from_config(config).connection.listening_channel_exclusions == ("AFK",)
+
+        @pytest.mark.parametrize(
+            "field_name, value",
+            [
+                (MumimoCfgFields.SETTINGS.COMMANDS.TOKEN, "!!"),
+                (MumimoCfgFields.SETTINGS.COMMANDS.COMMAND_HISTORY_LENGTH, "25"),
+                (MumimoCfgFields.SETTINGS.CONNECTION.MESSAGE_RATE_LIMIT, -1.0),
+                (MumimoCfgFields.SETTINGS.CONNECTION.MUTE, 1),
+                (MumimoCfgFields.SETTINGS.PLUGINS.DISABLED_PLUGINS, ["plugin", 1]),
+            ],
+        )
+        def test_snapshot_invalid_field(self, config: Config, field_name: str, value) -> None:
+            config.set(field_name, value)
+            with pytest.raises(ConfigValidationError, match=f"^Invalid config field '{field_name}'"):
+                _ = ConfigSnapshot.from_config(config)
+
+    class TestSettings:
+        @pytest.fixture(autouse=True)
+        def restore_config(self):
+            _config = settings.configs._mumimo_cfg
+            yield
+            settings.configs.set_mumimo_config(_config)  # type: ignore
+
+        def test_snapshot_is_reused(self, config: Config) -> None:
+            settings.configs.set_mumimo_config(config)
+            assert settings.configs.get_config_snapshot() is settings.configs.get_config_snapshot()
+
+        def test_snapshot_is_replaced_after_config_change(self, config: Config) -> None:
+            settings.configs.set_mumimo_config(config)
+            _snapshot = settings.configs.get_config_snapshot()
+            config.set(MumimoCfgFields.SETTINGS.COMMANDS.TOKEN, "?")
+            _new_snapshot = settings.configs.get_config_snapshot()
+            assert _new_snapshot is not _snapshot
+            assert _snapshot.commands.token == "!"
+            assert _new_snapshot.commands.token == "?"
+
+        def test_server_snapshot(self, config: Config) -> None:
+            settings.configs.set_mumimo_config(config)
+            _server = ServerContext("secondary", config_overrides={MumimoCfgFields.SETTINGS.COMMANDS.TOKEN: "?"})
+            _server.apply_config_overrides(config)
+            with use_server(_server):
+                assert settings.configs.get_config_snapshot() is _server.config_snapshot
+                assert settings.configs.get_config_snapshot().commands.token == "?"
+            assert settings.configs.get_config_snapshot().commands.token == "!"
+
+        def test_invalid_server_overrides(self, config: Config) -> None:
+            _server = ServerContext("secondary", config_overrides={MumimoCfgFields.SETTINGS.GUI.PAGED_OUTPUT: "yes"})
+            with pytest.raises(ConfigValidationError):
+                _server.apply_config_overrides(config)
@@ -35,3 +35,7 @@ class TestExceptions:
     def test_raise_config_write_error(self):
         with pytest.raises(exceptions.ConfigWriteError, match="test"):
             raise exceptions.ConfigWriteError("test", logger=None)
+
+    def test_raise_config_validation_error(self):
+        with pytest.raises(exceptions.ConfigValidationError, match="test"):
+            raise exceptions.ConfigValidationError("test", logger=None)
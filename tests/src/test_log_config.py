@@ -218,7 +218,7 @@ class TestConfig:
             with pytest.raises(ConfigWriteError, match=r"the field name does not exist.$"):
                 empty_config.save(modified_only=True, modified_field_name="test.testing123")
 
-        @patch.object(toml, "dump")
+        @patch.object(toml, "dumps")
         def test_config_save_toml_dump_failed(self, toml_return, empty_config: Config, save_config_path: str) -> None:
             toml_return.return_value = None
             empty_config._config_file_path = pathlib.Path.cwd() / save_config_path
@@ -0,0 +1,49 @@
+import asyncio
+import os
+import signal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.mumimo import MumimoService
+from src.utils import mumble_utils
+
+
+class TestMumimoService:
+    @pytest.fixture(autouse=True)
+    def mumimo_service(self) -> MumimoService:
+        # Bypass the constructor so the service does not attempt to initialize and connect.
+        return MumimoService.__new__(MumimoService)
+
+    class TestShutdown:
+        @pytest.mark.asyncio
+        @patch.object(mumble_utils.Management, "exit_server", new_callable=AsyncMock)
+        async def test_request_shutdown(self, mock_exit: AsyncMock, mumimo_service: MumimoService) -> None:
+            _waiter = asyncio.create_task(mumimo_service._wait_for_interrupt())
+            await asyncio.sleep(0)
+            mumimo_service.request_shutdown()
+            await asyncio.wait_for(_waiter, timeout=1)
+            mock_exit.assert_awaited_once()
+            assert mumimo_service._shutdown_future is None
+
+        @pytest.mark.asyncio
+        @patch.object(mumble_utils.Management, "exit_server", new_callable=AsyncMock)
+        async def test_signal_shutdown(self, mock_exit: AsyncMock, mumimo_service: MumimoService) -> None:
+            _waiter = asyncio.create_task(mumimo_service._wait_for_interrupt())
+            await asyncio.sleep(0)
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.wait_for(_waiter, timeout=1)
+            mock_exit.assert_awaited_once()
+
+        @pytest.mark.asyncio
+        @patch.object(mumble_utils.Management, "exit_server", new_callable=AsyncMock)
+        async def test_cancelled_wait_exits_server(self, mock_exit: AsyncMock, mumimo_service: MumimoService) -> None:
+            _waiter = asyncio.create_task(mumimo_service._wait_for_interrupt())
+            await asyncio.sleep(0)
+            _waiter.cancel()
+            await asyncio.wait_for(_waiter, timeout=1)
+            mock_exit.assert_awaited_once()
+
+        def test_request_shutdown_without_waiter(self, mumimo_service: MumimoService) -> None:
+            mumimo_service.request_shutdown()
+            assert mumimo_service._shutdown_future is None
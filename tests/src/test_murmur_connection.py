@@ -1,9 +1,14 @@
+import threading
+import time
 from typing import Dict, Union
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pymumble_py3 as pymumble
 import pytest
 
-from src.exceptions import ValidationError
+from src.client_state import ClientState
+from src.constants import SysArgs
+from src.exceptions import ConnectivityError, ValidationError
 from src.murmur_connection import MurmurConnection
 
 
@@ -117,3 +122,233 @@ class TestMurmurConnection:
         murmur_connection._connection_instance = mock_mumble
         murmur_connection.stop()
         assert murmur_connection._thread is None
+
+    def test_murmur_connection_loop_exits_on_stop_event(self, murmur_connection: MurmurConnection) -> None:
+        _stop_event = threading.Event()
+        _thread = threading.Thread(target=murmur_connection._loop, args=(_stop_event,))
+        _thread.start()
+        assert _thread.is_alive()
+        _stop_event.set()
+        _thread.join(timeout=1)
+        assert not _thread.is_alive()
+
+    @patch.object(MurmurConnection, "_connect_instance")
+    @patch.object(MurmurConnection, "connect")
+    @patch("pymumble_py3.Mumble")
+    def test_murmur_connection_restart_keeps_thread_alive(
+        self, mock_mumble, mock_connect, mock_instance, murmur_connection: MurmurConnection, valid_connection_params: Dict[str, Union[str, bool]]
+    ) -> None:
+        mock_instance.return_value = None
+        mock_connect.return_value = None
+        murmur_connection.setup(valid_connection_params)
+        murmur_connection.ready()
+        murmur_connection._is_connected = True
+        murmur_connection.start()
+        murmur_connection.start()
+        assert murmur_connection._thread is not None
+        assert murmur_connection._thread.is_alive()
+        murmur_connection._connection_instance = mock_mumble
+        murmur_connection.stop()
+        assert murmur_connection._thread is None
+
+    class TestReconnect:
+        def test_backoff_delay_is_jittered_and_capped(self) -> None:
+            for _attempt in range(10):
+                _delay = MurmurConnection._get_backoff_delay(_attempt, 1.0, 8.0)
+                _expected = min(8.0, 2**_attempt)
+                assert _expected / 2 <= _delay <= _expected
+
+        def test_backoff_delay_after_many_attempts(self) -> None:
+            _delay = MurmurConnection._get_backoff_delay(5000, 1.0, 60.0)
+            assert 30.0 <= _delay <= 60.0
+
+        def test_disconnect_without_auto_reconnect(
+            self, murmur_connection: MurmurConnection, valid_connection_params: Dict[str, Union[str, bool]]
+        ) -> None:
+            murmur_connection._connection_params = {**valid_connection_params, SysArgs.SYS_RECONNECT: False}
+            murmur_connection._is_connected = True
+            murmur_connection._thread_stop_event.clear()
+            murmur_connection._on_disconnected()
+            assert murmur_connection.is_connected is False
+            assert murmur_connection._reconnect_thread is None or not murmur_connection._reconnect_thread.is_alive()
+
+        @patch.object(MurmurConnection, "_reconnect")
+        def test_disconnect_ignored_while_stopping(
+            self, mock_reconnect, murmur_connection: MurmurConnection, valid_connection_params: Dict[str, Union[str, bool]]
+        ) -> None:
+            murmur_connection._connection_params = {**valid_connection_params, SysArgs.SYS_RECONNECT: True}
+            murmur_connection._is_connected = True
+            murmur_connection._thread_stop_event.set()
+            murmur_connection._on_disconnected()
+            mock_reconnect.assert_not_called()
+            murmur_connection._thread_stop_event.clear()
+
+        @patch.object(MurmurConnection, "_get_backoff_delay", return_value=0)
+        @patch.object(MurmurConnection, "_resync_state")
+        @patch.object(MurmurConnection, "_connect_instance")
+        @patch.object(MurmurConnection, "ready")
+        def test_reconnect_retries_until_connected(
+            self, mock_ready, mock_connect_instance, mock_resync, mock_delay, murmur_connection: MurmurConnection
+        ) -> None:
+            mock_connect_instance.side_effect = [ConnectivityError("unreachable"), None]
+            _reconnect_count = murmur_connection.reconnect_metrics["reconnect_count"]
+            assert murmur_connection._reconnect(threading.Event()) is True
+            mock_resync.assert_called_once()
+            assert murmur_connection.reconnect_metrics["reconnect_count"] == _reconnect_count + 1
+            assert murmur_connection.reconnect_metrics["last_attempts"] == 2
+
+        @patch.object(MurmurConnection, "_get_backoff_delay", return_value=0)
+        @patch.object(MurmurConnection, "_resync_state")
+        @patch.object(MurmurConnection, "_get_text_message_service")
+        @patch.object(MurmurConnection, "_get_loop_rate_service")
+        def test_reconnected_instance_outlives_reconnect_thread(
+            self,
+            mock_loop_rate,
+            mock_text_message,
+            mock_resync,
+            mock_delay,
+            murmur_connection: MurmurConnection,
+            valid_connection_params: Dict[str, Union[str, bool]],
+        ) -> None:
+            _exit_event = threading.Event()
+
+            def _run(instance) -> None:
+                # Mirrors the pymumble loop, which exits once its parent thread is gone.
+                while instance.parent_thread.is_alive() and not _exit_event.is_set():
+                    time.sleep(0.01)
+
+            def _connect_instance() -> None:
+                murmur_connection._connection_instance.start()
+                murmur_connection._is_connected = True
+
+            murmur_connection.setup(valid_connection_params)
+            murmur_connection._thread_stop_event.clear()
+            murmur_connection._thread = threading.Thread(target=murmur_connection._loop, args=(murmur_connection._thread_stop_event,))
+            murmur_connection._thread.start()
+            with patch.object(pymumble.Mumble, "run", _run), patch.object(MurmurConnection, "_connect_instance", side_effect=_connect_instance):
+                _reconnect_thread = threading.Thread(target=murmur_connection._reconnect, args=(threading.Event(),))
+                _reconnect_thread.start()
+                _reconnect_thread.join()
+                _instance = murmur_connection._connection_instance
+                try:
+                    time.sleep(0.05)
+                    assert _instance.parent_thread is murmur_connection._thread
+                    assert _instance.is_alive()
+                finally:
+                    _exit_event.set()
+                    _instance.join()
+
+        @patch.object(MurmurConnection, "_get_backoff_delay", return_value=60)
+        @patch.object(MurmurConnection, "ready")
+        def test_stop_joins_reconnect_thread(self, mock_ready, mock_delay, murmur_connection: MurmurConnection) -> None:
+            murmur_connection._connection_instance = MagicMock()
+            murmur_connection._thread_stop_event.clear()
+            _reconnect_thread = threading.Thread(target=murmur_connection._reconnect, args=(murmur_connection._thread_stop_event,))
+            murmur_connection._reconnect_thread = _reconnect_thread
+            _reconnect_thread.start()
+            assert murmur_connection.stop() is True
+            assert not _reconnect_thread.is_alive()
+            assert murmur_connection._reconnect_thread is None
+            mock_ready.assert_not_called()
+            murmur_connection._thread_stop_event.clear()
+
+        @patch.object(MurmurConnection, "_get_backoff_delay", return_value=0)
+        @patch.object(MurmurConnection, "_resync_state")
+        @patch.object(MurmurConnection, "_connect_instance")
+        @patch.object(MurmurConnection, "ready")
+        def test_reconnect_closes_connection_made_after_stop(
+            self, mock_ready, mock_connect_instance, mock_resync, mock_delay, murmur_connection: MurmurConnection
+        ) -> None:
+            _stop_event = threading.Event()
+            _instance = MagicMock()
+            murmur_connection._connection_instance = _instance
+            mock_connect_instance.side_effect = lambda: _stop_event.set()
+            assert murmur_connection._reconnect(_stop_event) is False
+            _instance.stop.assert_called_once()
+            assert murmur_connection._connection_instance is None
+            mock_resync.assert_not_called()
+
+        def test_reconnect_stops_on_stop_event(self, murmur_connection: MurmurConnection) -> None:
+            _stop_event = threading.Event()
+            _stop_event.set()
+            assert murmur_connection._reconnect(_stop_event) is False
+
+        @patch("src.settings.MumimoSettings.Database.get_user_persistence_service")
+        @patch("src.settings.MumimoSettings.State.get_client_state")
+        @patch.object(MurmurConnection, "_configure_client")
+        @patch.object(MurmurConnection, "_register_callbacks")
+        def test_resync_state_applies_only_changes(
+            self, mock_register, mock_configure, mock_client_state, mock_user_service, murmur_connection: MurmurConnection
+        ) -> None:
+            _client_state = ClientState(MagicMock())
+            _server_state = _client_state.server_properties.state
+            _server_state.add_user({"name": "stayed", "session": 1})
+            _server_state.add_user({"name": "left", "session": 2})
+            mock_client_state.return_value = _client_state
+            _user_service = MagicMock(is_running=True)
+            mock_user_service.return_value = _user_service
+            _instance = MagicMock()
+            _instance.users.myself_session = 0
+            _instance.users.values.return_value = [
+                {"name": "Mumimo", "session": 0},
+                {"name": "stayed", "session": 11},
+                {"name": "joined", "session": 12},
+            ]
+            murmur_connection._connection_instance = _instance
+            murmur_connection._resync_state()
+            assert set(_server_state.users.keys()) == {"stayed"}
+            assert _server_state.users["stayed"]["session"] == 11
+            _user_service.user_joined.assert_called_once_with({"name": "joined", "session": 12})
+
+    class TestListeningChannels:
+        @pytest.fixture(autouse=True)
+        def client_state(self, murmur_connection: MurmurConnection):
+            _client_state = ClientState(MagicMock())
+            _client_state.server_properties.state.rebuild_indexes(
+                [],
+                [
+                    {"channel_id": 0, "name": "Root"},
+                    {"channel_id": 1, "name": "Lobby", "parent": 0},
+                    {"channel_id": 2, "name": "AFK", "parent": 0},
+                    {"channel_id": 3, "name": "Sleeping", "parent": 2},
+                ],
+            )
+            _user = MagicMock()
+            _user.__getitem__.side_effect = lambda key: {"session": 7}[key]
+            murmur_connection._connection_instance = MagicMock()
+            murmur_connection._connection_instance.users.myself = _user
+            murmur_connection._listening_session = None
+            murmur_connection._is_connected = True
+            with patch("src.settings.MumimoSettings.State.get_client_state", return_value=_client_state):
+                yield _client_state
+            murmur_connection._listening_session = None
+            murmur_connection._listening_channels = set()
+
+        @patch.object(MurmurConnection, "_get_listening_exclusions", return_value=["Root/AFK*"])
+        def test_new_session_sends_filtered_set_once(self, mock_exclusions, murmur_connection: MurmurConnection, client_state: ClientState) -> None:
+            murmur_connection._sync_listening_channels(client_state)
+            _user = murmur_connection._connection_instance.users.myself
+            _user.add_listening_channels.assert_called_once_with([0, 1])
+            assert murmur_connection.listening_channels == {0, 1}
+            murmur_connection._sync_listening_channels(client_state)
+            _user.add_listening_channels.assert_called_once()
+            _user.remove_listening_channels.assert_not_called()
+
+        @patch.object(MurmurConnection, "_get_listening_exclusions", return_value=["Games"])
+        def test_channel_changes_are_applied_incrementally(
+            self, mock_exclusions, murmur_connection: MurmurConnection, client_state: ClientState
+        ) -> None:
+            murmur_connection._sync_listening_channels(client_state)
+            _user = murmur_connection._connection_instance.users.myself
+            _user.reset_mock()
+            _server_properties = client_state.server_properties
+            _music = {"channel_id": 4, "name": "Music", "parent": 1}
+            _server_properties.on_channel_created(_music)
+            murmur_connection._on_listening_channel_created(_music)
+            _user.add_listening_channels.assert_called_once_with([4])
+            _music["name"] = "Games"
+            _server_properties.on_channel_updated(_music, {"name": "Games"})
+            murmur_connection._on_listening_channel_updated(_music, {"name": "Games"})
+            _user.remove_listening_channels.assert_called_once_with([4])
+            murmur_connection._on_listening_channel_removed({"channel_id": 3})
+            assert murmur_connection.listening_channels == {0, 1, 2}